@@ -12,6 +12,7 @@ import {
   Filler,
 } from 'chart.js';
 import Button from '../components/Button';
+import { fetchAllPages } from '../utils/Pagination';
 import '../styles/pages/AdminDashboard.css';
 
 ChartJS.register(LineElement, CategoryScale, LinearScale, PointElement, Tooltip, Legend, Filler);
@@ -23,22 +24,44 @@ const AdminDashboard = () => {
   const [users, setUsers] = useState([]);
   const [searchUserId, setSearchUserId] = useState('');
   const [searchKeyword, setSearchKeyword] = useState('');
+  const [searchResults, setSearchResults] = useState([]);
   const [evaluations, setEvaluations] = useState([]);
   const [userInfo, setUserInfo] = useState(null);
   const [alerts, setAlerts] = useState([]);
   const token = localStorage.getItem('token');
 
   const fetchUsers = async () => {
-    const res = await fetch(`${API}/users`, {
-      headers: { Authorization: `Bearer ${token}` },
-    });
-    if (res.ok) {
-      const allUsers = await res.json();
-      const studentsOnly = allUsers.filter((user) => user.role === 'student');
+    try {
+      const studentsOnly = await fetchAllPages(`${API}/users/role/student`, {
+        headers: { Authorization: `Bearer ${token}` },
+      });
       setUsers(studentsOnly);
+    } catch (err) {
+      console.error('Error fetching users:', err);
+    }
+  };
+
+  // Server-side, indexed search; the full list is only shown when the box is empty
+  const searchStudents = async (keyword) => {
+    if (!keyword) return;
+    try {
+      const res = await fetch(
+        `${API}/users/search?role=student&limit=50&q=${encodeURIComponent(keyword)}`,
+        { headers: { Authorization: `Bearer ${token}` } }
+      );
+      if (!res.ok) throw new Error('Search failed');
+      const data = await res.json();
+      setSearchResults(data.results);
+    } catch (err) {
+      console.error('Error searching users:', err);
     }
   };
 
+  const refreshUsers = () => {
+    fetchUsers();
+    searchStudents(searchKeyword.trim());
+  };
+
   const fetchUserEvals = async () => {
     if (!searchUserId) return;
     try {
@@ -46,9 +69,9 @@ const AdminDashboard = () => {
         (await fetch(`${API}/users/username/${searchUserId}`, {
           headers: { Authorization: `Bearer ${token}` },
         })).json(),
-        (await fetch(`${API}/evaluations/username/${searchUserId}`, {
+        fetchAllPages(`${API}/evaluations/username/${searchUserId}`, {
           headers: { Authorization: `Bearer ${token}` },
-        })).json(),
+        }),
       ]);
 
       if (ui.role !== 'student') {
@@ -64,11 +87,10 @@ const AdminDashboard = () => {
   };
 
   const fetchAlerts = async () => {
-    const ev = await fetch(`${API}/evaluations`, {
+    const ev = await fetch(`${API}/evaluations/alerts`, {
       headers: { Authorization: `Bearer ${token}` },
     });
-    const all = await ev.json();
-    setAlerts(all.filter((e) => e.needs_support && !e.handled_by_admin_id));
+    if (ev.ok) setAlerts(await ev.json());
   };
 
   const handleLogout = async () => {
@@ -102,7 +124,7 @@ const AdminDashboard = () => {
       });
 
       if (res.ok) {
-        fetchUsers();
+        refreshUsers();
       } else {
         console.error('Failed to update status.');
       }
@@ -121,7 +143,7 @@ const AdminDashboard = () => {
       });
 
       if (res.ok) {
-        fetchUsers();
+        refreshUsers();
       } else {
         console.error('Failed to delete user.');
       }
@@ -135,6 +157,16 @@ const AdminDashboard = () => {
     fetchAlerts();
   }, []);
 
+  useEffect(() => {
+    const keyword = searchKeyword.trim();
+    if (!keyword) {
+      setSearchResults([]);
+      return undefined;
+    }
+    const timer = setTimeout(() => searchStudents(keyword), 200);
+    return () => clearTimeout(timer);
+  }, [searchKeyword]);
+
   const chartData = {
     labels: evaluations.map((e) =>
       new Date(e.submitted_at).toLocaleDateString()
@@ -207,19 +239,12 @@ const AdminDashboard = () => {
             type="text"
             placeholder="Search students by username or email"
             value={searchKeyword}
-            onChange={(e) => setSearchKeyword(e.target.value.toLowerCase())}
+            onChange={(e) => setSearchKeyword(e.target.value)}
             className="search-input"
           />
 
           <ul className="user-list">
-            {users
-              .filter((u) => {
-                if (!searchKeyword) return true;
-                return (
-                  u.username.toLowerCase().includes(searchKeyword) ||
-                  u.email.toLowerCase().includes(searchKeyword)
-                );
-              })
+            {(searchKeyword.trim() ? searchResults : users)
               .map((u) => (
                 <li key={u.id} className="user-item">
                   <div>
@@ -15,20 +15,31 @@ const Alert = () => {
 
   const token = localStorage.getItem("token");
 
-  useEffect(() => {
-    const fetchAlerts = async () => {
-      try {
-        const res = await fetch("http://127.0.0.1:5000/api/evaluations", {
-          headers: { Authorization: `Bearer ${token}` },
-        });
+  // The alert queue is cursor-paginated; X-Total-Count carries the full queue size
+  const [nextCursor, setNextCursor] = useState(null);
+  const [totalCount, setTotalCount] = useState(0);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const fetchAlertsPage = async (cursor = null) => {
+    const url = cursor
+      ? `http://127.0.0.1:5000/api/evaluations/alerts?cursor=${encodeURIComponent(cursor)}`
+      : "http://127.0.0.1:5000/api/evaluations/alerts";
+    const res = await fetch(url, {
+      headers: { Authorization: `Bearer ${token}` },
+    });
 
-        if (!res.ok) throw new Error("Failed to fetch evaluations.");
-        const allEvaluations = await res.json();
+    if (!res.ok) throw new Error("Failed to fetch alerts.");
+    const page = await res.json();
 
-        const unhandledAlerts = allEvaluations.filter(
-          (e) => e.needs_support && !e.handled_by
-        );
+    setNextCursor(res.headers.get("X-Next-Cursor"));
+    setTotalCount(Number(res.headers.get("X-Total-Count")) || 0);
+    return page;
+  };
 
+  useEffect(() => {
+    const fetchAlerts = async () => {
+      try {
+        const unhandledAlerts = await fetchAlertsPage();
         setAlerts(unhandledAlerts);
       } catch (err) {
         console.error(err);
@@ -41,6 +52,22 @@ const Alert = () => {
     if (token) fetchAlerts();
   }, [token]);
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const more = await fetchAlertsPage(nextCursor);
+      setAlerts((prev) => {
+        const seen = new Set(prev.map((e) => e.id));
+        return [...prev, ...more.filter((e) => !seen.has(e.id))];
+      });
+    } catch (err) {
+      console.error(err);
+      alert("Failed to load more alerts.");
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleMeetingChange = (e) => {
     setMeetingData({ ...meetingData, [e.target.name]: e.target.value });
   };
@@ -128,6 +155,7 @@ const Alert = () => {
       }
 
       setAlerts((prev) => prev.filter((e) => e.id !== evaluationId));
+      setTotalCount((count) => Math.max(count - 1, 0));
       alert(result.message || "Alert successfully handled.");
     } catch (err) {
       console.error("Error handling evaluation:", err);
@@ -246,6 +274,20 @@ const Alert = () => {
                   ))}
                 </tbody>
               </table>
+              <div className="alert-paging">
+                <span>
+                  Showing {alerts.length} of {Math.max(totalCount, alerts.length)} alerts
+                </span>
+                {nextCursor && (
+                  <Button
+                    className="bg-blue-500 text-white"
+                    onClick={handleLoadMore}
+                    disabled={loadingMore}
+                  >
+                    {loadingMore ? "Loading..." : "Load more"}
+                  </Button>
+                )}
+              </div>
             </div>
           )}
         </div>
@@ -21,6 +21,7 @@ const StudentDashboard = () => {
   const { currentUser, logout } = useAuth();
   const navigate = useNavigate();
   const [assessments, setAssessments] = useState([]);
+  const [trend, setTrend] = useState(null);
   const [notifications, setNotifications] = useState([]);
   const [loading, setLoading] = useState(true);
   const [notifLoading, setNotifLoading] = useState(true);
@@ -30,15 +31,16 @@ const StudentDashboard = () => {
     const fetchAssessments = async () => {
       try {
         const token = localStorage.getItem('token');
-        const res = await fetch('http://127.0.0.1:5000/api/my-evaluations', {
-          headers: {
-            Authorization: `Bearer ${token}`,
-          },
-        });
-
-        if (!res.ok) throw new Error('Failed to fetch assessments');
-        const data = await res.json();
+        const headers = { Authorization: `Bearer ${token}` };
+        // The list shows the latest results; the chart uses server-side weekly buckets
+        const [listRes, trendRes] = await Promise.all([
+          fetch('http://127.0.0.1:5000/api/my-evaluations?limit=20', { headers }),
+          fetch('http://127.0.0.1:5000/api/my-trend?bucket=week', { headers }),
+        ]);
+        if (!listRes.ok || !trendRes.ok) throw new Error('Failed to fetch assessments');
+        const data = await listRes.json();
         setAssessments(Array.isArray(data) ? data : []);
+        setTrend(await trendRes.json());
       } catch (err) {
         console.error('[ERROR] Fetching assessments:', err);
         setError(err.message || 'Unexpected error');
@@ -68,6 +70,52 @@ const StudentDashboard = () => {
 
     fetchAssessments();
     fetchNotifications();
+
+    // Refresh notifications only when the server says something changed. EventSource
+    // cannot send headers, so each connection opens with a short-lived, single-use
+    // ticket rather than the access token in the URL.
+    const token = localStorage.getItem('token');
+    let source = null;
+    let retryTimer = null;
+    let closed = false;
+
+    const openStream = async () => {
+      try {
+        const res = await fetch('http://127.0.0.1:5000/api/notifications/stream-ticket', {
+          method: 'POST',
+          headers: { Authorization: `Bearer ${token}` },
+        });
+        if (!res.ok) throw new Error('Failed to get a stream ticket');
+        const { ticket } = await res.json();
+        if (closed) return;
+
+        source = new EventSource(
+          `http://127.0.0.1:5000/api/notifications/stream?ticket=${encodeURIComponent(ticket)}`
+        );
+        ['meeting', 'handled'].forEach((type) => source.addEventListener(type, fetchNotifications));
+        // Admin messages are not stored, so show them as they arrive
+        source.addEventListener('message', (e) => {
+          const { message, created_at } = JSON.parse(e.data);
+          setNotifications((prev) => [{ type: 'message', message, created_at }, ...prev]);
+        });
+        // A used ticket cannot reconnect, so reopen with a fresh one
+        source.onerror = () => {
+          source.close();
+          if (!closed) retryTimer = setTimeout(openStream, 5000);
+        };
+      } catch (err) {
+        console.error('[ERROR] Opening notification stream:', err);
+        if (!closed) retryTimer = setTimeout(openStream, 5000);
+      }
+    };
+
+    openStream();
+
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      if (source) source.close();
+    };
   }, []);
 
   const handleLogout = async () => {
@@ -97,13 +145,11 @@ const StudentDashboard = () => {
   );
 
   const chartData = {
-    labels: validAssessments.map((a) =>
-      new Date(a.submitted_at).toLocaleDateString()
-    ),
+    labels: (trend?.start || []).map((start) => new Date(start).toLocaleDateString()),
     datasets: [
       {
-        label: 'Burnout Score',
-        data: validAssessments.map((a) => a.total_score),
+        label: 'Weekly Average Burnout Score',
+        data: trend?.avg || [],
         borderColor: 'rgba(0,0,0,1)',
         backgroundColor: 'rgba(55,55,55,0.4)',
         tension: 0.4,
@@ -212,7 +258,7 @@ const StudentDashboard = () => {
           <div className="chart-wrapper">
             {loading ? (
               <p>Loading chart...</p>
-            ) : validAssessments.length > 0 ? (
+            ) : trend?.start.length > 0 ? (
               <Line data={chartData} options={chartOptions} />
             ) : (
               <p>No assessment data to display.</p>
@@ -0,0 +1,17 @@
+// Follows the X-Next-Cursor header of a paginated list endpoint and returns every item.
+export const fetchAllPages = async (url, options = {}) => {
+  const items = [];
+  let cursor = null;
+
+  do {
+    const separator = url.includes('?') ? '&' : '?';
+    const pageUrl = cursor ? `${url}${separator}cursor=${encodeURIComponent(cursor)}` : url;
+    const res = await fetch(pageUrl, options);
+    if (!res.ok) throw new Error(`Request failed with status ${res.status}`);
+
+    items.push(...(await res.json()));
+    cursor = res.headers.get('X-Next-Cursor');
+  } while (cursor);
+
+  return items;
+};
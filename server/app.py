@@ -16,7 +16,10 @@ migrate = Migrate()
 jwt = JWTManager()
 api = Api()
 
+from utils.json_provider import FastJSONProvider
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 
 # App Configuration 
 app.config['SQLALCHEMY_DATABASE_URI'] = os.getenv("SQLALCHEMY_DATABASE_URI")
@@ -25,34 +28,135 @@ app.config['JWT_SECRET_KEY'] = os.getenv("JWT_SECRET_KEY")
 app.config['SECRET_KEY'] = os.getenv("SECRET_KEY")
 app.config['JWT_ACCESS_TOKEN_EXPIRES'] = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRES"))
 app.config['CORS_HEADERS'] = 'Content-Type'
+app.config['SQL_QUERY_COUNT_HEADER'] = os.getenv("SQL_QUERY_COUNT_HEADER", "false").lower() == "true"
+app.config['SQL_QUERY_BUDGET_STRICT'] = os.getenv("SQL_QUERY_BUDGET_STRICT", "false").lower() == "true"
+app.config['JWT_BLOCKLIST_REFRESH'] = int(os.getenv("JWT_BLOCKLIST_REFRESH", 30))
+app.config['STREAM_TICKET_TTL'] = int(os.getenv("STREAM_TICKET_TTL", 30))  # seconds a notification-stream ticket stays valid
+app.config['COMPRESS_ENABLED'] = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+app.config['COMPRESS_MIN_SIZE'] = int(os.getenv("COMPRESS_MIN_SIZE", 1024))
+app.config['COMPRESS_LEVEL'] = int(os.getenv("COMPRESS_LEVEL", 6))
+app.config['PASSWORD_HASH_METHOD'] = os.getenv("PASSWORD_HASH_METHOD", "scrypt:32768:8:1")
+app.config['PASSWORD_HASH_WORKERS'] = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+app.config['PASSWORD_HASH_MAX_PENDING'] = int(os.getenv("PASSWORD_HASH_MAX_PENDING", 64))
+app.config['USER_CACHE_SIZE'] = int(os.getenv("USER_CACHE_SIZE", 4096))
+app.config['USER_CACHE_TTL'] = int(os.getenv("USER_CACHE_TTL", 60))
+app.config['METRICS_ENABLED'] = os.getenv("METRICS_ENABLED", "false").lower() == "true"
+app.config['METRICS_TOKEN'] = os.getenv("METRICS_TOKEN")  # optional bearer token for /metrics
+app.config['PROFILE_ENABLED'] = os.getenv("PROFILE_ENABLED", "false").lower() == "true"
+app.config['PROFILE_DIR'] = os.getenv("PROFILE_DIR")  # default: instance/profiles
+app.config['PROFILE_SAMPLE_RATE'] = float(os.getenv("PROFILE_SAMPLE_RATE", 0))
+app.config['PROFILE_USERS'] = [u.strip() for u in os.getenv("PROFILE_USERS", "").split(",") if u.strip()]
+app.config['SLOW_QUERY_MS'] = float(os.getenv("SLOW_QUERY_MS", 0))  # 0 disables the slow-query log
+app.config['SLOW_QUERY_LOG'] = os.getenv("SLOW_QUERY_LOG")  # default: instance/slow_queries.log
+# Run queued jobs on threads inside the web process; `flask worker` can take the 'default' queue instead
+app.config['JOBS_EMBEDDED_WORKER'] = os.getenv("JOBS_EMBEDDED_WORKER", "true").lower() == "true"
+app.config['JOBS_EMBEDDED_QUEUES'] = [q.strip() for q in os.getenv("JOBS_EMBEDDED_QUEUES", "events,default").split(",") if q.strip()]
+app.config['JOBS_EMBEDDED_CONCURRENCY'] = int(os.getenv("JOBS_EMBEDDED_CONCURRENCY", 2))
+app.config['JOBS_POLL_INTERVAL'] = float(os.getenv("JOBS_POLL_INTERVAL", 1.0))
+# sqlite-default, sqlite-wal or server; empty picks sqlite-wal for SQLite URIs, server otherwise
+app.config['DB_ENGINE_PROFILE'] = os.getenv("DB_ENGINE_PROFILE", "")
+
+# ==================== Database Engine Profile ====================
+from db.engine_profiles import configure_engine_profile, init_engine_profile
+
+configure_engine_profile(app)
 
 # Initialize Extensions 
 db.init_app(app)
+init_engine_profile(app, db)
 migrate.init_app(app, db, directory="db/migrations")
 
 jwt.init_app(app)
 api.init_app(app)
-CORS(app, resources={r"/api/*": {"origins": "http://localhost:5173"}}, supports_credentials=True)
+CORS(
+    app,
+    resources={r"/api/*": {"origins": "http://localhost:5173"}},
+    supports_credentials=True,
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "X-Query-Count", "ETag", "X-Profile-File"]
+)
 
 # ==================== Register Routes ====================
 from models import * 
 from routes import all_routes
 
 # ==================== JWT Token Blocklist ====================
-from models.TokenBlocklist import TokenBlocklist
+from utils.jwt_blocklist import revoked_tokens
+
+revoked_tokens.refresh_interval = app.config['JWT_BLOCKLIST_REFRESH']
+revoked_tokens.default_ttl = app.config['JWT_ACCESS_TOKEN_EXPIRES']
 
 @jwt.token_in_blocklist_loader
 def check_if_token_revoked(jwt_header, jwt_payload):
     jti = jwt_payload.get("jti")
-    return db.session.query(TokenBlocklist.id).filter_by(jti=jti).first() is not None
+    return revoked_tokens.is_revoked(jti)
 
 @jwt.revoked_token_loader
 def revoked_token_callback(jwt_header, jwt_payload):
     return jsonify({"error": "Token has been revoked. Please log in again."}), 401
 
+# ==================== Pagination Errors ====================
+from utils.pagination import PaginationError
+
+@app.errorhandler(PaginationError)
+def pagination_error_callback(error):
+    return jsonify({"error": str(error)}), 400
+
+# ==================== User Role Cache ====================
+from utils.user_cache import user_role_cache
+
+user_role_cache.configure(maxsize=app.config['USER_CACHE_SIZE'], ttl=app.config['USER_CACHE_TTL'])
+
+# ==================== Password Hashing ====================
+from utils.password_hashing import HashingBusy, password_hasher
+
+password_hasher.configure(
+    method=app.config['PASSWORD_HASH_METHOD'],
+    workers=app.config['PASSWORD_HASH_WORKERS'],
+    max_pending=app.config['PASSWORD_HASH_MAX_PENDING']
+)
+
+@app.errorhandler(HashingBusy)
+def hashing_busy_callback(error):
+    response = jsonify({"error": str(error)})
+    response.headers['Retry-After'] = '1'
+    return response, 503
+
+# ==================== Query Counting ====================
+from utils.query_counter import init_query_counter
+
+init_query_counter(app)
+
+# ==================== Request Metrics ====================
+from utils.metrics import init_metrics
+
+init_metrics(app)
+
+# ==================== Profiling & Slow Queries ====================
+from utils.profiling import init_request_profiling, init_slow_query_log
+
+init_request_profiling(app)
+with app.app_context():
+    init_slow_query_log(app, db.engine)
+
+# ==================== Background Jobs ====================
+from utils.jobs import init_jobs
+
+init_jobs(app)
+
+# ==================== Response Compression ====================
+from utils.compression import init_compression
+
+init_compression(app)
+
 for bp in all_routes:
     app.register_blueprint(bp, url_prefix='/api')
 
+# ==================== CLI Commands ====================
+from commands import all_commands
+
+for command in all_commands:
+    app.cli.add_command(command)
+
 # ==================== Run the App ====================
 if __name__ == "__main__":
     app.run(port=5555, debug=True)
@@ -0,0 +1,136 @@
+"""Concurrent read/write throughput of the SQLite engine profiles.
+
+Run from the server directory:
+
+    python -m benchmarks.bench_engine_profiles [--seconds 5 --readers 8 --writers 2]
+
+For each SQLite profile, creates a scratch database file with the evaluations
+schema, then runs writer threads (one evaluation insert per transaction) and
+reader threads (a student's latest evaluations, as /my-evaluations does)
+side by side, printing operations per second and lock errors for each.
+"""
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from datetime import datetime
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.exc import OperationalError
+from db.Burnout_Tracker import db
+from db.engine_profiles import ENGINE_PROFILES, install_pragmas
+from models.Evaluation import Evaluation
+from models.User import User
+
+STUDENTS = 200
+
+
+def build_engine(path, profile, threads):
+    # Every thread holds its own connection for the whole run
+    engine = create_engine(f"sqlite:///{path}", pool_size=threads, max_overflow=0)
+    install_pragmas(engine, ENGINE_PROFILES[profile]['pragmas'])
+    db.metadata.create_all(engine, tables=[User.__table__, Evaluation.__table__])
+    with engine.begin() as connection:
+        connection.execute(insert(User.__table__), [
+            {"id": i, "username": f"student{i}", "email": f"student{i}@campus.edu",
+             "password_hash": "-", "role": "student"}
+            for i in range(1, STUDENTS + 1)
+        ])
+    return engine
+
+
+def evaluation_row(rng):
+    answers = {field: rng.randint(Evaluation.ANSWER_MIN, Evaluation.ANSWER_MAX) for field in Evaluation.QUESTION_FIELDS}
+    total = sum(answers.values())
+    answers.update(
+        user_id=rng.randint(1, STUDENTS),
+        submitted_at=datetime.utcnow(),
+        total_score=total,
+        needs_support=total >= Evaluation.SUPPORT_THRESHOLD,
+    )
+    return answers
+
+
+def writer(engine, stop, counts, seed):
+    rng = random.Random(seed)
+    statement = insert(Evaluation.__table__)
+    with engine.connect() as connection:
+        while not stop.is_set():
+            try:
+                with connection.begin():
+                    connection.execute(statement, evaluation_row(rng))
+                counts['writes'] += 1
+            except OperationalError:
+                counts['errors'] += 1
+
+
+def reader(engine, stop, counts, seed):
+    rng = random.Random(seed)
+    table = Evaluation.__table__
+    with engine.connect() as connection:
+        while not stop.is_set():
+            statement = (
+                select(table.c.id, table.c.total_score, table.c.submitted_at)
+                .where(table.c.user_id == rng.randint(1, STUDENTS))
+                .order_by(table.c.submitted_at.desc())
+                .limit(20)
+            )
+            try:
+                with connection.begin():
+                    connection.execute(statement).all()
+                counts['reads'] += 1
+            except OperationalError:
+                counts['errors'] += 1
+
+
+def run_profile(profile, args):
+    directory = tempfile.mkdtemp(prefix='bench-engine-')
+    path = os.path.join(directory, 'bench.db')
+    engine = build_engine(path, profile, args.readers + args.writers)
+
+    stop = threading.Event()
+    # One dict per thread so the hot loop never contends on a shared counter
+    per_thread = []
+    threads = []
+    for target, n in ((writer, args.writers), (reader, args.readers)):
+        for _ in range(n):
+            counts = {'reads': 0, 'writes': 0, 'errors': 0}
+            per_thread.append(counts)
+            threads.append(threading.Thread(target=target, args=(engine, stop, counts, len(threads))))
+
+    for thread in threads:
+        thread.start()
+    time.sleep(args.seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    totals = {key: sum(c[key] for c in per_thread) for key in ('reads', 'writes', 'errors')}
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--seconds', type=float, default=5)
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=2)
+    parser.add_argument('--profile', action='append', choices=[p for p in ENGINE_PROFILES if p.startswith('sqlite')],
+                        help='Profile to run (repeatable); defaults to every SQLite profile.')
+    args = parser.parse_args()
+    profiles = args.profile or [p for p in ENGINE_PROFILES if p.startswith('sqlite')]
+
+    print(f"{args.writers} writers, {args.readers} readers, {args.seconds:g} s per profile")
+    print(f"{'profile':<18}{'writes/s':>12}{'reads/s':>12}{'lock errors':>14}")
+    for profile in profiles:
+        totals = run_profile(profile, args)
+        print(f"{profile:<18}{totals['writes'] / args.seconds:>12,.0f}"
+              f"{totals['reads'] / args.seconds:>12,.0f}{totals['errors']:>14,}")
+
+
+if __name__ == '__main__':
+    main()
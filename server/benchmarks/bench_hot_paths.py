@@ -0,0 +1,164 @@
+"""Micro-benchmarks for serialization, scoring, validation and auth hot paths.
+
+Run from the server directory (no network or database server needed; the
+auth cases use an in-memory SQLite database):
+
+    python -m benchmarks.bench_hot_paths [--save results.json]
+    python -m benchmarks.bench_hot_paths --compare results.json [--threshold 0.1]
+    python -m benchmarks.bench_hot_paths -k to_dict -k blocklist
+
+With --compare the exit status is 1 when any benchmark's --stat (median by
+default) is more than --threshold slower than the saved baseline.
+"""
+import argparse
+import sys
+import uuid
+from datetime import datetime, timedelta
+import numpy as np
+from flask import Flask
+from flask_jwt_extended import JWTManager, create_access_token, jwt_required
+from benchmarks.bench_json import build_evaluations
+from benchmarks.runner import COMPARE_STATS, Suite, compare_results, load_results, run_suite, save_results
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.ScoringRule import ScoringRule
+from models.TokenBlocklist import TokenBlocklist
+from models.User import User
+from utils.auth_utils import role_required
+from utils.jwt_blocklist import RevokedTokenStore
+from utils.scoring import score_answers
+from utils.user_cache import user_role_cache
+from utils.validators import is_strong_password, validate_user_data
+
+LIST_SIZE = 1000
+REVOKED_TOKENS = 10000
+
+
+def build_users(count):
+    created = datetime(2025, 1, 6, 9, 0, 0)
+    return [
+        User(id=i, username=f"student{i}", email=f"student{i}@campus.edu", role='student',
+             is_active=True, created_at=created, updated_at=created)
+        for i in range(1, count + 1)
+    ]
+
+
+def build_app():
+    app = Flask(__name__)
+    app.config.update(
+        SQLALCHEMY_DATABASE_URI='sqlite:///:memory:',
+        SQLALCHEMY_TRACK_MODIFICATIONS=False,
+        JWT_SECRET_KEY='benchmark-secret-key-benchmark-secret-key',
+        JWT_ACCESS_TOKEN_EXPIRES=timedelta(hours=1),
+        JWT_VERIFY_SUB=False,
+    )
+    db.init_app(app)
+    jwt = JWTManager(app)
+    store = RevokedTokenStore(refresh_interval=30)
+
+    @jwt.token_in_blocklist_loader
+    def check_if_token_revoked(jwt_header, jwt_payload):
+        return store.is_revoked(jwt_payload.get("jti"))
+
+    with app.app_context():
+        db.create_all()
+        admin = User(username='counsellor', email='counsellor@campus.edu', role='admin', password_hash='-')
+        db.session.add(admin)
+        expires_at = datetime.utcnow() + timedelta(hours=1)
+        db.session.bulk_insert_mappings(TokenBlocklist, [
+            {"jti": str(uuid.uuid4()), "created_at": datetime.utcnow(), "expires_at": expires_at}
+            for _ in range(REVOKED_TOKENS)
+        ])
+        db.session.commit()
+        token = create_access_token(identity={"id": admin.id, "role": admin.role, "username": admin.username})
+    return app, store, token
+
+
+def build_suite(args):
+    suite = Suite()
+
+    # ==================== Serialization ====================
+    evaluations = build_evaluations(args.list_size)
+    users = build_users(args.list_size)
+    suite.add('serialize', f'Evaluation.to_dict x{args.list_size}', lambda: [e.to_dict() for e in evaluations])
+    suite.add('serialize', f'User.to_dict x{args.list_size}', lambda: [u.to_dict() for u in users])
+
+    # ==================== Scoring ====================
+    evaluation = evaluations[0]
+    weighted = ScoringRule(version=2, weights=[1.5] * 5 + [1] * 5, threshold=40)
+    answers = np.array([[getattr(e, f) for f in Evaluation.QUESTION_FIELDS] for e in evaluations], dtype=np.int64)
+    suite.add('scoring', 'calculate_total_score builtin', evaluation.calculate_total_score)
+    suite.add('scoring', 'calculate_total_score weighted', lambda: evaluation.calculate_total_score(weighted))
+    suite.add('scoring', f'score_answers weighted x{args.list_size}', lambda: score_answers(answers, weighted))
+
+    # ==================== Validators ====================
+    signup = {"username": "new.student", "email": "new.student@campus.edu", "password": "Str0ng!Passw0rd"}
+    suite.add('validators', 'validate_user_data', lambda: validate_user_data(signup))
+    suite.add('validators', 'is_strong_password strong', lambda: is_strong_password("Str0ng!Passw0rd"))
+    suite.add('validators', 'is_strong_password weak', lambda: is_strong_password("weakpassword"))
+
+    # ==================== Auth ====================
+    app, store, token = build_app()
+    headers = {"Authorization": f"Bearer {token}"}
+
+    @jwt_required()
+    def jwt_only_view():
+        return 'ok'
+
+    @role_required(['admin'])
+    def admin_view():
+        return 'ok'
+
+    def call(view):
+        with app.test_request_context('/api/evaluations', headers=headers):
+            return view()
+
+    def call_cold_role():
+        user_role_cache.clear()
+        return call(admin_view)
+
+    # Everything runs inside one app context so the session and engine stay warm
+    context = app.app_context()
+    context.push()
+    store.refresh()
+    suite.add('auth', 'jwt_required', lambda: call(jwt_only_view))
+    suite.add('auth', 'role_required cached', lambda: call(admin_view))
+    suite.add('auth', 'role_required cold cache', call_cold_role)
+
+    revoked_jti = next(iter(store._expiry_by_jti))
+    suite.add('blocklist', 'is_revoked hit', lambda: store.is_revoked(revoked_jti))
+    suite.add('blocklist', 'is_revoked miss', lambda: store.is_revoked('not-a-revoked-jti'))
+
+    def cold_refresh():
+        store.reset()
+        store.refresh()
+    suite.add('blocklist', f'refresh from db x{REVOKED_TOKENS}', cold_refresh)
+    return suite
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('-k', dest='selected', action='append', help='Only run benchmarks whose name contains this.')
+    parser.add_argument('--list-size', type=int, default=LIST_SIZE)
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--min-time', type=float, default=0.02, help='Minimum seconds per round.')
+    parser.add_argument('--save', metavar='PATH', help='Write results as JSON.')
+    parser.add_argument('--compare', metavar='PATH', help='Baseline JSON to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Allowed slowdown before flagging (0.1 = 10%%).')
+    parser.add_argument('--stat', choices=COMPARE_STATS, default='median')
+    args = parser.parse_args()
+
+    results = run_suite(build_suite(args), selected=args.selected, rounds=args.rounds, min_time=args.min_time)
+    if args.save:
+        save_results(results, args.save)
+        print(f"\nSaved {len(results['benchmarks'])} results to {args.save}")
+    if args.compare:
+        regressions = compare_results(load_results(args.compare), results, threshold=args.threshold, stat=args.stat)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            sys.exit(1)
+        print("\nNo regressions.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Serialize + compress benchmark for evaluation list payloads.
+
+Run from the server directory:
+
+    python -m benchmarks.bench_json [--count 10000]
+
+Builds transient Evaluation/User objects (no database), then times
+Evaluation.to_dict, JSON encoding with the stdlib and orjson providers, and
+gzip/brotli compression, printing time and bytes for each step.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from flask import Flask
+from models.Evaluation import Evaluation
+from models.User import User
+from utils import compression, json_provider
+from utils.json_provider import FastJSONProvider
+
+
+def build_evaluations(count, seed=7):
+    rng = random.Random(seed)
+    students = [
+        User(id=i, username=f"student{i}", email=f"student{i}@campus.edu", role='student')
+        for i in range(1, 501)
+    ]
+    admin = User(id=9999, username="counsellor", email="counsellor@campus.edu", role='admin')
+    start = datetime(2025, 1, 6, 9, 0, 0)
+    evaluations = []
+    for i in range(1, count + 1):
+        student = students[i % len(students)]
+        evaluation = Evaluation(
+            id=i,
+            user_id=student.id,
+            submitted_at=start + timedelta(minutes=37 * i, microseconds=rng.randrange(10 ** 6)),
+            **{field: rng.randint(Evaluation.ANSWER_MIN, Evaluation.ANSWER_MAX) for field in Evaluation.QUESTION_FIELDS}
+        )
+        evaluation.calculate_total_score()
+        evaluation.user = student
+        if evaluation.needs_support and rng.random() < 0.5:
+            evaluation.handled_by_admin = admin
+            evaluation.handled_at = evaluation.submitted_at + timedelta(days=1)
+            evaluation.meeting_place = "Wellbeing Centre"
+            evaluation.meeting_time = "10:00"
+            evaluation.meeting_day = "Monday"
+            evaluation.meeting_date = "2025-02-03"
+        evaluations.append(evaluation)
+    return evaluations
+
+
+def encode(provider, rows, use_orjson):
+    """provider.response() body, forcing the stdlib fallback when use_orjson is False."""
+    available = json_provider.orjson
+    json_provider.orjson = available if use_orjson else None
+    try:
+        return provider.response(rows).get_data()
+    finally:
+        json_provider.orjson = available
+
+
+def timed(fn, repeat):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--count', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--level', type=int, default=6, help='Compression level (gzip 1-9).')
+    args = parser.parse_args()
+
+    evaluations = build_evaluations(args.count)
+    app = Flask(__name__)
+
+    rows, to_dict_time = timed(lambda: [e.to_dict() for e in evaluations], args.repeat)
+    print(f"{args.count} evaluations, best of {args.repeat}")
+    print(f"{'to_dict':<28}{to_dict_time * 1000:>10.1f} ms")
+
+    provider = FastJSONProvider(app)
+    encoders = [('stdlib', False)]
+    if json_provider.orjson is not None:
+        encoders.append(('orjson', True))
+    else:
+        print("encode: orjson               skipped (orjson not installed)")
+
+    body = None
+    with app.app_context():
+        for name, use_orjson in encoders:
+            body, elapsed = timed(lambda: encode(provider, rows, use_orjson), args.repeat)
+            print(f"{'encode: ' + name:<28}{elapsed * 1000:>10.1f} ms{len(body):>12,} bytes")
+
+    encodings = ['gzip'] + (['br'] if compression.brotli is not None else [])
+    for encoding in encodings:
+        compressed, elapsed = timed(lambda: compression.compress(body, encoding, args.level), args.repeat)
+        ratio = len(compressed) / len(body)
+        print(f"{'compress: ' + encoding:<28}{elapsed * 1000:>10.1f} ms{len(compressed):>12,} bytes ({ratio:.1%})")
+    if compression.brotli is None:
+        print("compress: br                 skipped (brotli not installed)")
+
+
+if __name__ == '__main__':
+    main()
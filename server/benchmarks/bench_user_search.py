@@ -0,0 +1,97 @@
+"""Benchmarks admin user search (prefix and fuzzy) against a large users table.
+
+Run from the server directory; it builds a throwaway SQLite database:
+
+    python -m benchmarks.bench_user_search [--users 100000] [--save results.json]
+    python -m benchmarks.bench_user_search --compare results.json
+
+Compares the indexed prefix search with the full-scan ILIKE it replaces, and
+the trigram index for fuzzy matches.
+"""
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime
+from flask import Flask
+from sqlalchemy import insert, or_
+from benchmarks.runner import COMPARE_STATS, Suite, compare_results, load_results, run_suite, save_results
+from db.Burnout_Tracker import db
+from models.User import User
+from utils.user_search import build_fuzzy_index, search_users
+
+USERS = 100000
+FIRST_NAMES = ['amara', 'bilal', 'chen', 'dara', 'elif', 'farah', 'gustav', 'hana', 'imran', 'jonas',
+               'kofi', 'lena', 'mateo', 'nadia', 'omar', 'priya', 'quinn', 'rosa', 'sami', 'tariq']
+
+
+def build_app(path, count):
+    app = Flask(__name__)
+    app.config.update(SQLALCHEMY_DATABASE_URI=f'sqlite:///{path}', SQLALCHEMY_TRACK_MODIFICATIONS=False)
+    db.init_app(app)
+    created = datetime(2025, 1, 6, 9, 0, 0)
+    with app.app_context():
+        db.create_all()
+        for start in range(0, count, 10000):
+            db.session.execute(insert(User.__table__), [
+                {
+                    "username": f"{FIRST_NAMES[i % len(FIRST_NAMES)]}.{i}",
+                    "email": f"{FIRST_NAMES[(i * 7) % len(FIRST_NAMES)]}{i}@campus.edu",
+                    "password_hash": '-', "role": 'student' if i % 50 else 'admin',
+                    "is_active": True, "created_at": created, "updated_at": created,
+                }
+                for i in range(start, min(start + 10000, count))
+            ])
+        db.session.commit()
+        build_fuzzy_index()
+    return app
+
+
+def build_suite(app, args):
+    suite = Suite()
+    context = app.app_context()
+    context.push()
+
+    def ilike_scan(term):
+        pattern = f"%{term}%"
+        return User.query.filter(or_(User.username.ilike(pattern), User.email.ilike(pattern))).limit(20).all()
+
+    suite.add('prefix', 'search_users exact', lambda: search_users(f'priya.{args.users // 2 + 15}', fuzzy=False))
+    suite.add('prefix', 'search_users broad prefix', lambda: search_users('pri', fuzzy=False))
+    suite.add('prefix', 'search_users prefix role=admin', lambda: search_users('omar.1', role='admin', fuzzy=False))
+    suite.add('prefix', 'ILIKE scan (before)', lambda: ilike_scan('priya.12'))
+    suite.add('fuzzy', 'search_users typo', lambda: search_users('pirya.1234'))
+    suite.add('fuzzy', 'search_users infix', lambda: search_users('ya.4321'))
+    return suite
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=USERS)
+    parser.add_argument('-k', dest='selected', action='append', help='Only run benchmarks whose name contains this.')
+    parser.add_argument('--rounds', type=int, default=10)
+    parser.add_argument('--min-time', type=float, default=0.05, help='Minimum seconds per round.')
+    parser.add_argument('--save', metavar='PATH', help='Write results as JSON.')
+    parser.add_argument('--compare', metavar='PATH', help='Baseline JSON to compare against.')
+    parser.add_argument('--threshold', type=float, default=0.1, help='Allowed slowdown before flagging (0.1 = 10%%).')
+    parser.add_argument('--stat', choices=COMPARE_STATS, default='median')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"Building {args.users:,} users...")
+        app = build_app(os.path.join(directory, 'search.db'), args.users)
+        results = run_suite(build_suite(app, args), selected=args.selected, rounds=args.rounds, min_time=args.min_time)
+
+    if args.save:
+        save_results(results, args.save)
+        print(f"\nSaved {len(results['benchmarks'])} results to {args.save}")
+    if args.compare:
+        regressions = compare_results(load_results(args.compare), results, threshold=args.threshold, stat=args.stat)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+            sys.exit(1)
+        print("\nNo regressions.")
+
+
+if __name__ == '__main__':
+    main()
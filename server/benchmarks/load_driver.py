@@ -0,0 +1,241 @@
+"""Load driver replaying a student/admin traffic mix against a running server.
+
+Seed accounts first (`flask seed --students 1000`), start the server, then run
+from the server directory:
+
+    python -m benchmarks.load_driver --concurrency 16 --duration 60 --students 1000
+
+Each worker keeps one keep-alive connection, logs in as a random seeded
+student (and as a seeded admin for admin calls), then picks requests by
+weight until the time is up. Prints per-endpoint throughput and latency
+percentiles; --json also writes them to a file. Standard library only.
+"""
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+from benchmarks.runner import format_time
+
+DEFAULT_MIX = {
+    'login': 5,
+    'submit': 10,
+    'my-evaluations': 30,
+    'notifications': 30,
+    'admin-evaluations': 10,
+    'admin-alerts': 8,
+    'admin-users': 7,
+}
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name not in DEFAULT_MIX:
+            raise argparse.ArgumentTypeError(f"Unknown endpoint '{name}'. Choose from: {', '.join(DEFAULT_MIX)}.")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Weight for '{name}' must be a number.")
+    return mix
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = max(int(round(fraction * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(index, len(sorted_values) - 1)]
+
+
+class Client:
+    """One keep-alive connection, reopened after any transport error."""
+
+    def __init__(self, base_url, timeout):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.prefix = parts.path.rstrip('/')
+        self.timeout = timeout
+        self.connection = None
+
+    def request(self, method, path, body=None, token=None, headers=None):
+        all_headers = {"Content-Type": "application/json", "Accept-Encoding": "gzip"}
+        if token:
+            all_headers["Authorization"] = f"Bearer {token}"
+        all_headers.update(headers or {})
+        payload = json.dumps(body) if body is not None else None
+        if self.connection is None:
+            self.connection = self.connection_class(self.host, self.port, timeout=self.timeout)
+        try:
+            self.connection.request(method, self.prefix + path, body=payload, headers=all_headers)
+            response = self.connection.getresponse()
+            data = response.read()
+            return response.status, response.headers, data
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            self.connection = None
+            raise
+
+
+class Worker(threading.Thread):
+    def __init__(self, number, args, deadline, results):
+        super().__init__(daemon=True)
+        self.args = args
+        self.deadline = deadline
+        self.results = results
+        self.rng = random.Random(args.seed * 1000 + number)
+        self.client = Client(args.base_url, args.timeout)
+        self.student_token = None
+        self.admin_token = None
+        self.etags = {}
+        self.names = list(args.mix)
+        self.weights = [args.mix[name] for name in self.names]
+
+    def record(self, name, started, ok):
+        elapsed = time.perf_counter() - started
+        self.results.setdefault(name, {"latencies": [], "errors": 0})
+        self.results[name]["latencies"].append(elapsed)
+        if not ok:
+            self.results[name]["errors"] += 1
+
+    def login(self, username):
+        status, _, data = self.client.request('POST', '/api/login', {
+            "username_or_email": username,
+            "password": self.args.password
+        })
+        return json.loads(data)["access_token"] if status == 200 else None
+
+    def get(self, path, token):
+        headers = {}
+        if self.args.conditional and path in self.etags:
+            headers["If-None-Match"] = self.etags[path]
+        status, response_headers, _ = self.client.request('GET', path, token=token, headers=headers)
+        if response_headers.get('ETag'):
+            self.etags[path] = response_headers['ETag']
+        return status in (200, 304)
+
+    def student_username(self):
+        return f"{self.args.prefix}_student{self.rng.randint(1, self.args.students)}"
+
+    def call(self, name):
+        if name == 'login':
+            token = self.login(self.student_username())
+            if token:
+                self.student_token = token
+                self.etags.clear()
+            return token is not None
+        if name == 'submit':
+            answers = {f"q{i}": self.rng.randint(1, 5) for i in range(1, 11)}
+            status, _, _ = self.client.request('POST', '/api/evaluations', answers, token=self.student_token)
+            return status == 201
+        if name == 'my-evaluations':
+            return self.get('/api/my-evaluations?limit=50', self.student_token)
+        if name == 'notifications':
+            return self.get('/api/notifications', self.student_token)
+        if name == 'admin-evaluations':
+            return self.get('/api/evaluations?limit=50', self.admin_token)
+        if name == 'admin-alerts':
+            return self.get('/api/evaluations/alerts?limit=50', self.admin_token)
+        if name == 'admin-users':
+            return self.get('/api/users?limit=50', self.admin_token)
+        raise ValueError(name)
+
+    def run(self):
+        try:
+            self.student_token = self.login(self.student_username())
+            self.admin_token = self.login(f"{self.args.prefix}_admin{self.rng.randint(1, self.args.admins)}")
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            print(f"worker setup failed: {e}")
+            return
+        if not self.student_token or not self.admin_token:
+            print("worker setup failed: could not log in (did you run `flask seed` with this --prefix/--password?)")
+            return
+
+        while time.monotonic() < self.deadline:
+            name = self.rng.choices(self.names, self.weights)[0]
+            started = time.perf_counter()
+            try:
+                ok = self.call(name)
+            except (OSError, http.client.HTTPException, ValueError):
+                ok = False
+            self.record(name, started, ok)
+
+
+def summarize(per_worker, duration):
+    merged = {}
+    for results in per_worker:
+        for name, result in results.items():
+            entry = merged.setdefault(name, {"latencies": [], "errors": 0})
+            entry["latencies"].extend(result["latencies"])
+            entry["errors"] += result["errors"]
+
+    summary = {}
+    for name, entry in sorted(merged.items()):
+        latencies = sorted(entry["latencies"])
+        summary[name] = {
+            "requests": len(latencies),
+            "errors": entry["errors"],
+            "throughput": len(latencies) / duration,
+            "mean": sum(latencies) / len(latencies),
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "max": latencies[-1],
+        }
+    return summary
+
+
+def print_summary(summary, duration):
+    print(f"{'endpoint':<20}{'requests':>10}{'errors':>8}{'req/s':>10}"
+          f"{'p50':>13}{'p95':>13}{'p99':>13}{'max':>13}")
+    for name, s in summary.items():
+        print(f"{name:<20}{s['requests']:>10,}{s['errors']:>8,}{s['throughput']:>10,.1f}"
+              f"{format_time(s['p50']):>13}{format_time(s['p95']):>13}"
+              f"{format_time(s['p99']):>13}{format_time(s['max']):>13}")
+    total = sum(s['requests'] for s in summary.values())
+    errors = sum(s['errors'] for s in summary.values())
+    print(f"{'total':<20}{total:>10,}{errors:>8,}{total / duration:>10,.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--base-url', default='http://127.0.0.1:5555')
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=30, help='Seconds to run.')
+    parser.add_argument('--students', type=int, default=1000, help='How many seeded students to draw from.')
+    parser.add_argument('--admins', type=int, default=5, help='How many seeded admins to draw from.')
+    parser.add_argument('--prefix', default='seed', help='The --prefix given to `flask seed`.')
+    parser.add_argument('--password', default='Seed!Passw0rd', help='The --password given to `flask seed`.')
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help='Weights as name=weight,... (default: %s).' % ','.join(f"{k}={v}" for k, v in DEFAULT_MIX.items()))
+    parser.add_argument('--conditional', action='store_true', help='Send If-None-Match like a browser cache would.')
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', metavar='PATH', help='Also write the summary as JSON.')
+    args = parser.parse_args()
+
+    print(f"{args.concurrency} workers for {args.duration:g} s against {args.base_url}")
+    started = time.monotonic()
+    deadline = started + args.duration
+    per_worker = [{} for _ in range(args.concurrency)]
+    workers = [Worker(i, args, deadline, per_worker[i]) for i in range(args.concurrency)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    duration = time.monotonic() - started
+
+    summary = summarize(per_worker, duration)
+    print_summary(summary, duration)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({"concurrency": args.concurrency, "duration": duration, "endpoints": summary}, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
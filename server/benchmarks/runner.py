@@ -0,0 +1,141 @@
+"""Small pytest-benchmark style runner shared by the benchmark scripts.
+
+Each case is calibrated so one round takes at least `min_time`, then timed for
+`rounds` rounds; stats are per call. Results are saved in a pytest-benchmark
+like JSON layout and can be compared against an earlier run.
+"""
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+COMPARE_STATS = ('min', 'median', 'mean')
+
+
+class Suite:
+    def __init__(self):
+        self.cases = []
+
+    def case(self, group, name=None):
+        """Decorator registering a zero-argument callable as a benchmark."""
+        def decorator(fn):
+            self.cases.append((group, name or fn.__name__, fn))
+            return fn
+        return decorator
+
+    def add(self, group, name, fn):
+        self.cases.append((group, name, fn))
+
+
+def _calibrate(fn, min_time):
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or iterations >= 10 ** 7:
+            return iterations
+        # Aim a little past min_time so the next try usually sticks
+        iterations = max(iterations * 2, int(iterations * min_time * 1.2 / max(elapsed, 1e-9)))
+
+
+def measure(fn, rounds=10, min_time=0.02, warmup=1):
+    for _ in range(warmup):
+        fn()
+    iterations = _calibrate(fn, min_time)
+    per_call = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            fn()
+        per_call.append((time.perf_counter() - started) / iterations)
+
+    mean = statistics.mean(per_call)
+    return {
+        "min": min(per_call),
+        "max": max(per_call),
+        "mean": mean,
+        "median": statistics.median(per_call),
+        "stddev": statistics.stdev(per_call) if len(per_call) > 1 else 0.0,
+        "rounds": rounds,
+        "iterations": iterations,
+        "ops": 1 / mean if mean else None,
+    }
+
+
+def machine_info():
+    info = {
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+    }
+    try:
+        import numpy
+        info["numpy_version"] = numpy.__version__
+    except ImportError:
+        pass
+    return info
+
+
+def format_time(seconds):
+    for unit, scale in (('s', 1), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def run_suite(suite, selected=None, rounds=10, min_time=0.02, out=sys.stdout):
+    benchmarks = []
+    print(f"{'benchmark':<44}{'min':>14}{'median':>14}{'stddev':>14}{'ops/s':>14}", file=out)
+    for group, name, fn in suite.cases:
+        fullname = f"{group}::{name}"
+        if selected and not any(pattern in fullname for pattern in selected):
+            continue
+        stats = measure(fn, rounds=rounds, min_time=min_time)
+        benchmarks.append({"group": group, "name": name, "fullname": fullname, "stats": stats})
+        print(
+            f"{fullname:<44}{format_time(stats['min']):>14}{format_time(stats['median']):>14}"
+            f"{format_time(stats['stddev']):>14}{stats['ops'] or 0:>14,.0f}",
+            file=out
+        )
+    return {
+        "machine_info": machine_info(),
+        "datetime": datetime.utcnow().isoformat(),
+        "benchmarks": benchmarks,
+    }
+
+
+def save_results(results, path):
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_results(baseline, current, threshold=0.1, stat='median', out=sys.stdout):
+    """Prints current vs baseline per benchmark; returns the names slower than 1 + threshold."""
+    before = {b["fullname"]: b["stats"][stat] for b in baseline["benchmarks"]}
+    regressions = []
+    print(f"\nCompared by {stat} against baseline from {baseline.get('datetime', '?')} "
+          f"(regression threshold {threshold:.0%})", file=out)
+    print(f"{'benchmark':<44}{'baseline':>14}{'current':>14}{'change':>10}", file=out)
+    for bench in current["benchmarks"]:
+        name = bench["fullname"]
+        if name not in before:
+            print(f"{name:<44}{'-':>14}{format_time(bench['stats'][stat]):>14}{'new':>10}", file=out)
+            continue
+        old, new = before[name], bench["stats"][stat]
+        change = new / old - 1 if old else 0.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<44}{format_time(old):>14}{format_time(new):>14}{change:>+10.1%}{flag}", file=out)
+    return regressions
@@ -0,0 +1,22 @@
+from .export_commands import export_evaluations
+from .import_commands import import_evaluations
+from .token_commands import prune_blocklist
+from .stats_commands import rebuild_student_risk_command, rebuild_student_stats
+from .counter_commands import check_counters_command
+from .scoring_commands import rescore_evaluations_command
+from .seed_commands import seed
+from .job_commands import worker
+from .search_commands import search_index
+
+all_commands = [
+    export_evaluations,
+    import_evaluations,
+    prune_blocklist,
+    rebuild_student_stats,
+    rebuild_student_risk_command,
+    check_counters_command,
+    rescore_evaluations_command,
+    seed,
+    worker,
+    search_index
+]
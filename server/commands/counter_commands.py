@@ -0,0 +1,18 @@
+# commands/counter_commands.py
+import click
+from flask.cli import with_appcontext
+from utils.counters import check_counters
+
+
+@click.command('check-counters')
+@click.option('--repair', is_flag=True, help='Overwrite drifted counters with the recomputed values.')
+@with_appcontext
+def check_counters_command(repair):
+    """Verify maintained counters against the tables they summarize."""
+    drift = check_counters(repair=repair)
+    if not drift:
+        click.echo("All counters are consistent.")
+        return
+    for name, (stored, actual) in drift.items():
+        action = "repaired" if repair else "drifted"
+        click.echo(f"{name}: stored={stored} actual={actual} ({action})")
@@ -0,0 +1,43 @@
+# commands/export_commands.py
+import sys
+import click
+from flask.cli import with_appcontext
+from utils.export import EXPORT_FORMATS, iter_export
+from utils.pagination import PaginationError
+
+
+@click.command('export-evaluations')
+@click.option('--format', 'export_format', type=click.Choice(EXPORT_FORMATS), default='ndjson', show_default=True)
+@click.option('--output', '-o', type=click.Path(dir_okay=False, writable=True), help='File to write (default: stdout).')
+@click.option('--from', 'date_from', help='Only evaluations submitted on/after this ISO date.')
+@click.option('--to', 'date_to', help='Only evaluations submitted on/before this ISO date.')
+@click.option('--min-score', type=int)
+@click.option('--max-score', type=int)
+@click.option('--handled', type=click.Choice(['true', 'false']))
+@click.option('--needs-support', type=click.Choice(['true', 'false']))
+@with_appcontext
+def export_evaluations(export_format, output, date_from, date_to, min_score, max_score, handled, needs_support):
+    """Stream every evaluation as NDJSON or CSV with constant memory."""
+    filters = {
+        'from': date_from,
+        'to': date_to,
+        'min_score': None if min_score is None else str(min_score),
+        'max_score': None if max_score is None else str(max_score),
+        'handled': handled,
+        'needs_support': needs_support,
+    }
+    filters = {key: value for key, value in filters.items() if value is not None}
+
+    # Validate the filters before opening (and truncating) the output file
+    try:
+        chunks = iter_export(filters, export_format)
+    except PaginationError as e:
+        raise click.ClickException(str(e))
+
+    out = open(output, 'w', newline='') if output else sys.stdout
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+    finally:
+        if output:
+            out.close()
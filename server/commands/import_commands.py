@@ -0,0 +1,27 @@
+# commands/import_commands.py
+import os
+import click
+from flask.cli import with_appcontext
+from utils.importer import IMPORT_BATCH_SIZE, IMPORT_FORMATS, import_records, read_records
+
+
+@click.command('import-evaluations')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'import_format', type=click.Choice(IMPORT_FORMATS),
+              help='Input format (default: from the file extension).')
+@click.option('--batch-size', type=click.IntRange(min=1), default=IMPORT_BATCH_SIZE, show_default=True)
+@with_appcontext
+def import_evaluations(path, import_format, batch_size):
+    """Bulk import evaluations from a CSV or NDJSON file."""
+    if not import_format:
+        extension = os.path.splitext(path)[1].lower().lstrip('.')
+        import_format = 'csv' if extension == 'csv' else 'ndjson'
+
+    with open(path, newline='') as stream:
+        summary = import_records(read_records(stream, import_format), batch_size=batch_size)
+
+    for error in summary["errors"]:
+        click.echo(f"row {error['row']}: {error['error']}", err=True)
+    if summary["errors_truncated"]:
+        click.echo("... more errors omitted", err=True)
+    click.echo(f"Imported {summary['imported']} evaluations, {summary['failed']} rows failed.")
@@ -0,0 +1,34 @@
+# commands/job_commands.py
+import json
+import signal
+import click
+from flask import current_app
+from flask.cli import with_appcontext
+from utils.jobs import DEFAULT_QUEUE, JobRunner, job_stats
+
+
+@click.command('worker')
+@click.option('--queue', 'queues', multiple=True, default=[DEFAULT_QUEUE], show_default=True,
+              help="Queue to take jobs from; repeat for several. The 'events' queue only makes "
+                   "sense inside the web process, which holds the stream subscribers.")
+@click.option('--concurrency', type=click.IntRange(min=1), default=4, show_default=True)
+@click.option('--poll-interval', type=click.FloatRange(min=0.05), default=1.0, show_default=True,
+              help='Seconds between checks for new jobs when idle.')
+@click.option('--burst', is_flag=True, help='Exit once the queues are empty instead of waiting for more.')
+@with_appcontext
+def worker(queues, concurrency, poll_interval, burst):
+    """Run queued background jobs until interrupted."""
+    app = current_app._get_current_object()
+    runner = JobRunner(app, queues=queues, concurrency=concurrency, poll_interval=poll_interval)
+
+    def shutdown(signum, frame):
+        click.echo("Stopping after the running jobs finish...")
+        runner.stop()
+
+    signal.signal(signal.SIGINT, shutdown)
+    signal.signal(signal.SIGTERM, shutdown)
+
+    click.echo(f"Worker {runner.worker_id} on {', '.join(runner.queues)} (concurrency {concurrency})")
+    runner.run(burst=burst)
+
+    click.echo(json.dumps({"worker": runner.stats(), "jobs": job_stats()}, indent=2, default=str))
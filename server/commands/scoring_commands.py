@@ -0,0 +1,44 @@
+# commands/scoring_commands.py
+import click
+from flask.cli import with_appcontext
+from db.Burnout_Tracker import db
+from models.ScoringRule import ScoringRule
+from utils.scoring import RESCORE_CHUNK_SIZE, get_active_rule, rescore_evaluations, rule_version
+
+
+@click.command('rescore-evaluations')
+@click.option('--version', 'version', type=int, default=None,
+              help='Rule version to apply (defaults to the active, highest version).')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=RESCORE_CHUNK_SIZE, show_default=True)
+@click.option('--start-after', type=click.IntRange(min=0), default=0, show_default=True,
+              help='Skip evaluations with an id at or below this one.')
+@with_appcontext
+def rescore_evaluations_command(version, chunk_size, start_after):
+    """Recompute total_score and needs_support for evaluations scored by an older rule.
+
+    Safe to interrupt: rerunning picks up the rows that were not rescored yet.
+    """
+    if version is None:
+        rule = get_active_rule()
+    else:
+        rule = db.session.get(ScoringRule, version)
+        if rule is None:
+            raise click.BadParameter(f"No scoring rule with version {version}.", param_hint='--version')
+
+    click.echo(f"Rescoring with rule version {rule_version(rule)}")
+    progress = None
+    for progress in rescore_evaluations(rule, chunk_size=chunk_size, start_after=start_after):
+        share = progress["processed"] / progress["total"] if progress["total"] else 1
+        click.echo(
+            f"  {progress['processed']:,}/{progress['total']:,} ({share:.0%}) "
+            f"changed={progress['changed']:,} last_id={progress['last_id']} "
+            f"{progress['rows_per_second'] or 0:,.0f} rows/s"
+        )
+
+    if progress is None:
+        click.echo("Every evaluation is already scored by this rule.")
+    else:
+        click.echo(
+            f"Rescored {progress['processed']:,} evaluations ({progress['changed']:,} changed) "
+            f"in {progress['elapsed']:.1f} s."
+        )
@@ -0,0 +1,24 @@
+# commands/search_commands.py
+import click
+from flask.cli import with_appcontext
+from utils.user_search import build_fuzzy_index, drop_fuzzy_index
+
+
+@click.command('search-index')
+@click.option('--drop', is_flag=True, help='Remove the index; search falls back to prefix matches only.')
+@with_appcontext
+def search_index(drop):
+    """Build (or rebuild) the optional trigram index used for fuzzy user search.
+
+    SQLite only. Rerun it after a migration that rebuilds the users table,
+    since that drops the triggers keeping the index current.
+    """
+    if drop:
+        drop_fuzzy_index()
+        click.echo("Dropped the fuzzy user search index.")
+        return
+    try:
+        indexed = build_fuzzy_index()
+    except ValueError as e:
+        raise click.ClickException(str(e))
+    click.echo(f"Indexed {indexed:,} users for fuzzy search.")
@@ -0,0 +1,52 @@
+# commands/seed_commands.py
+import time
+import click
+from flask.cli import with_appcontext
+from utils.password_hashing import password_hasher
+from utils.seeding import SEED_BATCH_SIZE, seed_database, seed_username
+
+
+@click.command('seed')
+@click.option('--students', type=click.IntRange(min=0), default=1000, show_default=True)
+@click.option('--admins', type=click.IntRange(min=0), default=5, show_default=True)
+@click.option('--evaluations-per-student', type=click.FloatRange(min=0), default=20, show_default=True,
+              help='Mean evaluations per student (Poisson distributed).')
+@click.option('--days', type=click.IntRange(min=1), default=180, show_default=True,
+              help='Spread submissions over this many past days.')
+@click.option('--seed', type=int, default=1, show_default=True, help='Random seed; the same seed gives the same data.')
+@click.option('--prefix', default='seed', show_default=True, help='Username prefix for the generated accounts.')
+@click.option('--password', default='Seed!Passw0rd', show_default=True, help='Password for every generated account.')
+@click.option('--batch-size', type=click.IntRange(min=1), default=SEED_BATCH_SIZE, show_default=True,
+              help='Students per transaction.')
+@with_appcontext
+def seed(students, admins, evaluations_per_student, days, seed, prefix, password, batch_size):
+    """Bulk-generate synthetic students, admins and evaluations for load testing."""
+    started = time.perf_counter()
+    progress = None
+    try:
+        for progress in seed_database(
+            students=students,
+            admins=admins,
+            evaluations_per_student=evaluations_per_student,
+            days=days,
+            seed=seed,
+            password_hash=password_hasher.hash(password),
+            prefix=prefix,
+            batch_size=batch_size
+        ):
+            elapsed = time.perf_counter() - started
+            click.echo(
+                f"  {progress['students']:,}/{students:,} students, {progress['evaluations']:,} evaluations "
+                f"({progress['evaluations'] / elapsed:,.0f} rows/s)"
+            )
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    evaluations = progress['evaluations'] if progress else 0
+    click.echo(
+        f"Seeded {admins} admins, {students:,} students and {evaluations:,} evaluations "
+        f"in {time.perf_counter() - started:.1f} s."
+    )
+    if students or admins:
+        example = seed_username(prefix, 'student' if students else 'admin', 1)
+        click.echo(f"Log in as e.g. {example} / {password}")
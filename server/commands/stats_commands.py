@@ -0,0 +1,39 @@
+# commands/stats_commands.py
+import click
+from flask.cli import with_appcontext
+from utils.risk import RISK_CHUNK_SIZE, backfill_student_risk
+from utils.student_stats import rebuild_all_student_stats
+
+
+@click.command('rebuild-student-stats')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=1000, show_default=True)
+@with_appcontext
+def rebuild_student_stats(chunk_size):
+    """Backfill or repair the student_stats summary table from evaluations."""
+    rebuilt = rebuild_all_student_stats(chunk_size=chunk_size)
+    click.echo(f"Rebuilt summaries for {rebuilt} students.")
+
+
+@click.command('rebuild-student-risk')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=RISK_CHUNK_SIZE, show_default=True,
+              help='Students replayed per transaction.')
+@click.option('--start-after', type=click.IntRange(min=0), default=0, show_default=True,
+              help='Skip users with an id at or below this one (to resume an interrupted run).')
+@with_appcontext
+def rebuild_student_risk_command(chunk_size, start_after):
+    """Backfill or repair the student_risk early-warning state by replaying each student's history."""
+    progress = None
+    for progress in backfill_student_risk(chunk_size=chunk_size, start_after=start_after):
+        share = progress["processed"] / progress["total"] if progress["total"] else 1
+        click.echo(
+            f"  {progress['processed']:,}/{progress['total']:,} users ({share:.0%}) "
+            f"last_user_id={progress['last_user_id']} {progress['users_per_second'] or 0:,.0f} users/s"
+        )
+
+    if progress is None:
+        click.echo("No users to replay.")
+    else:
+        click.echo(
+            f"Replayed {progress['with_history']:,} students with evaluations "
+            f"in {progress['elapsed']:.1f} s."
+        )
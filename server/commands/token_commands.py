@@ -0,0 +1,13 @@
+# commands/token_commands.py
+import click
+from flask.cli import with_appcontext
+from utils.jwt_blocklist import prune_expired_tokens
+
+
+@click.command('prune-blocklist')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=500, show_default=True)
+@with_appcontext
+def prune_blocklist(chunk_size):
+    """Delete revoked-token rows whose tokens have expired anyway."""
+    deleted = prune_expired_tokens(chunk_size=chunk_size)
+    click.echo(f"Pruned {deleted} expired blocklist entries.")
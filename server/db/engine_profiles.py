@@ -0,0 +1,114 @@
+# db/engine_profiles.py
+import sqlite3
+from sqlalchemy import event, text
+
+# Named database engine profiles, selected with DB_ENGINE_PROFILE.
+#   pragmas:        run on every new SQLite connection, in order
+#   engine_options: passed to create_engine through SQLALCHEMY_ENGINE_OPTIONS
+ENGINE_PROFILES = {
+    # SQLite as it behaves out of the box: rollback journal, writers block readers
+    'sqlite-default': {
+        'pragmas': [],
+        'engine_options': {},
+    },
+    # SQLite tuned for concurrent web traffic: readers never wait for the writer,
+    # commits skip the fsync-per-transaction that WAL makes unnecessary for safety
+    'sqlite-wal': {
+        'pragmas': [
+            ('journal_mode', 'WAL'),
+            ('synchronous', 'NORMAL'),
+            ('cache_size', -20000),         # ~20 MB page cache per connection
+            ('mmap_size', 268435456),       # 256 MB memory-mapped reads
+            ('busy_timeout', 5000),         # wait up to 5 s for the write lock
+            ('temp_store', 'MEMORY'),
+        ],
+        'engine_options': {},
+    },
+    # Client/server databases (PostgreSQL, MySQL): a bounded, health-checked pool
+    'server': {
+        'pragmas': [],
+        'engine_options': {
+            'pool_size': 10,
+            'max_overflow': 20,
+            'pool_pre_ping': True,
+            'pool_recycle': 1800,
+            'pool_timeout': 30,
+        },
+    },
+}
+
+
+def default_profile(database_uri):
+    return 'sqlite-wal' if (database_uri or '').startswith('sqlite') else 'server'
+
+
+def get_profile(name):
+    if name not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown DB_ENGINE_PROFILE '{name}'. Choose one of: {', '.join(ENGINE_PROFILES)}."
+        )
+    return ENGINE_PROFILES[name]
+
+
+def apply_pragmas(dbapi_connection, pragmas):
+    if not pragmas or not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    for name, value in pragmas:
+        cursor.execute(f"PRAGMA {name}={value};")
+    cursor.close()
+
+
+def install_pragmas(engine, pragmas):
+    """Runs the profile's pragmas on every connection the engine opens."""
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_pragmas(dbapi_connection, pragmas)
+
+
+def configure_engine_profile(app):
+    """Puts the selected profile's engine options into the app config (before db.init_app)."""
+    name = app.config.get('DB_ENGINE_PROFILE') or default_profile(app.config.get('SQLALCHEMY_DATABASE_URI'))
+    profile = get_profile(name)
+    app.config['DB_ENGINE_PROFILE'] = name
+    options = dict(profile['engine_options'])
+    options.update(app.config.get('SQLALCHEMY_ENGINE_OPTIONS') or {})
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = options
+    return profile
+
+
+def effective_settings(engine):
+    """Reads back what the database actually applied, which can differ from what was asked."""
+    settings = {'dialect': engine.dialect.name, 'pool': type(engine.pool).__name__}
+    if engine.dialect.name == 'sqlite':
+        with engine.connect() as connection:
+            for name in ('journal_mode', 'synchronous', 'cache_size', 'mmap_size', 'busy_timeout', 'foreign_keys'):
+                settings[name] = connection.execute(text(f"PRAGMA {name}")).scalar()
+    else:
+        pool = engine.pool
+        for attribute, key in (('size', 'pool_size'), ('_max_overflow', 'max_overflow'),
+                               ('_recycle', 'pool_recycle'), ('_pre_ping', 'pool_pre_ping')):
+            value = getattr(pool, attribute, None)
+            settings[key] = value() if callable(value) else value
+    return settings
+
+
+def init_engine_profile(app, db):
+    """Attaches the profile's pragmas to the app's engine and logs the effective settings."""
+    profile = get_profile(app.config['DB_ENGINE_PROFILE'])
+    with app.app_context():
+        engine = db.engine
+        install_pragmas(engine, profile['pragmas'])
+        try:
+            settings = effective_settings(engine)
+        except Exception as e:  # The database may not exist yet (e.g. before `flask db upgrade`)
+            app.logger.warning("Could not validate database engine profile %s: %s", app.config['DB_ENGINE_PROFILE'], e)
+            return
+
+    app.logger.info("Database engine profile %s: %s", app.config['DB_ENGINE_PROFILE'], settings)
+    wanted = dict(profile['pragmas'])
+    if 'journal_mode' in wanted and str(settings.get('journal_mode', '')).lower() != str(wanted['journal_mode']).lower():
+        app.logger.warning(
+            "journal_mode is %s, not %s (in-memory databases cannot use WAL)",
+            settings.get('journal_mode'), wanted['journal_mode']
+        )
@@ -0,0 +1,26 @@
+"""Add alert queue index
+
+Revision ID: 3c1f9a7d52e4
+Revises: 75ef640a2026
+Create Date: 2026-10-18 09:12:40.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c1f9a7d52e4'
+down_revision = '75ef640a2026'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('evaluations', schema=None) as batch_op:
+        batch_op.create_index('ix_evaluations_alert_queue', ['needs_support', 'handled_by_admin_id', 'submitted_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('evaluations', schema=None) as batch_op:
+        batch_op.drop_index('ix_evaluations_alert_queue')
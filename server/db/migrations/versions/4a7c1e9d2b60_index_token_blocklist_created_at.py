@@ -0,0 +1,26 @@
+"""Index token_blocklist created_at
+
+Revision ID: 4a7c1e9d2b60
+Revises: f6b29c0e7d53
+Create Date: 2026-10-18 14:05:12.418302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4a7c1e9d2b60'
+down_revision = 'f6b29c0e7d53'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_token_blocklist_created_at'), ['created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_token_blocklist_created_at'))
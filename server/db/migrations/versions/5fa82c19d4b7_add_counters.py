@@ -0,0 +1,38 @@
+"""Add counters table
+
+Revision ID: 5fa82c19d4b7
+Revises: e91d3b6a7c28
+Create Date: 2026-10-18 13:02:37.640911
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5fa82c19d4b7'
+down_revision = 'e91d3b6a7c28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    counters = op.create_table('counters',
+    sa.Column('name', sa.String(length=64), nullable=False),
+    sa.Column('value', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute(
+        counters.insert().from_select(
+            ['name', 'value'],
+            sa.select(
+                sa.literal('unhandled_evaluations'),
+                sa.func.count()
+            ).select_from(sa.table('evaluations', sa.column('handled_by_admin_id')))
+            .where(sa.column('handled_by_admin_id').is_(None))
+        )
+    )
+
+
+def downgrade():
+    op.drop_table('counters')
@@ -0,0 +1,32 @@
+"""Widen users.password_hash for scrypt hashes
+
+Revision ID: 7d3e5a1c9b62
+Revises: 5fa82c19d4b7
+Create Date: 2026-10-18 14:10:25.381554
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d3e5a1c9b62'
+down_revision = '5fa82c19d4b7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.alter_column('password_hash',
+               existing_type=sa.String(length=128),
+               type_=sa.String(length=255),
+               existing_nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.alter_column('password_hash',
+               existing_type=sa.String(length=255),
+               type_=sa.String(length=128),
+               existing_nullable=False)
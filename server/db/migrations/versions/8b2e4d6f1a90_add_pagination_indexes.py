@@ -0,0 +1,28 @@
+"""Add pagination indexes
+
+Revision ID: 8b2e4d6f1a90
+Revises: 3c1f9a7d52e4
+Create Date: 2026-10-18 10:03:11.572046
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4d6f1a90'
+down_revision = '3c1f9a7d52e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('evaluations', schema=None) as batch_op:
+        batch_op.create_index('ix_evaluations_user_submitted', ['user_id', 'submitted_at'], unique=False)
+        batch_op.create_index('ix_evaluations_submitted_at', ['submitted_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('evaluations', schema=None) as batch_op:
+        batch_op.drop_index('ix_evaluations_submitted_at')
+        batch_op.drop_index('ix_evaluations_user_submitted')
@@ -0,0 +1,44 @@
+"""Binary collation for the user search columns
+
+Revision ID: 9e4b7d2a6c18
+Revises: 4a7c1e9d2b60
+Create Date: 2026-10-18 15:21:44.907316
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision = '9e4b7d2a6c18'
+down_revision = '4a7c1e9d2b60'
+branch_labels = None
+depends_on = None
+
+COLUMNS = (('username_lower', 80), ('email_lower', 120))
+
+
+def _collated(dialect, length):
+    if dialect == 'postgresql':
+        return sa.String(length, collation='C')
+    return mysql.VARCHAR(length, charset='utf8mb4', collation='utf8mb4_bin')
+
+
+def upgrade():
+    # SQLite already compares with BINARY; the prefix range scans need the same elsewhere
+    dialect = op.get_bind().dialect.name
+    if dialect not in ('postgresql', 'mysql', 'mariadb'):
+        return
+    for name, length in COLUMNS:
+        op.alter_column('users', name, type_=_collated(dialect, length),
+                        existing_type=sa.String(length), existing_nullable=False)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect not in ('postgresql', 'mysql', 'mariadb'):
+        return
+    for name, length in COLUMNS:
+        op.alter_column('users', name, type_=sa.String(length),
+                        existing_type=_collated(dialect, length), existing_nullable=False)
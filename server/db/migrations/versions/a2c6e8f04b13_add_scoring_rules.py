@@ -0,0 +1,49 @@
+"""Add versioned scoring rules
+
+Revision ID: a2c6e8f04b13
+Revises: 7d3e5a1c9b62
+Create Date: 2026-10-18 15:04:51.226310
+
+"""
+from datetime import datetime
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a2c6e8f04b13'
+down_revision = '7d3e5a1c9b62'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    scoring_rules = op.create_table('scoring_rules',
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('weights', sa.JSON(), nullable=False),
+    sa.Column('threshold', sa.Integer(), nullable=False),
+    sa.Column('note', sa.String(length=255), nullable=True),
+    sa.Column('created_by_id', sa.Integer(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('version')
+    )
+    # Version 1 is the rule every existing row was scored with: plain sum, flagged at 35
+    op.bulk_insert(scoring_rules, [{
+        'version': 1,
+        'weights': [1] * 10,
+        'threshold': 35,
+        'note': 'Original rule: unweighted sum of q1-q10.',
+        'created_by_id': None,
+        'created_at': datetime.utcnow(),
+    }])
+
+    with op.batch_alter_table('evaluations', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('scoring_version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade():
+    with op.batch_alter_table('evaluations', schema=None) as batch_op:
+        batch_op.drop_column('scoring_version')
+
+    op.drop_table('scoring_rules')
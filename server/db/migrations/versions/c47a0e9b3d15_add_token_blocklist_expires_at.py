@@ -0,0 +1,28 @@
+"""Add token_blocklist expires_at
+
+Revision ID: c47a0e9b3d15
+Revises: 8b2e4d6f1a90
+Create Date: 2026-10-18 11:40:52.904113
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c47a0e9b3d15'
+down_revision = '8b2e4d6f1a90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('expires_at', sa.DateTime(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_token_blocklist_expires_at'), ['expires_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('token_blocklist', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_token_blocklist_expires_at'))
+        batch_op.drop_column('expires_at')
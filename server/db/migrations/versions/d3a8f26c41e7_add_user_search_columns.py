@@ -0,0 +1,38 @@
+"""Add lowercased username/email columns for user search
+
+Revision ID: d3a8f26c41e7
+Revises: b5d17f3e9a26
+Create Date: 2026-10-18 18:02:37.551204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd3a8f26c41e7'
+down_revision = 'b5d17f3e9a26'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('username_lower', sa.String(length=80), nullable=True))
+        batch_op.add_column(sa.Column('email_lower', sa.String(length=120), nullable=True))
+
+    op.execute("UPDATE users SET username_lower = lower(username), email_lower = lower(email)")
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.alter_column('username_lower', existing_type=sa.String(length=80), nullable=False)
+        batch_op.alter_column('email_lower', existing_type=sa.String(length=120), nullable=False)
+        batch_op.create_index(batch_op.f('ix_users_username_lower'), ['username_lower'], unique=False)
+        batch_op.create_index(batch_op.f('ix_users_email_lower'), ['email_lower'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_users_email_lower'))
+        batch_op.drop_index(batch_op.f('ix_users_username_lower'))
+        batch_op.drop_column('email_lower')
+        batch_op.drop_column('username_lower')
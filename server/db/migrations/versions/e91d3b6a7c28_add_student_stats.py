@@ -0,0 +1,86 @@
+"""Add student_stats summary table
+
+Revision ID: e91d3b6a7c28
+Revises: c47a0e9b3d15
+Create Date: 2026-10-18 12:26:09.117482
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e91d3b6a7c28'
+down_revision = 'c47a0e9b3d15'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    student_stats = op.create_table('student_stats',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('evaluation_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Integer(), nullable=False),
+    sa.Column('latest_evaluation_id', sa.Integer(), nullable=True),
+    sa.Column('latest_score', sa.Integer(), nullable=True),
+    sa.Column('latest_submitted_at', sa.DateTime(), nullable=True),
+    sa.Column('open_alerts', sa.Integer(), nullable=False),
+    sa.Column('last_handled_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+
+    # Backfill one row per student from their existing evaluations
+    evaluations = sa.table(
+        'evaluations',
+        sa.column('id', sa.Integer),
+        sa.column('user_id', sa.Integer),
+        sa.column('submitted_at', sa.DateTime),
+        sa.column('total_score', sa.Integer),
+        sa.column('needs_support', sa.Boolean),
+        sa.column('handled_by_admin_id', sa.Integer),
+        sa.column('handled_at', sa.DateTime)
+    )
+    latest = sa.select(
+        evaluations.c.user_id,
+        evaluations.c.id,
+        evaluations.c.total_score,
+        evaluations.c.submitted_at,
+        sa.func.row_number().over(
+            partition_by=evaluations.c.user_id,
+            order_by=(evaluations.c.submitted_at.desc(), evaluations.c.id.desc())
+        ).label('recency')
+    ).subquery()
+    totals = sa.select(
+        evaluations.c.user_id,
+        sa.func.count(evaluations.c.id).label('evaluation_count'),
+        sa.func.sum(evaluations.c.total_score).label('score_sum'),
+        sa.func.sum(sa.case(
+            (evaluations.c.needs_support.is_(True) & evaluations.c.handled_by_admin_id.is_(None), 1),
+            else_=0
+        )).label('open_alerts'),
+        sa.func.max(evaluations.c.handled_at).label('last_handled_at')
+    ).group_by(evaluations.c.user_id).subquery()
+    op.execute(
+        student_stats.insert().from_select(
+            ['user_id', 'evaluation_count', 'score_sum', 'latest_evaluation_id', 'latest_score',
+             'latest_submitted_at', 'open_alerts', 'last_handled_at', 'updated_at'],
+            sa.select(
+                totals.c.user_id,
+                totals.c.evaluation_count,
+                totals.c.score_sum,
+                latest.c.id,
+                latest.c.total_score,
+                latest.c.submitted_at,
+                totals.c.open_alerts,
+                totals.c.last_handled_at,
+                sa.func.current_timestamp()
+            ).select_from(totals)
+            .join(latest, (latest.c.user_id == totals.c.user_id) & (latest.c.recency == 1))
+        )
+    )
+
+
+def downgrade():
+    op.drop_table('student_stats')
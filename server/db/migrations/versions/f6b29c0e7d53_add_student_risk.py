@@ -0,0 +1,44 @@
+"""Add student_risk early-warning state
+
+Revision ID: f6b29c0e7d53
+Revises: d3a8f26c41e7
+Create Date: 2026-10-18 19:10:42.803316
+
+Run `flask rebuild-student-risk` after upgrading to replay existing history.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f6b29c0e7d53'
+down_revision = 'd3a8f26c41e7'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('student_risk',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('observations', sa.Integer(), nullable=False),
+    sa.Column('ewma', sa.Float(), nullable=False),
+    sa.Column('slope', sa.Float(), nullable=False),
+    sa.Column('rise_streak', sa.Integer(), nullable=False),
+    sa.Column('projected_score', sa.Float(), nullable=False),
+    sa.Column('last_score', sa.Integer(), nullable=False),
+    sa.Column('last_evaluation_id', sa.Integer(), nullable=True),
+    sa.Column('last_submitted_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    with op.batch_alter_table('student_risk', schema=None) as batch_op:
+        batch_op.create_index('ix_student_risk_projected', ['projected_score', 'user_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('student_risk', schema=None) as batch_op:
+        batch_op.drop_index('ix_student_risk_projected')
+
+    op.drop_table('student_risk')
@@ -0,0 +1,12 @@
+# models/Counter.py
+from db.Burnout_Tracker import db
+
+class Counter(db.Model):
+    """Named integer counters maintained alongside the writes they summarize."""
+    __tablename__ = 'counters'
+
+    name = db.Column(db.String(64), primary_key=True)
+    value = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<Counter {self.name}={self.value}>"
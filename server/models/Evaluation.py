@@ -5,6 +5,21 @@ from datetime import datetime
 class Evaluation(db.Model):
     __tablename__ = 'evaluations'
 
+    QUESTION_FIELDS = ['q1', 'q2', 'q3', 'q4', 'q5', 'q6', 'q7', 'q8', 'q9', 'q10']
+    ANSWER_MIN = 1
+    ANSWER_MAX = 5
+    SUPPORT_THRESHOLD = 35
+    # The built-in rule (plain sum, SUPPORT_THRESHOLD), used until a ScoringRule row exists
+    DEFAULT_SCORING_VERSION = 1
+
+    __table_args__ = (
+        # ✅ Serves the admin alert queue: open (needs_support, unhandled) rows ordered by date
+        db.Index('ix_evaluations_alert_queue', 'needs_support', 'handled_by_admin_id', 'submitted_at'),
+        # ✅ Keyset pagination over one student's history and over the whole table
+        db.Index('ix_evaluations_user_submitted', 'user_id', 'submitted_at'),
+        db.Index('ix_evaluations_submitted_at', 'submitted_at'),
+    )
+
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), nullable=False)
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -22,6 +37,7 @@ class Evaluation(db.Model):
 
     total_score = db.Column(db.Integer, nullable=False)
     needs_support = db.Column(db.Boolean, default=False)
+    scoring_version = db.Column(db.Integer, nullable=False, default=DEFAULT_SCORING_VERSION, server_default='1')
 
     handled_by_admin_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=True)
     handled_at = db.Column(db.DateTime, nullable=True)
@@ -35,12 +51,20 @@ class Evaluation(db.Model):
     user = db.relationship('User', foreign_keys=[user_id])
     handled_by_admin = db.relationship('User', foreign_keys=[handled_by_admin_id])
 
-    def calculate_total_score(self):
-        self.total_score = sum([
+    def calculate_total_score(self, rule=None):
+        """Scores the answers with `rule` (a ScoringRule), or the built-in rule when None."""
+        answers = [
             self.q1, self.q2, self.q3, self.q4, self.q5,
             self.q6, self.q7, self.q8, self.q9, self.q10
-        ])
-        self.needs_support = self.total_score >= 35
+        ]
+        if rule is None:
+            self.total_score = sum(answers)
+            self.needs_support = self.total_score >= self.SUPPORT_THRESHOLD
+            self.scoring_version = self.DEFAULT_SCORING_VERSION
+            return
+        self.total_score = int(round(sum(w * a for w, a in zip(rule.weights, answers))))
+        self.needs_support = self.total_score >= rule.threshold
+        self.scoring_version = rule.version
 
     def to_dict(self):
         return {
@@ -49,6 +73,7 @@ class Evaluation(db.Model):
             "date": self.submitted_at.strftime("%Y-%m-%d"),
             "total_score": self.total_score,
             "needs_support": self.needs_support,
+            "scoring_version": self.scoring_version,
             "user": {
                 "id": self.user.id,
                 "username": self.user.username,
@@ -0,0 +1,34 @@
+# models/Job.py
+from db.Burnout_Tracker import db
+from datetime import datetime
+
+class Job(db.Model):
+    """A durable unit of background work; see utils/jobs.py for the runner."""
+    __tablename__ = 'jobs'
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+
+    __table_args__ = (
+        # ✅ Serves the claim query: the oldest due jobs of a queue
+        db.Index('ix_jobs_claim', 'status', 'queue', 'run_at'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    queue = db.Column(db.String(32), nullable=False, default='default')
+    kind = db.Column(db.String(64), nullable=False)
+    payload = db.Column(db.JSON, nullable=False, default=dict)
+    status = db.Column(db.String(16), nullable=False, default=QUEUED)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=5)
+    run_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    finished_at = db.Column(db.DateTime, nullable=True)
+    locked_by = db.Column(db.String(64), nullable=True)
+    last_error = db.Column(db.Text, nullable=True)
+
+    def __repr__(self):
+        return f"<Job {self.id} {self.kind} {self.status}>"
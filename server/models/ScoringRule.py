@@ -0,0 +1,27 @@
+# models/ScoringRule.py
+from db.Burnout_Tracker import db
+from datetime import datetime
+
+class ScoringRule(db.Model):
+    """One version of the rule that turns answers into total_score and needs_support.
+
+    Rows are never edited: a change is a new version, and the highest version is active.
+    """
+    __tablename__ = 'scoring_rules'
+
+    version = db.Column(db.Integer, primary_key=True)
+    weights = db.Column(db.JSON, nullable=False)  # one weight per question, in QUESTION_FIELDS order
+    threshold = db.Column(db.Integer, nullable=False)
+    note = db.Column(db.String(255), nullable=True)
+    created_by_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='SET NULL'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def to_dict(self):
+        return {
+            "version": self.version,
+            "weights": self.weights,
+            "threshold": self.threshold,
+            "note": self.note,
+            "created_by_id": self.created_by_id,
+            "created_at": self.created_at.isoformat() if self.created_at else None
+        }
@@ -0,0 +1,40 @@
+# models/StudentRisk.py
+from db.Burnout_Tracker import db
+from datetime import datetime
+
+class StudentRisk(db.Model):
+    """Streaming early-warning state per student, advanced once per submission (see utils/risk.py)."""
+    __tablename__ = 'student_risk'
+
+    __table_args__ = (
+        # ✅ Serves the rising-risk ranking
+        db.Index('ix_student_risk_projected', 'projected_score', 'user_id'),
+    )
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    observations = db.Column(db.Integer, nullable=False, default=0)
+    ewma = db.Column(db.Float, nullable=False)                      # smoothed total_score
+    slope = db.Column(db.Float, nullable=False, default=0.0)        # smoothed change of ewma per submission
+    rise_streak = db.Column(db.Integer, nullable=False, default=0)  # consecutive submissions above the previous one
+    projected_score = db.Column(db.Float, nullable=False)           # ewma extrapolated a few submissions ahead
+    last_score = db.Column(db.Integer, nullable=False)
+    last_evaluation_id = db.Column(db.Integer, nullable=True)
+    last_submitted_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    user = db.relationship('User', viewonly=True)
+
+    def __repr__(self):
+        return f"<StudentRisk user={self.user_id} ewma={self.ewma:.1f} slope={self.slope:+.2f}>"
+
+    def to_dict(self):
+        return {
+            "user_id": self.user_id,
+            "observations": self.observations,
+            "ewma": round(self.ewma, 2),
+            "slope": round(self.slope, 3),
+            "rise_streak": self.rise_streak,
+            "projected_score": round(self.projected_score, 2),
+            "last_score": self.last_score,
+            "last_submitted_at": self.last_submitted_at.isoformat() if self.last_submitted_at else None
+        }
@@ -0,0 +1,41 @@
+# models/StudentStats.py
+from db.Burnout_Tracker import db
+from datetime import datetime
+
+class StudentStats(db.Model):
+    """One summary row per student, kept in step with their evaluations."""
+    __tablename__ = 'student_stats'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id', ondelete='CASCADE'), primary_key=True)
+    evaluation_count = db.Column(db.Integer, nullable=False, default=0)
+    score_sum = db.Column(db.Integer, nullable=False, default=0)
+    latest_evaluation_id = db.Column(db.Integer, nullable=True)
+    latest_score = db.Column(db.Integer, nullable=True)
+    latest_submitted_at = db.Column(db.DateTime, nullable=True)
+    open_alerts = db.Column(db.Integer, nullable=False, default=0)  # needs_support and not yet handled
+    last_handled_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    @property
+    def average_score(self):
+        return round(self.score_sum / self.evaluation_count, 2) if self.evaluation_count else None
+
+    @property
+    def is_flagged(self):
+        return self.open_alerts > 0
+
+    def __repr__(self):
+        return f"<StudentStats user={self.user_id} count={self.evaluation_count}>"
+
+    def to_dict(self):
+        return {
+            "user_id": self.user_id,
+            "evaluation_count": self.evaluation_count,
+            "average_score": self.average_score,
+            "latest_score": self.latest_score,
+            "latest_evaluation_id": self.latest_evaluation_id,
+            "latest_submitted_at": self.latest_submitted_at.isoformat() if self.latest_submitted_at else None,
+            "open_alerts": self.open_alerts,
+            "is_flagged": self.is_flagged,
+            "last_handled_at": self.last_handled_at.isoformat() if self.last_handled_at else None
+        }
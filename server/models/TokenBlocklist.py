@@ -6,7 +6,8 @@ class TokenBlocklist(db.Model):
 
     id = db.Column(db.Integer, primary_key=True)
     jti = db.Column(db.String(36), nullable=False, unique=True)  # JWT ID (unique)
-    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)  # Resync watermark for the in-memory store
+    expires_at = db.Column(db.DateTime, nullable=True, index=True)  # When the revoked token would have expired
 
     def __repr__(self):
         return f"<TokenBlocklist jti={self.jti}>"
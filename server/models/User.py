@@ -1,7 +1,28 @@
 # models/User.py
 from db.Burnout_Tracker import db
-from werkzeug.security import generate_password_hash, check_password_hash
+from utils.password_hashing import password_hasher
 from datetime import datetime
+from sqlalchemy.dialects import mysql
+from sqlalchemy.orm import validates
+
+
+def _lowercase_of(column):
+    # Fills the search column on Core inserts too (seeding, benchmarks), which skip @validates
+    def default(context):
+        value = context.get_current_parameters().get(column)
+        return value.lower() if value is not None else None
+    return default
+
+
+def _binary_string(length):
+    # Byte-order comparisons everywhere (SQLite's default is already BINARY), which the
+    # range scans in utils/user_search.py rely on; the values are lowercased anyway
+    return (
+        db.String(length)
+        .with_variant(db.String(length, collation='C'), 'postgresql')
+        .with_variant(mysql.VARCHAR(length, charset='utf8mb4', collation='utf8mb4_bin'), 'mysql', 'mariadb')
+    )
+
 
 class User(db.Model):
     __tablename__ = 'users'
@@ -9,7 +30,10 @@ class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), unique=True, nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
-    password_hash = db.Column(db.String(128), nullable=False)
+    # ✅ Lowercased copies for indexed, case-insensitive prefix search (see utils/user_search.py)
+    username_lower = db.Column(_binary_string(80), nullable=False, index=True, default=_lowercase_of('username'))
+    email_lower = db.Column(_binary_string(120), nullable=False, index=True, default=_lowercase_of('email'))
+    password_hash = db.Column(db.String(255), nullable=False)
     role = db.Column(db.String(10), nullable=False, default='student')
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
@@ -24,11 +48,24 @@ class User(db.Model):
         foreign_keys='Evaluation.user_id'
     )
 
+    # ✅ Incrementally maintained summary (see utils/student_stats.py)
+    stats = db.relationship('StudentStats', uselist=False, cascade='all, delete-orphan', passive_deletes=True)
+    # ✅ Streaming early-warning state (see utils/risk.py)
+    risk = db.relationship('StudentRisk', uselist=False, cascade='all, delete-orphan', passive_deletes=True)
+
+    @validates('username', 'email')
+    def _keep_lowercase_copy(self, key, value):
+        setattr(self, f"{key}_lower", value.lower() if value is not None else None)
+        return value
+
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+
+    def password_needs_rehash(self):
+        return password_hasher.needs_rehash(self.password_hash)
 
     def is_admin(self):
         return self.role.lower() == 'admin'
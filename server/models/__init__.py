@@ -3,10 +3,20 @@ from db.Burnout_Tracker import db
 from .User import User
 from .TokenBlocklist import TokenBlocklist
 from .Evaluation import Evaluation
+from .StudentStats import StudentStats
+from .StudentRisk import StudentRisk
+from .Counter import Counter
+from .ScoringRule import ScoringRule
+from .Job import Job
 
 __all__ = [
     "db",
     "User",
     "TokenBlocklist",
-    "Evaluation"
+    "Evaluation",
+    "StudentStats",
+    "StudentRisk",
+    "Counter",
+    "ScoringRule",
+    "Job"
 ]
@@ -1,7 +1,11 @@
 from .user_routes import auth_bp
 from .evaluation_routes import evaluation_bp
+from .analytics_routes import analytics_bp
+from .scoring_routes import scoring_bp
 
 all_routes = [
     auth_bp,
-    evaluation_bp
-]
\ No newline at end of file
+    evaluation_bp,
+    analytics_bp,
+    scoring_bp
+]
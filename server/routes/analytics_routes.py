@@ -0,0 +1,55 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required
+from utils.analytics import cohort_analytics, cohort_score_trend
+from utils.auth_utils import role_required
+from utils.pagination import keyset_paginate, page_response
+from utils.query_counter import query_budget
+from utils.risk import MIN_RISK_OBSERVATIONS, rising_risk_query
+from models.StudentRisk import StudentRisk
+
+analytics_bp = Blueprint('analytics_bp', __name__)
+
+# ==================== COHORT ANALYTICS (Admin) ====================
+@analytics_bp.route('/analytics/cohort', methods=['GET'])
+@jwt_required()
+@role_required(['admin'])
+def get_cohort_analytics():
+    """Admin gets per-question, score and weekly support aggregates for the filtered cohort."""
+    return jsonify(cohort_analytics(request.args)), 200
+
+
+# ==================== COHORT SCORE TREND (Admin) ====================
+@analytics_bp.route('/analytics/trend', methods=['GET'])
+@jwt_required()
+@role_required(['admin'])
+def get_cohort_trend():
+    """Admin gets total_score per day/week/month bucket across the filtered cohort."""
+    return jsonify(cohort_score_trend(request.args)), 200
+
+
+# ==================== RISING RISK (Admin) ====================
+@analytics_bp.route('/analytics/rising-risk', methods=['GET'])
+@query_budget(4)
+@jwt_required()
+@role_required(['admin'])
+def get_rising_risk():
+    """Admin gets students whose smoothed score is climbing, highest projected score first."""
+    errors = {}
+    thresholds = {}
+    for name, default in (('min_observations', MIN_RISK_OBSERVATIONS), ('min_streak', 0)):
+        try:
+            thresholds[name] = int(request.args.get(name, default))
+            if thresholds[name] < 0:
+                raise ValueError
+        except ValueError:
+            errors[name] = "Must be a non-negative integer."
+    if errors:
+        return jsonify({"errors": errors}), 400
+
+    page = keyset_paginate(
+        rising_risk_query(**thresholds), [StudentRisk.projected_score, StudentRisk.user_id], request.args
+    )
+    return page_response([
+        dict(risk.to_dict(), username=risk.user.username, email=risk.user.email)
+        for risk in page.items
+    ], page), 200
@@ -1,13 +1,46 @@
-from flask import Blueprint, request, jsonify
-from flask_jwt_extended import jwt_required, get_jwt_identity
+from flask import Blueprint, Response, current_app, request, jsonify, stream_with_context
+from flask_jwt_extended import jwt_required, get_jwt, get_jwt_identity
 from datetime import datetime
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
 from models.Evaluation import Evaluation
 from models.User import User
+from models.StudentStats import StudentStats
 from db.Burnout_Tracker import db
+from utils.analytics import score_trend
 from utils.auth_utils import role_required
+from utils.bulk_actions import MEETING_FIELDS, bulk_delete, bulk_handle, bulk_set_meeting, parse_ids
+from utils.conditional import (
+    EVALUATIONS_VERSION, USERS_VERSION, conditional, touch_evaluations, user_evaluations_version
+)
+from utils.counters import UNHANDLED_EVALUATIONS, get_counter, increment_counter
+from utils.events import event_hub, iter_sse, role_channel, stream_tickets, user_channel
+from utils.export import EXPORT_FORMATS, iter_export
+from utils.jobs import enqueue
+from utils.jwt_blocklist import revoked_tokens
+from utils.importer import IMPORT_FORMATS, import_records, records_from_text
+from utils.pagination import filter_evaluations, keyset_paginate, page_response
+from utils.query_counter import query_budget
+from utils.risk import record_risk_submission, schedule_risk_rebuild
+from utils.scoring import get_active_rule
+from utils.serializers import serialize_evaluations, with_evaluation_relations
+from utils.student_stats import record_deletion, record_handled, record_submission
+from utils.user_cache import get_user_role
 
 evaluation_bp = Blueprint('evaluation_bp', __name__)
 
+
+def _my_evaluation_versions():
+    return [user_evaluations_version(get_jwt_identity().get("id")), USERS_VERSION]
+
+
+def _notification_versions():
+    current_user = get_jwt_identity()
+    if current_user.get("role") == 'admin':
+        return [UNHANDLED_EVALUATIONS]
+    return [user_evaluations_version(current_user.get("id"))]
+
+
 # ==================== SUBMIT NEW EVALUATION (Student) ====================
 @evaluation_bp.route('/evaluations', methods=['POST'])
 @jwt_required()
@@ -31,8 +64,15 @@ def submit_evaluation():
             q9=data.get('q9'),
             q10=data.get('q10'),
         )
-        evaluation.calculate_total_score()
+        evaluation.calculate_total_score(get_active_rule())
         db.session.add(evaluation)
+        db.session.flush()
+        record_submission(evaluation)
+        record_risk_submission(evaluation)
+        increment_counter(UNHANDLED_EVALUATIONS)
+        touch_evaluations([user_id])
+        if evaluation.needs_support:
+            enqueue('notify.new_alert', {"evaluation_id": evaluation.id})
         db.session.commit()
 
         return jsonify({
@@ -44,14 +84,96 @@ def submit_evaluation():
         return jsonify({"error": str(e)}), 500
 
 
+# ==================== BULK IMPORT EVALUATIONS (Admin) ====================
+@evaluation_bp.route('/evaluations/import', methods=['POST'])
+@jwt_required()
+@role_required(['admin'])
+def import_evaluations():
+    """Admin imports many evaluations from a JSON array, NDJSON or CSV body."""
+    import_format = request.args.get('format')
+    if not import_format:
+        if request.mimetype == 'text/csv':
+            import_format = 'csv'
+        elif request.mimetype == 'application/x-ndjson':
+            import_format = 'ndjson'
+        else:
+            import_format = 'json'
+
+    if import_format == 'json':
+        data = request.get_json(silent=True)
+        if isinstance(data, dict):
+            data = data.get('evaluations')
+        if not isinstance(data, list):
+            return jsonify({"error": "Expected a JSON array of evaluations."}), 400
+        records = [r if isinstance(r, dict) else {"_error": "Invalid JSON object."} for r in data]
+    elif import_format in IMPORT_FORMATS:
+        records = records_from_text(request.get_data(as_text=True), import_format)
+    else:
+        return jsonify({"error": "'format' must be 'json', 'ndjson' or 'csv'."}), 400
+
+    summary = import_records(records)
+    status = 201 if summary["imported"] else 400
+    return jsonify(summary), status
+
+
 # ==================== GET ALL EVALUATIONS (Admin) ====================
 @evaluation_bp.route('/evaluations', methods=['GET'])
+@query_budget(5)
 @jwt_required()
 @role_required(['admin'])
+@conditional(lambda: [EVALUATIONS_VERSION, USERS_VERSION])
 def get_all_evaluations():
-    """Admin retrieves all evaluations."""
-    evaluations = Evaluation.query.order_by(Evaluation.submitted_at.desc()).all()
-    return jsonify([e.to_dict() for e in evaluations]), 200
+    """Admin retrieves all evaluations, newest first, one page at a time."""
+    query = filter_evaluations(with_evaluation_relations(Evaluation.query), request.args)
+    page = keyset_paginate(query, [Evaluation.submitted_at, Evaluation.id], request.args)
+    return page_response(serialize_evaluations(page.items), page), 200
+
+
+# ==================== GET ALERT QUEUE (Admin) ====================
+@evaluation_bp.route('/evaluations/alerts', methods=['GET'])
+@query_budget(6)
+@jwt_required()
+@role_required(['admin'])
+@conditional(lambda: [EVALUATIONS_VERSION, USERS_VERSION])
+def get_alert_queue():
+    """Admin retrieves unhandled evaluations that need support, newest first."""
+    # Equality on the first two columns of ix_evaluations_alert_queue, then ordered by its third
+    query = (
+        Evaluation.query
+        .filter(Evaluation.needs_support.is_(True))
+        .filter(Evaluation.handled_by_admin_id.is_(None))
+    )
+    total = query.count()
+    page = keyset_paginate(
+        filter_evaluations(with_evaluation_relations(query), request.args),
+        [Evaluation.submitted_at, Evaluation.id],
+        request.args
+    )
+
+    response = page_response(serialize_evaluations(page.items), page)
+    response.headers['X-Total-Count'] = str(total)
+    return response, 200
+
+
+# ==================== EXPORT EVALUATIONS (Admin) ====================
+@evaluation_bp.route('/evaluations/export', methods=['GET'])
+@jwt_required()
+@role_required(['admin'])
+def export_evaluations():
+    """Admin streams every evaluation matching the list filters as NDJSON or CSV."""
+    export_format = request.args.get('format', 'ndjson').lower()
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"error": "'format' must be 'ndjson' or 'csv'."}), 400
+
+    # Build the generator now so filter errors become a 400 before streaming starts
+    chunks = iter_export(request.args, export_format)
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/x-ndjson'
+    filename = f"evaluations.{export_format}"
+    return Response(
+        stream_with_context(chunks),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
 
 
 # ==================== GET EVALUATION BY ID (Owner/Admin) ====================
@@ -75,14 +197,39 @@ def get_evaluation_by_id(evaluation_id):
 
 # ==================== GET MY EVALUATIONS (Student) ====================
 @evaluation_bp.route('/my-evaluations', methods=['GET'])
+@query_budget(3)
 @jwt_required()
+@conditional(_my_evaluation_versions)
 def get_my_evaluations():
     """Student retrieves all of their submitted evaluations."""
     current_user = get_jwt_identity()
     user_id = current_user.get("id")
 
-    evaluations = Evaluation.query.filter_by(user_id=user_id).order_by(Evaluation.submitted_at.desc()).all()
-    return jsonify([e.to_dict() for e in evaluations]), 200
+    query = filter_evaluations(with_evaluation_relations(Evaluation.query).filter_by(user_id=user_id), request.args)
+    page = keyset_paginate(query, [Evaluation.submitted_at, Evaluation.id], request.args)
+    return page_response(serialize_evaluations(page.items), page), 200
+
+
+# ==================== GET MY STATS (Student) ====================
+@evaluation_bp.route('/my-stats', methods=['GET'])
+@jwt_required()
+def get_my_stats():
+    """Student retrieves their evaluation summary (count, latest, average, flagged)."""
+    current_user = get_jwt_identity()
+    stats = db.session.get(StudentStats, current_user.get("id"))
+    if not stats:
+        return jsonify({"message": "No evaluations submitted yet."}), 404
+    return jsonify(stats.to_dict()), 200
+
+
+# ==================== GET MY SCORE TREND (Student) ====================
+@evaluation_bp.route('/my-trend', methods=['GET'])
+@query_budget(3)
+@jwt_required()
+@conditional(_my_evaluation_versions)
+def get_my_trend():
+    """Student gets their total_score per day/week/month bucket for charting."""
+    return jsonify(score_trend(request.args, user_id=get_jwt_identity().get("id"))), 200
 
 
 # ==================== DELETE EVALUATION (Admin) ====================
@@ -96,32 +243,67 @@ def delete_evaluation(evaluation_id):
         return jsonify({"error": "Evaluation not found."}), 404
 
     db.session.delete(evaluation)
+    db.session.flush()
+    record_deletion(evaluation)
+    schedule_risk_rebuild([evaluation.user_id])
+    if not evaluation.handled_by_admin_id:
+        increment_counter(UNHANDLED_EVALUATIONS, -1)
+    touch_evaluations([evaluation.user_id])
     db.session.commit()
     return jsonify({"message": "Evaluation deleted successfully."}), 200
 
 
 # ==================== GET EVALUATIONS BY USER ID (Admin) ====================
 @evaluation_bp.route('/evaluations/user/<int:user_id>', methods=['GET'])
+@query_budget(5)
 @jwt_required()
 @role_required(['admin'])
 def get_user_evaluations(user_id):
     """Admin gets all evaluations for a specific user by ID."""
-    evaluations = Evaluation.query.filter_by(user_id=user_id).order_by(Evaluation.submitted_at.asc()).all()
-    if not evaluations:
+    query = filter_evaluations(with_evaluation_relations(Evaluation.query).filter_by(user_id=user_id), request.args)
+    page = keyset_paginate(
+        query, [Evaluation.submitted_at, Evaluation.id], request.args, descending=False
+    )
+    if not page.items and not request.args.get('cursor'):
         return jsonify({"message": "No evaluations found for this user."}), 404
 
     result = []
-    for index, evaluation in enumerate(evaluations, start=1):
+    # The cursor carries how many rows came before this page, so numbering continues across pages
+    for index, evaluation in enumerate(page.items, start=page.offset + 1):
         eval_dict = evaluation.to_dict()
         eval_dict["evaluation_number"] = f"Evaluation {index}"
         eval_dict["is_alert"] = evaluation.needs_support
         result.append(eval_dict)
 
-    return jsonify(result), 200
+    return page_response(result, page), 200
+
+
+# ==================== GET STATS BY USER ID (Admin) ====================
+@evaluation_bp.route('/evaluations/user/<int:user_id>/stats', methods=['GET'])
+@jwt_required()
+@role_required(['admin'])
+def get_user_stats(user_id):
+    """Admin gets the evaluation summary for a specific user by ID."""
+    stats = db.session.get(StudentStats, user_id)
+    if not stats:
+        return jsonify({"message": "No evaluations found for this user."}), 404
+    return jsonify(stats.to_dict()), 200
+
+
+# ==================== GET SCORE TREND BY USER ID (Admin) ====================
+@evaluation_bp.route('/evaluations/user/<int:user_id>/trend', methods=['GET'])
+@query_budget(4)
+@jwt_required()
+@role_required(['admin'])
+@conditional(lambda user_id: [user_evaluations_version(user_id)])
+def get_user_trend(user_id):
+    """Admin gets a student's total_score per day/week/month bucket."""
+    return jsonify(score_trend(request.args, user_id=user_id)), 200
 
 
 # ==================== GET EVALUATIONS BY USERNAME (Admin) ====================
 @evaluation_bp.route('/evaluations/username/<string:username>', methods=['GET'])
+@query_budget(6)
 @jwt_required()
 @role_required(['admin'])
 def get_evaluations_by_username(username):
@@ -132,8 +314,9 @@ def get_evaluations_by_username(username):
     if user.role != 'student':
         return jsonify({"error": "Only student evaluations can be viewed."}), 400
 
-    evaluations = Evaluation.query.filter_by(user_id=user.id).order_by(Evaluation.submitted_at.desc()).all()
-    return jsonify([e.to_dict() for e in evaluations]), 200
+    query = filter_evaluations(with_evaluation_relations(Evaluation.query).filter_by(user_id=user.id), request.args)
+    page = keyset_paginate(query, [Evaluation.submitted_at, Evaluation.id], request.args)
+    return page_response(serialize_evaluations(page.items), page), 200
 
 
 # ==================== SET MEETING FOR EVALUATION (Admin) ====================
@@ -155,6 +338,8 @@ def set_meeting_for_evaluation(evaluation_id):
     evaluation.meeting_time = data['time']
     evaluation.meeting_day = data['day']
     evaluation.meeting_date = data['date']
+    touch_evaluations([evaluation.user_id])
+    enqueue('notify.meeting_set', {"evaluation_id": evaluation.id})
     db.session.commit()
 
     return jsonify({
@@ -178,13 +363,70 @@ def mark_evaluation_handled(evaluation_id):
     if evaluation.handled_by_admin_id:
         return jsonify({"message": "Evaluation already handled."}), 200
 
-    evaluation.handled_by_admin_id = current_user.get("id")
-    evaluation.handled_at = datetime.utcnow()
+    # Conditional, like bulk_handle: of two admins handling at once, only one UPDATE matches
+    admin_id = current_user.get("id")
+    handled_at = datetime.utcnow()
+    result = db.session.execute(
+        update(Evaluation)
+        .where(Evaluation.id == evaluation.id, Evaluation.handled_by_admin_id.is_(None))
+        .values(handled_by_admin_id=admin_id, handled_at=handled_at),
+        execution_options={"synchronize_session": False}
+    )
+    if result.rowcount == 0:
+        db.session.rollback()
+        return jsonify({"message": "Evaluation already handled."}), 200
+
+    # Mirror the UPDATE onto the loaded row without queueing a second write
+    set_committed_value(evaluation, 'handled_by_admin_id', admin_id)
+    set_committed_value(evaluation, 'handled_at', handled_at)
+    record_handled(evaluation)
+    increment_counter(UNHANDLED_EVALUATIONS, -1)
+    touch_evaluations([evaluation.user_id])
+    enqueue('notify.evaluation_handled', {"evaluation_id": evaluation.id})
     db.session.commit()
 
     return jsonify({"message": "Evaluation marked as handled."}), 200
 
 
+# ==================== BULK ACTIONS (Admin) ====================
+@evaluation_bp.route('/evaluations/bulk/handle', methods=['PATCH'])
+@jwt_required()
+@role_required(['admin'])
+def bulk_mark_evaluations_handled():
+    """Admin marks many evaluations as handled; returns an outcome per id."""
+    data = request.get_json(silent=True) or {}
+    ids, error = parse_ids(data.get('ids'))
+    if error:
+        return jsonify({"errors": {"ids": error}}), 400
+    return jsonify(bulk_handle(ids, get_jwt_identity().get("id"))), 200
+
+
+@evaluation_bp.route('/evaluations/bulk/set-meeting', methods=['PATCH'])
+@jwt_required()
+@role_required(['admin'])
+def bulk_set_meeting_for_evaluations():
+    """Admin assigns the same meeting to many evaluations; returns an outcome per id."""
+    data = request.get_json(silent=True) or {}
+    ids, error = parse_ids(data.get('ids'))
+    if error:
+        return jsonify({"errors": {"ids": error}}), 400
+    if not all(data.get(field) for field in MEETING_FIELDS):
+        return jsonify({"error": "All meeting details (place, time, day, date) are required."}), 400
+    return jsonify(bulk_set_meeting(ids, data)), 200
+
+
+@evaluation_bp.route('/evaluations/bulk/delete', methods=['POST'])
+@jwt_required()
+@role_required(['admin'])
+def bulk_delete_evaluations():
+    """Admin deletes many evaluations; returns an outcome per id."""
+    data = request.get_json(silent=True) or {}
+    ids, error = parse_ids(data.get('ids'))
+    if error:
+        return jsonify({"errors": {"ids": error}}), 400
+    return jsonify(bulk_delete(ids)), 200
+
+
 # ==================== GET LATEST STUDENT MEETING INFO ====================
 @evaluation_bp.route('/evaluations/student/meeting', methods=['GET'])
 @jwt_required()
@@ -224,6 +466,7 @@ def get_student_meeting_info():
 
 @evaluation_bp.route('/notifications', methods=['GET'])
 @jwt_required()
+@conditional(_notification_versions)
 def get_notifications():
     """Returns notifications for the current user based on role."""
     current_user = get_jwt_identity()
@@ -255,7 +498,7 @@ def get_notifications():
             })
 
     elif role == 'admin':
-        unhandled = Evaluation.query.filter_by(handled_by_admin_id=None).count()
+        unhandled = get_counter(UNHANDLED_EVALUATIONS)
         if unhandled > 0:
             notifications.append({
                 "type": "pending_evaluations",
@@ -264,13 +507,66 @@ def get_notifications():
 
     return jsonify(notifications), 200
 
-# ==================== CREATE NOTIFICATION (Test Route) ====================
+# ==================== NOTIFICATION STREAM (SSE) ====================
+@evaluation_bp.route('/notifications/stream-ticket', methods=['POST'])
+@jwt_required()
+def create_stream_ticket():
+    """Issues a short-lived, single-use ticket for opening the notification stream."""
+    ticket = stream_tickets.issue(get_jwt_identity(), get_jwt().get("jti"))
+    return jsonify({"ticket": ticket, "expires_in": current_app.config['STREAM_TICKET_TTL']}), 201
+
+
+# EventSource cannot set headers, so browsers pass ?ticket=<ticket> from the route above
+@evaluation_bp.route('/notifications/stream', methods=['GET'])
+@jwt_required(optional=True)
+def stream_notifications():
+    """Pushes meeting, handled and alert events to the current user as Server-Sent Events."""
+    current_user = get_jwt_identity()
+    if current_user is None:
+        claims = stream_tickets.redeem(request.args.get('ticket', ''))
+        # A logout revokes the access token, and with it any ticket issued under it
+        if claims is None or revoked_tokens.is_revoked(claims["jti"]):
+            return jsonify({"error": "Invalid or expired stream ticket."}), 401
+        current_user = claims
+    user = get_user_role(current_user.get("id"))
+    if not user or not user.is_active:
+        return jsonify({"error": "Your account has been suspended."}), 403
+
+    channels = [user_channel(current_user.get("id")), role_channel(user.role)]
+    subscription = event_hub.subscribe(channels)
+
+    return Response(
+        iter_sse(subscription),
+        mimetype='text/event-stream',
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# ==================== SEND NOTIFICATION (Admin) ====================
 @evaluation_bp.route('/notifications', methods=['POST'])
 @jwt_required()
+@role_required(['admin'])
 def create_notification():
-    """Test route to simulate creating a notification."""
-    data = request.get_json()
-    return jsonify({
-        "message": "Notification received.",
-        "data": data
-    }), 201
+    """Admin sends a message to the student behind an evaluation; delivered in the background."""
+    data = request.get_json() or {}
+    errors = {}
+    evaluation_id = data.get('evaluation_id')
+    message = data.get('message')
+    if not isinstance(evaluation_id, int) or isinstance(evaluation_id, bool):
+        errors['evaluation_id'] = "Must be an evaluation id."
+    if not isinstance(message, str) or not message.strip():
+        errors['message'] = "Must be a non-empty string."
+    elif len(message) > 2000:
+        errors['message'] = "Must be at most 2000 characters."
+    if errors:
+        return jsonify({"errors": errors}), 400
+
+    if db.session.get(Evaluation, evaluation_id) is None:
+        return jsonify({"error": "Evaluation not found."}), 404
+
+    job = enqueue('notify.message', {
+        "evaluation_id": evaluation_id,
+        "message": message.strip(),
+        "created_at": datetime.utcnow().isoformat()
+    })
+    db.session.commit()
+    return jsonify({"message": "Notification queued.", "job_id": job.id}), 202
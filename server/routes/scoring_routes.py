@@ -0,0 +1,55 @@
+from flask import Blueprint, request, jsonify
+from flask_jwt_extended import jwt_required, get_jwt_identity
+from models.ScoringRule import ScoringRule
+from db.Burnout_Tracker import db
+from utils.auth_utils import role_required
+from utils.scoring import count_stale, create_rule, rule_version, validate_rule
+
+scoring_bp = Blueprint('scoring_bp', __name__)
+
+# ==================== LIST SCORING RULES (Admin) ====================
+@scoring_bp.route('/scoring-rules', methods=['GET'])
+@jwt_required()
+@role_required(['admin'])
+def get_scoring_rules():
+    """Admin gets every scoring rule version and how many evaluations the active one has not scored yet."""
+    rules = db.session.query(ScoringRule).order_by(ScoringRule.version.desc()).all()
+    active_version = rule_version(rules[0] if rules else None)
+    return jsonify({
+        "active_version": active_version,
+        "stale_evaluations": count_stale(active_version),
+        "rules": [rule.to_dict() for rule in rules]
+    }), 200
+
+
+# ==================== CREATE SCORING RULE (Admin) ====================
+@scoring_bp.route('/scoring-rules', methods=['POST'])
+@jwt_required()
+@role_required(['admin'])
+def create_scoring_rule():
+    """Admin publishes a new scoring rule version; new submissions use it immediately.
+
+    Existing evaluations keep their scores until `flask rescore-evaluations` is run.
+    """
+    data = request.get_json() or {}
+    errors = validate_rule(data)
+    if errors:
+        return jsonify({"errors": errors}), 400
+
+    try:
+        rule = create_rule(
+            weights=data['weights'],
+            threshold=data['threshold'],
+            note=data.get('note'),
+            created_by_id=get_jwt_identity().get("id")
+        )
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"error": str(e)}), 500
+
+    return jsonify({
+        "message": "Scoring rule created. Run `flask rescore-evaluations` to apply it to existing evaluations.",
+        "rule": rule.to_dict(),
+        "stale_evaluations": count_stale(rule.version)
+    }), 201
@@ -1,12 +1,22 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request, jsonify
+from datetime import datetime
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt
 from models.User import User
-from models.TokenBlocklist import TokenBlocklist
+from models.Evaluation import Evaluation
 from db.Burnout_Tracker import db
 from utils.auth_utils import role_required
-from utils.jwt_blocklist import jwt_blocklist
+from utils.conditional import EVALUATIONS_VERSION, USERS_VERSION, conditional, touch_evaluations, touch_users
+from utils.counters import UNHANDLED_EVALUATIONS, increment_counter
+from utils.jwt_blocklist import revoked_tokens
 from utils.validators import is_strong_password, is_valid_email
 from utils.validators import validate_user_data
+from utils.pagination import keyset_paginate, page_response
+from utils.query_counter import query_budget
+from utils.serializers import serialize_users, with_user_stats
+from utils.user_cache import user_role_cache
+from utils.password_hashing import password_hasher
+from utils.jobs import job_stats
+from utils.user_search import DEFAULT_SEARCH_LIMIT, MAX_SEARCH_LIMIT, search_users
 
 auth_bp = Blueprint('auth_bp', __name__)
 
@@ -45,6 +55,7 @@ def signup():
     new_user = User(username=username, email=email, role=role)
     new_user.set_password(password)
     db.session.add(new_user)
+    touch_users()
     db.session.commit()
 
     return jsonify({
@@ -72,6 +83,13 @@ def login():
     if not user or not user.check_password(password):
         return jsonify({"error": "Invalid username/email or password."}), 401
 
+    # Upgrade hashes made with older KDF parameters while we have the plaintext
+    if user.password_needs_rehash():
+        user.set_password(password)
+        # The row's updated_at changes, so ETag'd user lists must revalidate
+        touch_users()
+        db.session.commit()
+
     access_token = create_access_token(identity={
         "id": user.id,
         "role": user.role,
@@ -92,19 +110,17 @@ def logout():
     try:
         jwt_data = get_jwt()
         jti = jwt_data.get("jti")
-        print(f"[DEBUG] JWT data: {jwt_data}")
-        print(f"[DEBUG] JTI: {jti}")
+        current_app.logger.debug("Logout: revoking jti %s", jti)
 
         if not jti:
             return jsonify({"error": "Token does not contain a jti"}), 400
 
-        blocked_token = TokenBlocklist(jti=jti)
-        db.session.add(blocked_token)
-        db.session.commit()
+        expires_at = datetime.utcfromtimestamp(jwt_data["exp"]) if jwt_data.get("exp") else None
+        revoked_tokens.revoke(jti, expires_at)
         return jsonify({"message": "Successfully logged out"}), 200
 
     except Exception as e:
-        print(f"[ERROR] Logout failed: {e}")
+        current_app.logger.exception("Logout failed")
         return jsonify({"error": str(e)}), 500
     
 # ===== Get a user by username =====
@@ -131,11 +147,42 @@ def staff_only_route():
     return jsonify({"message": "You are a student!"})
 
 @auth_bp.route('/users', methods=['GET'])
+@query_budget(4)
 @jwt_required()
 @role_required(['admin'])  # Or remove if not admin-only
+@conditional(lambda: [USERS_VERSION, EVALUATIONS_VERSION])
 def get_all_users():
-    users = User.query.all()
-    return jsonify([user.to_dict() for user in users]), 200
+    page = keyset_paginate(with_user_stats(User.query), [User.id], request.args, descending=False)
+    return page_response(serialize_users(page.items), page), 200
+
+# ==================== SEARCH USERS (Admin) ====================
+@auth_bp.route('/users/search', methods=['GET'])
+@query_budget(7)
+@jwt_required()
+@role_required(['admin'])
+def search_users_route():
+    """Ranked prefix (and, if indexed, fuzzy) search over usernames and emails."""
+    errors = {}
+    term = request.args.get('q', '').strip()
+    if not term:
+        errors['q'] = "Required."
+    elif len(term) > 120:
+        errors['q'] = "Must be at most 120 characters."
+    try:
+        limit = int(request.args.get('limit', DEFAULT_SEARCH_LIMIT))
+        if not 1 <= limit <= MAX_SEARCH_LIMIT:
+            raise ValueError
+    except ValueError:
+        errors['limit'] = f"Must be an integer between 1 and {MAX_SEARCH_LIMIT}."
+    role = request.args.get('role')
+    if role is not None and role.lower() not in ('admin', 'student'):
+        errors['role'] = "Must be 'admin' or 'student'."
+    if errors:
+        return jsonify({"errors": errors}), 400
+
+    fuzzy = request.args.get('fuzzy', 'true').lower() not in ('0', 'false', 'no')
+    results = search_users(term, limit=limit, role=role.lower() if role else None, fuzzy=fuzzy)
+    return jsonify({"query": term, "results": results}), 200
 
 @auth_bp.route('/users/<int:user_id>', methods=['GET'])
 @jwt_required()
@@ -173,7 +220,9 @@ def update_user(user_id):
             }), 400
         user.set_password(password)
 
+    touch_users()
     db.session.commit()
+    user_role_cache.invalidate(user_id)
     return jsonify({"message": "User updated successfully", "user": user.to_dict()}), 200
 
 @auth_bp.route('/users/<int:user_id>', methods=['DELETE'])
@@ -184,16 +233,29 @@ def delete_user(user_id):
     if not user:
         return jsonify({"error": "User not found."}), 404
 
+    # The user's evaluations go with them (ON DELETE CASCADE), so take them off the counter
+    unhandled = (
+        Evaluation.query
+        .filter_by(user_id=user_id)
+        .filter(Evaluation.handled_by_admin_id.is_(None))
+        .count()
+    )
     db.session.delete(user)
+    increment_counter(UNHANDLED_EVALUATIONS, -unhandled)
+    touch_users()
+    touch_evaluations([user_id])
     db.session.commit()
+    user_role_cache.invalidate(user_id)
     return jsonify({"message": "User deleted successfully."}), 200
 
 @auth_bp.route('/users/role/<string:role>', methods=['GET'])
+@query_budget(4)
 @jwt_required()
 @role_required(['admin'])  # Optional
 def get_users_by_role(role):
-    users = User.query.filter_by(role=role.lower()).all()
-    return jsonify([user.to_dict() for user in users]), 200
+    query = with_user_stats(User.query).filter_by(role=role.lower())
+    page = keyset_paginate(query, [User.id], request.args, descending=False)
+    return page_response(serialize_users(page.items), page), 200
 
 # ==================== SUSPEND OR ACTIVATE USER ====================
 @auth_bp.route('/users/<int:user_id>/status', methods=['PATCH'])
@@ -211,10 +273,36 @@ def update_user_status(user_id):
         return jsonify({"error": "'is_active' field is required."}), 400
 
     user.is_active = bool(is_active)
+    touch_users()
     db.session.commit()
+    user_role_cache.invalidate(user_id)
 
     status = "activated" if user.is_active else "suspended"
     return jsonify({
         "message": f"User {status} successfully.",
         "user": user.to_dict()
     }), 200
+
+# ==================== ROLE CACHE STATS (Admin) ====================
+@auth_bp.route('/cache-stats', methods=['GET'])
+@jwt_required()
+@role_required(['admin'])
+def get_cache_stats():
+    return jsonify({"user_roles": user_role_cache.stats()}), 200
+
+# ==================== PASSWORD HASHING STATS (Admin) ====================
+@auth_bp.route('/hashing-stats', methods=['GET'])
+@jwt_required()
+@role_required(['admin'])
+def get_hashing_stats():
+    return jsonify(password_hasher.stats()), 200
+
+# ==================== BACKGROUND JOB STATS (Admin) ====================
+@auth_bp.route('/job-stats', methods=['GET'])
+@jwt_required()
+@role_required(['admin'])
+def get_job_stats():
+    runner = current_app.extensions.get('job_runner')
+    stats = job_stats()
+    stats["embedded_runner"] = runner.stats() if runner else None
+    return jsonify(stats), 200
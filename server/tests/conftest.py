@@ -0,0 +1,45 @@
+import os
+import sys
+import tempfile
+import pytest
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+
+# app.py configures itself from the environment at import time
+_db_dir = tempfile.mkdtemp(prefix='burnout-tests-')
+os.environ['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(_db_dir, 'test.db')}"
+os.environ.setdefault('JWT_SECRET_KEY', 'test-jwt-secret-key-that-is-long-enough-for-hs256')
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
+os.environ.setdefault('JWT_ACCESS_TOKEN_EXPIRES', '3600')
+os.environ['PASSWORD_HASH_WORKERS'] = '0'
+os.environ['JOBS_EMBEDDED_WORKER'] = 'false'
+os.environ['SQL_QUERY_COUNT_HEADER'] = 'true'
+
+from app import app as flask_app  # noqa: E402
+from db.Burnout_Tracker import db  # noqa: E402
+from utils.analytics import clear_analytics_cache  # noqa: E402
+from utils.user_cache import user_role_cache  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app():
+    # TESTING makes query_budget raise instead of log
+    flask_app.config.update(TESTING=True, JWT_VERIFY_SUB=False)
+    return flask_app
+
+
+@pytest.fixture(autouse=True)
+def database(app):
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        clear_analytics_cache()
+        user_role_cache.clear()
+        yield db
+        db.session.remove()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,32 @@
+"""Factories shared by the test modules; they flush but leave committing to the caller."""
+from flask_jwt_extended import create_access_token
+from db.Burnout_Tracker import db
+from models import Evaluation, User
+from utils.conditional import touch_evaluations, touch_users
+
+
+def make_user(username, role='student'):
+    user = User(username=username, email=f"{username}@campus.edu", role=role)
+    # Skips the (deliberately slow) password hash; these users never log in
+    user.password_hash = '-'
+    db.session.add(user)
+    db.session.flush()
+    touch_users()
+    return user
+
+
+def make_evaluations(user, count, answer=5):
+    evaluations = []
+    for _ in range(count):
+        evaluation = Evaluation(user_id=user.id, **{f"q{i}": answer for i in range(1, 11)})
+        evaluation.calculate_total_score()
+        evaluations.append(evaluation)
+    db.session.add_all(evaluations)
+    db.session.flush()
+    touch_evaluations([user.id])
+    return evaluations
+
+
+def auth_headers(user):
+    token = create_access_token(identity={"id": user.id, "role": user.role, "username": user.username})
+    return {"Authorization": f"Bearer {token}"}
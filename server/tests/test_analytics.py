@@ -0,0 +1,29 @@
+"""Cohort histograms cover every total, including ones outside the current answer scale."""
+import numpy as np
+import pytest
+from utils.analytics import HISTOGRAM_BIN_WIDTH, compute_cohort_analytics
+
+
+def columns_for(totals):
+    count = len(totals)
+    return {
+        "answers": np.ones((count, 10), dtype=np.int64),
+        "total_score": np.array(totals, dtype=np.int64),
+        "needs_support": np.zeros(count, dtype=bool),
+        "submitted_at": np.array(['2026-01-05T10:00:00'] * count, dtype='datetime64[s]')
+    }
+
+
+@pytest.mark.parametrize('totals, first_edge, last_edge', [
+    ([10, 27, 50], 10, 50),
+    ([3, 12, 50], 0, 50),
+    ([10, 52, 61], 10, 65),
+    ([0, 100], 0, 100),
+])
+def test_histogram_counts_every_total(totals, first_edge, last_edge):
+    histogram = compute_cohort_analytics(columns_for(totals))["score_histogram"]
+
+    assert sum(bin_["count"] for bin_ in histogram) == len(totals)
+    assert histogram[0]["min"] == first_edge
+    assert histogram[-1]["max"] == last_edge
+    assert all(bin_["max"] - bin_["min"] == HISTOGRAM_BIN_WIDTH for bin_ in histogram)
@@ -0,0 +1,26 @@
+"""The export command rejects bad filters cleanly, before touching the output file."""
+import json
+from db.Burnout_Tracker import db
+from tests.helpers import make_evaluations, make_user
+
+
+def test_invalid_date_is_reported_without_a_traceback(app, tmp_path):
+    output = tmp_path / 'export.ndjson'
+    output.write_text('previous export\n')
+
+    result = app.test_cli_runner().invoke(args=['export-evaluations', '--from', 'yesterday', '-o', str(output)])
+
+    assert result.exit_code == 1
+    assert "Error: 'from' must be an ISO date or datetime." in result.output
+    assert output.read_text() == 'previous export\n'
+
+
+def test_exports_filtered_evaluations(app, tmp_path):
+    make_evaluations(make_user('student'), 3)
+    db.session.commit()
+    output = tmp_path / 'export.ndjson'
+
+    result = app.test_cli_runner().invoke(args=['export-evaluations', '--from', '2000-01-01', '-o', str(output)])
+
+    assert result.exit_code == 0, result.output
+    assert len([json.loads(line) for line in output.read_text().splitlines()]) == 3
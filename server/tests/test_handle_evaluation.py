@@ -0,0 +1,50 @@
+"""Marking an evaluation handled must count it once, even when two admins race."""
+from sqlalchemy import update
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.StudentStats import StudentStats
+from utils.counters import UNHANDLED_EVALUATIONS, check_counters, get_counter
+from utils.student_stats import refresh_student_stats
+from tests.helpers import auth_headers, make_evaluations, make_user
+
+
+def setup_alert():
+    admin = make_user('admin', role='admin')
+    other = make_user('other-admin', role='admin')
+    student = make_user('student')
+    evaluation = make_evaluations(student, 1)[0]
+    refresh_student_stats([student.id])
+    db.session.commit()
+    check_counters(repair=True)
+    return admin, other, student, evaluation
+
+
+def test_handles_once(client):
+    admin, _, student, evaluation = setup_alert()
+    url = f'/api/evaluations/{evaluation.id}/handle'
+
+    first = client.patch(url, headers=auth_headers(admin))
+    second = client.patch(url, headers=auth_headers(admin))
+
+    assert first.json == {"message": "Evaluation marked as handled."}
+    assert second.json == {"message": "Evaluation already handled."}
+    assert get_counter(UNHANDLED_EVALUATIONS) == 0
+    assert db.session.get(StudentStats, student.id).open_alerts == 0
+
+
+def test_loses_the_race_to_another_admin(client):
+    admin, other, student, evaluation = setup_alert()
+    # Loaded before the other admin's write lands, as in a request that read the row first
+    assert db.session.get(Evaluation, evaluation.id).handled_by_admin_id is None
+    with db.engine.begin() as connection:
+        connection.execute(
+            update(Evaluation).where(Evaluation.id == evaluation.id).values(handled_by_admin_id=other.id)
+        )
+
+    response = client.patch(f'/api/evaluations/{evaluation.id}/handle', headers=auth_headers(admin))
+
+    assert response.json == {"message": "Evaluation already handled."}
+    db.session.expire_all()
+    assert db.session.get(Evaluation, evaluation.id).handled_by_admin_id == other.id
+    # The other admin's request owns the decrement; this one must not take it too
+    assert get_counter(UNHANDLED_EVALUATIONS) == 1
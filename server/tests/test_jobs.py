@@ -0,0 +1,131 @@
+"""The durable job queue: transactional enqueue, exclusive claims, retries and recovery."""
+import threading
+from datetime import datetime, timedelta
+from db.Burnout_Tracker import db
+from models.Job import Job
+from utils.jobs import (
+    JobRunner, backoff_seconds, claim_jobs, enqueue, job_handler, prune_finished_jobs, requeue_stale_jobs
+)
+
+TEST_QUEUE = 'test'
+calls = []
+
+
+@job_handler('test.record', queue=TEST_QUEUE)
+def record_job(payload):
+    calls.append(payload["n"])
+
+
+@job_handler('test.fail', queue=TEST_QUEUE, max_attempts=2)
+def failing_job(payload):
+    raise RuntimeError('handler failed')
+
+
+def test_job_enqueued_in_a_rolled_back_transaction_never_appears():
+    enqueue('test.record', {"n": 1})
+    db.session.rollback()
+
+    assert Job.query.count() == 0
+    assert claim_jobs([TEST_QUEUE], 10, 'worker') == []
+
+
+def test_concurrent_claims_never_share_a_job(app):
+    for n in range(40):
+        enqueue('test.record', {"n": n})
+    db.session.commit()
+    claimed = []
+    lock = threading.Lock()
+
+    def worker(name):
+        # Each app context gets its own session, like separate worker threads or processes
+        with app.app_context():
+            while True:
+                jobs = claim_jobs([TEST_QUEUE], 3, name)
+                if not jobs:
+                    break
+                with lock:
+                    claimed.extend(job.id for job in jobs)
+
+    threads = [threading.Thread(target=worker, args=(f"worker-{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(claimed) == 40
+    assert len(set(claimed)) == 40
+
+
+def test_failing_job_backs_off_then_fails_after_max_attempts(app):
+    job = enqueue('test.fail')
+    db.session.commit()
+    job_id = job.id
+    runner = JobRunner(app, queues=[TEST_QUEUE], concurrency=1)
+
+    before = datetime.utcnow()
+    runner.run(burst=True)
+    db.session.expire_all()
+    job = db.session.get(Job, job_id)
+    assert (job.status, job.attempts) == (Job.QUEUED, 1)
+    assert job.run_at >= before + timedelta(seconds=backoff_seconds(1))
+    assert 'handler failed' in job.last_error
+
+    # Not due yet: a second burst leaves it alone
+    runner.run(burst=True)
+    db.session.expire_all()
+    assert db.session.get(Job, job_id).attempts == 1
+
+    job.run_at = datetime.utcnow()
+    db.session.commit()
+    runner.run(burst=True)
+    db.session.expire_all()
+    job = db.session.get(Job, job_id)
+    assert (job.status, job.attempts) == (Job.FAILED, 2)
+    assert job.finished_at is not None
+    assert (runner.retried, runner.failed, runner.processed) == (1, 1, 0)
+
+
+def test_burst_runs_every_due_job():
+    from flask import current_app
+    del calls[:]
+    for n in range(5):
+        enqueue('test.record', {"n": n})
+    db.session.commit()
+
+    runner = JobRunner(current_app._get_current_object(), queues=[TEST_QUEUE], concurrency=2)
+    runner.run(burst=True)
+
+    assert sorted(calls) == [0, 1, 2, 3, 4]
+    assert Job.query.filter_by(status=Job.DONE).count() == 5
+
+
+def test_stale_running_jobs_are_requeued_or_failed():
+    long_ago = datetime.utcnow() - timedelta(hours=1)
+    retryable = Job(queue=TEST_QUEUE, kind='test.record', status=Job.RUNNING, attempts=1, max_attempts=5,
+                    started_at=long_ago, locked_by='dead-worker')
+    exhausted = Job(queue=TEST_QUEUE, kind='test.record', status=Job.RUNNING, attempts=5, max_attempts=5,
+                    started_at=long_ago, locked_by='dead-worker')
+    fresh = Job(queue=TEST_QUEUE, kind='test.record', status=Job.RUNNING, attempts=1, max_attempts=5,
+                started_at=datetime.utcnow(), locked_by='live-worker')
+    db.session.add_all([retryable, exhausted, fresh])
+    db.session.commit()
+
+    assert requeue_stale_jobs() == 1
+
+    db.session.expire_all()
+    assert (retryable.status, retryable.locked_by) == (Job.QUEUED, None)
+    assert exhausted.status == Job.FAILED
+    assert fresh.status == Job.RUNNING
+
+
+def test_prune_keeps_recent_and_unfinished_jobs():
+    now = datetime.utcnow()
+    db.session.add_all([
+        Job(queue=TEST_QUEUE, kind='test.record', status=Job.DONE, finished_at=now - timedelta(days=2)),
+        Job(queue=TEST_QUEUE, kind='test.record', status=Job.DONE, finished_at=now),
+        Job(queue=TEST_QUEUE, kind='test.fail', status=Job.FAILED, finished_at=now - timedelta(days=2)),
+    ])
+    db.session.commit()
+
+    assert prune_finished_jobs() == 1
+    assert Job.query.count() == 2
@@ -0,0 +1,56 @@
+"""FastJSONProvider must emit the same bytes with and without orjson."""
+import decimal
+import enum
+from collections import namedtuple
+from datetime import date, datetime
+import pytest
+from utils import json_provider
+from utils.json_provider import FastJSONProvider
+
+Point = namedtuple('Point', ['x', 'y'])
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+class Tag(str):
+    pass
+
+
+PAYLOAD = {
+    "name": "Zoë ✓",
+    "when": datetime(2025, 3, 4, 5, 6, 7),
+    "day": date(2025, 3, 4),
+    "score": decimal.Decimal("12.5"),
+    "point": Point(1, 2),
+    "level": Level.HIGH,
+    "tag": Tag("urgent"),
+    "nested": [{"b": 1, "a": None}],
+}
+
+
+def render(app, use_orjson, payload=PAYLOAD):
+    available = json_provider.orjson
+    json_provider.orjson = available if use_orjson else None
+    try:
+        with app.app_context():
+            return FastJSONProvider(app).response(payload).get_data()
+    finally:
+        json_provider.orjson = available
+
+
+@pytest.mark.skipif(json_provider.orjson is None, reason="orjson not installed")
+def test_orjson_and_stdlib_bodies_match(app):
+    assert render(app, True) == render(app, False)
+
+
+def test_datetimes_and_subclasses_keep_the_stock_format(app):
+    body = app.json.loads(render(app, json_provider.orjson is not None))
+
+    assert body["when"] == "Tue, 04 Mar 2025 05:06:07 GMT"
+    assert body["day"] == "Tue, 04 Mar 2025 00:00:00 GMT"
+    assert body["score"] == "12.5"
+    assert body["point"] == [1, 2]
+    assert body["level"] == 3
+    assert body["tag"] == "urgent"
@@ -0,0 +1,61 @@
+"""The in-memory revoked-token store must see every committed revocation."""
+from datetime import datetime, timedelta
+import pytest
+from db.Burnout_Tracker import db
+from models.TokenBlocklist import TokenBlocklist
+from utils.jwt_blocklist import RevokedTokenStore, prune_expired_tokens
+
+
+@pytest.fixture
+def store():
+    store = RevokedTokenStore(refresh_interval=30, default_ttl=3600)
+    store.refresh()
+    return store
+
+
+def insert_row(jti, created_at, expires_at=None):
+    db.session.add(TokenBlocklist(jti=jti, created_at=created_at, expires_at=expires_at))
+    db.session.commit()
+
+
+def resync(store):
+    store._next_refresh = 0
+    store.refresh()
+
+
+def test_picks_up_a_revocation_that_committed_late(store):
+    now = datetime.utcnow()
+    insert_row('newer', now, now + timedelta(hours=1))
+    resync(store)
+    # Stamped before 'newer' but committed after the store had already seen it
+    insert_row('late', now - timedelta(seconds=60), now + timedelta(hours=1))
+    resync(store)
+
+    assert store.is_revoked('newer')
+    assert store.is_revoked('late')
+
+
+def test_picks_up_a_revocation_that_reuses_a_pruned_id(app, store):
+    now = datetime.utcnow()
+    insert_row('kept', now - timedelta(hours=2), now + timedelta(hours=1))
+    insert_row('expired', now - timedelta(hours=2), now - timedelta(minutes=1))
+    resync(store)
+    pruned_id = TokenBlocklist.query.filter_by(jti='expired').one().id
+    assert prune_expired_tokens() == 1
+
+    insert_row('reused', datetime.utcnow(), now + timedelta(hours=1))
+    assert TokenBlocklist.query.filter_by(jti='reused').one().id == pruned_id
+    resync(store)
+
+    assert store.is_revoked('reused')
+
+
+def test_rows_without_expiry_get_the_default_ttl(store):
+    now = datetime.utcnow()
+    insert_row('legacy-old', now - timedelta(hours=2))
+    insert_row('legacy-recent', now - timedelta(minutes=5))
+    resync(store)
+
+    assert not store.is_revoked('legacy-old')
+    assert store.is_revoked('legacy-recent')
+    assert len(store) == 1
@@ -0,0 +1,61 @@
+"""The notification stream opens with a single-use ticket, never with a JWT in the URL."""
+from flask_jwt_extended import create_access_token
+from db.Burnout_Tracker import db
+from tests.helpers import make_user
+
+
+def login(user):
+    token = create_access_token(identity={"id": user.id, "role": user.role, "username": user.username})
+    return {"Authorization": f"Bearer {token}"}, token
+
+
+def open_stream(client, query):
+    response = client.get(f'/api/notifications/stream?{query}', buffered=False)
+    status = response.status_code
+    response.close()
+    return status
+
+
+def get_ticket(client, headers):
+    response = client.post('/api/notifications/stream-ticket', headers=headers)
+    assert response.status_code == 201
+    return response.json["ticket"]
+
+
+def test_ticket_opens_the_stream_once(client):
+    headers, _ = login(make_user('student'))
+    db.session.commit()
+    ticket = get_ticket(client, headers)
+
+    assert open_stream(client, f'ticket={ticket}') == 200
+    assert open_stream(client, f'ticket={ticket}') == 401
+
+
+def test_rejects_forged_tickets_and_query_string_tokens(client):
+    _, token = login(make_user('student'))
+    db.session.commit()
+
+    assert open_stream(client, 'ticket=not-a-ticket') == 401
+    assert open_stream(client, f'jwt={token}') == 401
+
+
+def test_logout_invalidates_outstanding_tickets(client):
+    headers, _ = login(make_user('student'))
+    db.session.commit()
+    ticket = get_ticket(client, headers)
+
+    assert client.post('/api/logout', headers=headers).status_code == 200
+    assert open_stream(client, f'ticket={ticket}') == 401
+
+
+def test_expired_ticket_is_rejected(app, client):
+    headers, _ = login(make_user('student'))
+    db.session.commit()
+    ticket = get_ticket(client, headers)
+
+    ttl = app.config['STREAM_TICKET_TTL']
+    app.config['STREAM_TICKET_TTL'] = -1
+    try:
+        assert open_stream(client, f'ticket={ticket}') == 401
+    finally:
+        app.config['STREAM_TICKET_TTL'] = ttl
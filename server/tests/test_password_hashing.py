@@ -0,0 +1,65 @@
+"""Hash parameters are compared after normalizing, and a stuck hash becomes a retryable 503."""
+import time
+import pytest
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, generate_password_hash
+from db.Burnout_Tracker import db
+from models.User import User
+from utils.conditional import USERS_VERSION, read_versions
+from utils.password_hashing import HashingBusy, PasswordHasher, normalize_method, password_hasher
+from tests.helpers import make_user
+
+
+@pytest.mark.parametrize('configured, stored', [
+    ('pbkdf2:sha256', f'pbkdf2:sha256:{DEFAULT_PBKDF2_ITERATIONS}'),
+    ('pbkdf2', f'pbkdf2:sha256:{DEFAULT_PBKDF2_ITERATIONS}'),
+    ('scrypt', 'scrypt:32768:8:1'),
+])
+def test_equivalent_methods_do_not_need_a_rehash(configured, stored):
+    hasher = PasswordHasher(method=configured)
+    assert not hasher.needs_rehash(f'{stored}$salt$digest')
+
+
+def test_real_hash_matches_its_short_method():
+    hasher = PasswordHasher(method='pbkdf2:sha256:1000')
+    assert not hasher.needs_rehash(generate_password_hash('secret', 'pbkdf2:sha256:1000'))
+    assert hasher.needs_rehash(generate_password_hash('secret', 'pbkdf2:sha256:2000'))
+    assert hasher.needs_rehash('not-a-werkzeug-hash')
+
+
+def test_configure_rejects_malformed_methods():
+    with pytest.raises(ValueError):
+        PasswordHasher().configure(method='scrypt:lots')
+    assert normalize_method('scrypt:16384:8:1') == ('scrypt', 16384, 8, 1)
+
+
+def test_timeout_is_reported_as_busy():
+    hasher = PasswordHasher(workers=1, max_pending=1, timeout=0.5)
+    try:
+        with pytest.raises(HashingBusy):
+            hasher._run(time.sleep, 2)
+        # The worker is still running the abandoned call, so it keeps holding its slot
+        assert hasher.stats()["queue_depth"] == 1
+        with pytest.raises(HashingBusy):
+            hasher._run(time.sleep, 0)
+        assert hasher.stats()["rejected"] == 1
+
+        deadline = time.monotonic() + 30
+        while hasher.stats()["queue_depth"] and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert hasher.stats()["queue_depth"] == 0
+        assert hasher._run(abs, -3) == 3
+    finally:
+        hasher.shutdown()
+
+
+def test_login_rehash_invalidates_user_list_etags(client):
+    user = make_user('student')
+    user.password_hash = generate_password_hash('Passw0rd!', 'pbkdf2:sha256:1000')
+    db.session.commit()
+    before = read_versions([USERS_VERSION])
+
+    response = client.post('/api/login', json={"username_or_email": 'student', "password": 'Passw0rd!'})
+
+    assert response.status_code == 200
+    assert not password_hasher.needs_rehash(db.session.get(User, user.id).password_hash)
+    assert read_versions([USERS_VERSION]) != before
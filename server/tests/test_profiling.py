@@ -0,0 +1,37 @@
+"""A request that raises must not leave its profiler enabled on the thread."""
+import os
+import pytest
+from flask import Flask
+from utils.profiling import init_request_profiling
+
+
+def make_app(tmp_path):
+    app = Flask(__name__)
+    # TESTING propagates the view's exception, so after_request never runs for it
+    app.config.update(TESTING=True, PROFILE_ENABLED=True, PROFILE_DIR=str(tmp_path), PROFILE_SAMPLE_RATE=1.0)
+
+    @app.route('/boom')
+    def boom():
+        raise RuntimeError('boom')
+
+    @app.route('/ok')
+    def ok():
+        return 'ok'
+
+    init_request_profiling(app)
+    return app
+
+
+def test_profiles_requests_after_one_that_raised(tmp_path):
+    app = make_app(tmp_path)
+    client = app.test_client()
+
+    with pytest.raises(RuntimeError):
+        client.get('/boom')
+    assert client.get('/ok').status_code == 200
+
+    names = sorted(os.listdir(tmp_path))
+    assert len(names) == 2
+    assert any('-boom.prof' in name for name in names)
+    assert any('-ok.prof' in name for name in names)
+
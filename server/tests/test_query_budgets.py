@@ -0,0 +1,67 @@
+"""Budgeted list endpoints must run a constant number of queries, however many rows they return."""
+import pytest
+from db.Burnout_Tracker import db
+from utils.risk import rebuild_student_risk
+from tests.helpers import auth_headers, make_evaluations, make_user
+
+ADMIN_ENDPOINTS = [
+    '/api/users',
+    '/api/users/search?q=stud',
+    '/api/users/role/student',
+    '/api/evaluations',
+    '/api/evaluations/alerts',
+    '/api/evaluations/user/{student_id}',
+    '/api/evaluations/user/{student_id}/trend',
+    '/api/evaluations/username/{student_name}',
+    '/api/analytics/rising-risk?min_observations=1',
+]
+STUDENT_ENDPOINTS = [
+    '/api/my-evaluations',
+    '/api/my-trend',
+]
+
+
+def add_students(count, evaluations_each, start=0):
+    students = [make_user(f"student{start + i}") for i in range(count)]
+    for student in students:
+        make_evaluations(student, evaluations_each)
+    rebuild_student_risk([s.id for s in students])
+    db.session.commit()
+    return students
+
+
+def query_count(client, url, headers):
+    # The first call warms per-process caches (roles, cached aggregates) so both runs compare like with like
+    client.get(url, headers=headers)
+    response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.get_data(as_text=True)
+    return int(response.headers['X-Query-Count'])
+
+
+@pytest.mark.parametrize('template', ADMIN_ENDPOINTS + STUDENT_ENDPOINTS)
+def test_query_count_does_not_grow_with_rows(client, template):
+    admin = make_user('admin', role='admin')
+    student = add_students(1, 2)[0]
+    db.session.commit()
+    headers = auth_headers(student if template in STUDENT_ENDPOINTS else admin)
+    url = template.format(student_id=student.id, student_name=student.username)
+
+    few = query_count(client, url, headers)
+    make_evaluations(student, 8)
+    add_students(6, 5, start=1)
+    rebuild_student_risk([student.id])
+    db.session.commit()
+    many = query_count(client, url, headers)
+
+    assert many == few
+
+
+def test_query_count_resets_between_requests_in_a_shared_app_context(app, client):
+    admin = make_user('admin', role='admin')
+    add_students(3, 4)
+    headers = auth_headers(admin)
+
+    # The database fixture holds an app context open, so every request here shares `g`
+    counts = [int(client.get('/api/evaluations', headers=headers).headers['X-Query-Count']) for _ in range(5)]
+
+    assert counts[1:] == [counts[1]] * 4
@@ -0,0 +1,50 @@
+"""The O(1) risk UPDATE must agree with a full replay, on every SET-evaluation order."""
+import re
+from sqlalchemy.dialects import mysql
+from db.Burnout_Tracker import db
+from models.StudentRisk import StudentRisk
+from utils.risk import rebuild_student_risk, record_risk_submission
+from tests.helpers import make_evaluations, make_user
+
+STATE_COLUMNS = ('observations', 'ewma', 'slope', 'rise_streak', 'projected_score', 'last_score')
+
+
+def snapshot(user_id):
+    db.session.expire_all()
+    risk = db.session.get(StudentRisk, user_id)
+    return {name: getattr(risk, name) for name in STATE_COLUMNS}
+
+
+def test_live_updates_match_a_replay():
+    student = make_user('student')
+    for answer in (1, 2, 2, 4, 3, 5):
+        evaluation = make_evaluations(student, 1, answer=answer)[0]
+        record_risk_submission(evaluation)
+    db.session.commit()
+    live = snapshot(student.id)
+
+    rebuild_student_risk([student.id])
+    db.session.commit()
+    replayed = snapshot(student.id)
+
+    assert live.keys() == replayed.keys()
+    for name in STATE_COLUMNS:
+        assert abs(live[name] - replayed[name]) < 1e-9, name
+
+
+def test_set_clause_never_reads_a_column_it_already_assigned(monkeypatch):
+    # MySQL evaluates SET left to right, so a later expression would see an earlier assignment
+    student = make_user('student')
+    evaluation = make_evaluations(student, 1)[0]
+    statements = []
+    monkeypatch.setattr(db.session, 'execute', lambda statement, *a, **k: statements.append(statement) or
+                        type('Result', (), {'rowcount': 1})())
+    record_risk_submission(evaluation)
+
+    set_clause = str(statements[0].compile(dialect=mysql.dialect())).split(' SET ', 1)[1].split(' WHERE ')[0]
+    assigned = set()
+    for column, expression in re.findall(r"(\w+)=(.*?)(?=, \w+=|$)", set_clause):
+        read = set(re.findall(r"student_risk\.(\w+)", expression))
+        assert not read & assigned, f"{column} reads {read & assigned} after they were assigned"
+        assigned.add(column)
+    assert {'ewma', 'slope', 'projected_score', 'rise_streak', 'last_score'} <= assigned
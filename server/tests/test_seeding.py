@@ -0,0 +1,32 @@
+"""Seeded users get database-assigned ids, so ordinary inserts afterwards do not collide."""
+import pytest
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.User import User
+from utils.seeding import seed_database
+from tests.helpers import make_user
+
+
+def seed(**kwargs):
+    return list(seed_database(students=5, admins=2, evaluations_per_student=3, password_hash='-',
+                              batch_size=2, **kwargs))
+
+
+@pytest.mark.parametrize('ordered_returning', [True, False])
+def test_seeded_ids_match_their_users(monkeypatch, ordered_returning):
+    monkeypatch.setattr(db.engine.dialect, 'insert_executemany_returning_sort_by_parameter_order', ordered_returning)
+    make_user('existing')
+    db.session.commit()
+
+    progress = seed()
+
+    assert progress[-1]["students"] == 5
+    users = {u.username: u.id for u in User.query.filter(User.username.like('seed_%'))}
+    assert len(users) == 7
+    # Every evaluation belongs to a seeded student, never to a mismatched id
+    owners = {e.user_id for e in Evaluation.query}
+    assert owners <= {users[f"seed_student{i}"] for i in range(1, 6)}
+
+    later = make_user('after-seeding')
+    db.session.commit()
+    assert later.id > max(users.values())
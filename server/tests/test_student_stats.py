@@ -0,0 +1,36 @@
+"""student_stats must be correct as soon as the write that changed it commits."""
+from db.Burnout_Tracker import db
+from models.Job import Job
+from models.StudentStats import StudentStats
+from utils.student_stats import refresh_student_stats
+from tests.helpers import auth_headers, make_evaluations, make_user
+
+
+def test_deleting_the_latest_evaluation_refreshes_stats_inline(client):
+    admin = make_user('admin', role='admin')
+    student = make_user('student')
+    first, latest = make_evaluations(student, 2)
+    refresh_student_stats([student.id])
+    db.session.commit()
+
+    response = client.delete(f'/api/evaluations/{latest.id}', headers=auth_headers(admin))
+
+    assert response.status_code == 200
+    db.session.expire_all()
+    stats = db.session.get(StudentStats, student.id)
+    assert stats.evaluation_count == 1
+    assert stats.latest_evaluation_id == first.id
+    assert Job.query.filter_by(kind='stats.refresh').count() == 0
+
+
+def test_deleting_the_only_evaluation_removes_the_row(client):
+    admin = make_user('admin', role='admin')
+    student = make_user('student')
+    only = make_evaluations(student, 1)[0]
+    refresh_student_stats([student.id])
+    db.session.commit()
+
+    client.delete(f'/api/evaluations/{only.id}', headers=auth_headers(admin))
+
+    db.session.expire_all()
+    assert db.session.get(StudentStats, student.id) is None
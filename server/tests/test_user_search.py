@@ -0,0 +1,28 @@
+"""Prefix search returns exactly the users whose lowercased name or email starts with the term."""
+from db.Burnout_Tracker import db
+from models.User import User
+from utils.user_search import prefix_bounds, search_users
+from tests.helpers import make_user
+
+
+def test_prefix_bounds_cover_exactly_the_prefix():
+    low, high = prefix_bounds('ab')
+    assert (low, high) == ('ab', 'ac')
+    assert prefix_bounds('a\U0010FFFF') == ('a\U0010FFFF', None)
+
+
+def test_search_is_case_insensitive_and_prefix_only(client):
+    for name in ('Amara', 'amanda', 'AM.bert', 'ama-x', 'pam'):
+        make_user(name)
+    db.session.commit()
+
+    names = {r["username"] for r in search_users('AMA', fuzzy=False)}
+
+    assert names == {'Amara', 'amanda', 'ama-x'}
+
+
+def test_search_columns_use_a_binary_collation():
+    for column in (User.__table__.c.username_lower, User.__table__.c.email_lower):
+        variants = column.type._variant_mapping
+        assert variants['postgresql'].collation == 'C'
+        assert variants['mysql'].collation == 'utf8mb4_bin'
@@ -0,0 +1,262 @@
+# utils/analytics.py
+import threading
+from collections import OrderedDict
+import numpy as np
+from sqlalchemy import func, select
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from utils.conditional import EVALUATIONS_VERSION, read_versions
+from utils.pagination import PaginationError, filter_evaluations, parse_limit
+
+ANALYTICS_FILTERS = ('from', 'to', 'min_score', 'max_score', 'handled', 'needs_support')
+HISTOGRAM_BIN_WIDTH = 5
+CACHE_SIZE = 32
+TREND_BUCKETS = ('day', 'week', 'month')
+
+_QUESTION_COLUMNS = [getattr(Evaluation, field) for field in Evaluation.QUESTION_FIELDS]
+_WEEK = np.timedelta64(7, 'D')
+# 1970-01-05 was a Monday, so weeks computed from it start on Mondays
+_FIRST_MONDAY = np.datetime64('1970-01-05')
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load_columns(filters):
+    """Pulls answers, totals, flags and dates for the filtered cohort in one query, as NumPy arrays."""
+    statement = filter_evaluations(
+        select(*_QUESTION_COLUMNS, Evaluation.total_score, Evaluation.needs_support, Evaluation.submitted_at),
+        filters
+    )
+    rows = db.session.execute(statement).all()
+    n = len(rows)
+
+    matrix = np.array([row[:11] for row in rows], dtype=np.int64).reshape(n, 11)
+    return {
+        "answers": matrix[:, :10],
+        "total_score": matrix[:, 10],
+        "needs_support": np.fromiter((bool(row[11]) for row in rows), dtype=bool, count=n),
+        "submitted_at": np.array([row[12] for row in rows], dtype='datetime64[s]'),
+    }
+
+
+def _nan_to_none(array):
+    return [None if np.isnan(v) else round(float(v), 4) for v in array]
+
+
+def compute_cohort_analytics(columns):
+    answers = columns["answers"]
+    totals = columns["total_score"]
+    needs_support = columns["needs_support"]
+    submitted_at = columns["submitted_at"]
+    count = len(totals)
+
+    if count == 0:
+        return {
+            "count": 0,
+            "needs_support_share": None,
+            "total_score": None,
+            "questions": {},
+            "score_histogram": [],
+            "weekly_support": [],
+            "correlations": {}
+        }
+
+    means = answers.mean(axis=0)
+    variances = answers.var(axis=0)
+    questions = {
+        field: {"mean": round(float(means[i]), 4), "variance": round(float(variances[i]), 4)}
+        for i, field in enumerate(Evaluation.QUESTION_FIELDS)
+    }
+
+    # The full answer scale, widened to whole bins around any total outside it
+    # (e.g. from another scoring version) so the bin counts always sum to `count`
+    low = min(
+        len(Evaluation.QUESTION_FIELDS) * Evaluation.ANSWER_MIN,
+        int(totals.min()) // HISTOGRAM_BIN_WIDTH * HISTOGRAM_BIN_WIDTH
+    )
+    high = max(
+        len(Evaluation.QUESTION_FIELDS) * Evaluation.ANSWER_MAX,
+        -(-int(totals.max()) // HISTOGRAM_BIN_WIDTH) * HISTOGRAM_BIN_WIDTH
+    )
+    edges = np.arange(low, high + HISTOGRAM_BIN_WIDTH, HISTOGRAM_BIN_WIDTH)
+    histogram, edges = np.histogram(totals, bins=edges)
+    score_histogram = [
+        {"min": int(edges[i]), "max": int(edges[i + 1]), "count": int(histogram[i])}
+        for i in range(len(histogram))
+    ]
+
+    # Bucket every submission into its Monday-based week, then count per bucket in one pass
+    week_index = (submitted_at - _FIRST_MONDAY) // _WEEK
+    weeks, inverse = np.unique(week_index, return_inverse=True)
+    per_week = np.bincount(inverse)
+    flagged_per_week = np.bincount(inverse, weights=needs_support)
+    weekly_support = [
+        {
+            "week_start": str((_FIRST_MONDAY + weeks[i] * _WEEK).astype('datetime64[D]')),
+            "count": int(per_week[i]),
+            "needs_support": int(flagged_per_week[i]),
+            "share": round(float(flagged_per_week[i] / per_week[i]), 4)
+        }
+        for i in range(len(weeks))
+    ]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        correlation = np.corrcoef(answers, rowvar=False) if count > 1 else np.full((10, 10), np.nan)
+    correlation = np.atleast_2d(correlation)
+    correlations = {
+        field: dict(zip(Evaluation.QUESTION_FIELDS, _nan_to_none(correlation[i])))
+        for i, field in enumerate(Evaluation.QUESTION_FIELDS)
+    }
+
+    return {
+        "count": count,
+        "needs_support_share": round(float(needs_support.mean()), 4),
+        "total_score": {
+            "mean": round(float(totals.mean()), 4),
+            "variance": round(float(totals.var()), 4),
+            "min": int(totals.min()),
+            "max": int(totals.max())
+        },
+        "questions": questions,
+        "score_histogram": score_histogram,
+        "weekly_support": weekly_support,
+        "correlations": correlations
+    }
+
+
+def _cached(key, compute):
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    result = compute()
+
+    with _cache_lock:
+        _cache[key] = result
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return result
+
+
+def cohort_analytics(filters):
+    """Cached cohort analytics; the key changes whenever evaluations are added, removed, handled or rescored."""
+    params = tuple((name, filters.get(name)) for name in ANALYTICS_FILTERS)
+    # Every evaluation write bumps this stamp in its own transaction, in whichever process it runs
+    key = (params,) + read_versions([EVALUATIONS_VERSION])
+    return _cached(key, lambda: compute_cohort_analytics(load_columns(filters)))
+
+
+def clear_analytics_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+# ==================== Score Trends ====================
+def parse_bucket(args):
+    bucket = args.get('bucket', 'week').lower()
+    if bucket not in TREND_BUCKETS:
+        raise PaginationError("'bucket' must be 'day', 'week' or 'month'.")
+    return bucket
+
+
+def _sql_bucket(bucket, dialect_name):
+    """Bucket start date as SQL, or None when this backend has no expression here."""
+    column = Evaluation.submitted_at
+    if dialect_name == 'sqlite':
+        if bucket == 'day':
+            return func.date(column)
+        if bucket == 'week':
+            # Forward to the week's Sunday, then back to its Monday
+            return func.date(column, 'weekday 0', '-6 days')
+        return func.strftime('%Y-%m-01', column)
+    if dialect_name == 'postgresql':
+        # date_trunc weeks start on Monday too
+        return func.date(func.date_trunc(bucket, column))
+    return None
+
+
+def _empty_trend(bucket):
+    return {"bucket": bucket, "start": [], "count": [], "avg": [], "min": [], "max": []}
+
+
+def _sql_trend(statement, bucket, limit):
+    start = _sql_bucket(bucket, db.engine.dialect.name).label('start')
+    rows = db.session.execute(
+        statement.add_columns(
+            start,
+            func.count(Evaluation.id),
+            func.avg(Evaluation.total_score),
+            func.min(Evaluation.total_score),
+            func.max(Evaluation.total_score)
+        ).group_by(start).order_by(start.desc()).limit(limit)
+    ).all()
+    trend = _empty_trend(bucket)
+    # Newest buckets were fetched first so `limit` keeps the recent end; charts want oldest first
+    for row in reversed(rows):
+        trend["start"].append(str(row[0])[:10])
+        trend["count"].append(int(row[1]))
+        trend["avg"].append(round(float(row[2]), 2))
+        trend["min"].append(int(row[3]))
+        trend["max"].append(int(row[4]))
+    return trend
+
+
+def _vectorized_trend(statement, bucket, limit):
+    rows = db.session.execute(statement.add_columns(Evaluation.submitted_at, Evaluation.total_score)).all()
+    trend = _empty_trend(bucket)
+    if not rows:
+        return trend
+    submitted_at = np.array([row[0] for row in rows], dtype='datetime64[s]')
+    totals = np.array([row[1] for row in rows], dtype=np.int64)
+
+    if bucket == 'day':
+        starts = submitted_at.astype('datetime64[D]')
+    elif bucket == 'week':
+        starts = _FIRST_MONDAY + ((submitted_at - _FIRST_MONDAY) // _WEEK) * _WEEK
+    else:
+        starts = submitted_at.astype('datetime64[M]').astype('datetime64[D]')
+
+    buckets, inverse = np.unique(starts.astype('datetime64[D]'), return_inverse=True)
+    counts = np.bincount(inverse)
+    sums = np.bincount(inverse, weights=totals)
+    # Sorted by bucket, each bucket is one contiguous run for the min/max reductions
+    order = np.argsort(inverse, kind='stable')
+    run_starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    mins = np.minimum.reduceat(totals[order], run_starts)
+    maxes = np.maximum.reduceat(totals[order], run_starts)
+
+    keep = slice(max(len(buckets) - limit, 0), None)
+    trend["start"] = [str(b) for b in buckets[keep]]
+    trend["count"] = counts[keep].tolist()
+    trend["avg"] = [round(float(v), 2) for v in (sums / counts)[keep]]
+    trend["min"] = mins[keep].tolist()
+    trend["max"] = maxes[keep].tolist()
+    return trend
+
+
+def score_trend(args, user_id=None):
+    """total_score per day/week/month bucket (count, avg, min, max), oldest first.
+
+    Only the most recent `limit` non-empty buckets are returned, so the payload
+    stays small however long the history is. Aggregated in SQL where the
+    backend has a date bucket expression, with NumPy otherwise.
+    """
+    bucket = parse_bucket(args)
+    limit = parse_limit(args)
+    statement = filter_evaluations(select(), args)
+    if user_id is not None:
+        statement = statement.where(Evaluation.user_id == user_id)
+    statement = statement.select_from(Evaluation)
+
+    if _sql_bucket(bucket, db.engine.dialect.name) is not None:
+        return _sql_trend(statement, bucket, limit)
+    return _vectorized_trend(statement, bucket, limit)
+
+
+def cohort_score_trend(args):
+    """score_trend over every student, cached like cohort_analytics."""
+    params = tuple((name, args.get(name)) for name in ANALYTICS_FILTERS + ('bucket', 'limit'))
+    key = ('trend', params) + read_versions([EVALUATIONS_VERSION])
+    return _cached(key, lambda: score_trend(args))
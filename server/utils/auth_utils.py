@@ -1,7 +1,7 @@
 from functools import wraps
 from flask_jwt_extended import get_jwt_identity, jwt_required
 from flask import jsonify
-from models.User import User
+from utils.user_cache import get_user_role
 
 def role_required(roles):
     def decorator(fn):
@@ -10,11 +10,14 @@ def role_required(roles):
         def wrapper(*args, **kwargs):
             identity = get_jwt_identity()
             user_id = identity.get("id")
-            user = User.query.get(user_id)
+            user = get_user_role(user_id)
 
-            if not user or user.role.lower() not in roles:
+            if not user or user.role not in roles:
                 return jsonify({"error": "Access forbidden: you don't have the required permissions to access this resource."}), 403
 
+            if not user.is_active:
+                return jsonify({"error": "Your account has been suspended."}), 403
+
             return fn(*args, **kwargs)
         return wrapper
     return decorator
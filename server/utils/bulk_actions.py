@@ -0,0 +1,119 @@
+# utils/bulk_actions.py
+from datetime import datetime
+from sqlalchemy import delete, select, update
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from utils.conditional import touch_evaluations
+from utils.counters import UNHANDLED_EVALUATIONS, increment_counter
+from utils.jobs import enqueue
+from utils.risk import rebuild_student_risk
+from utils.student_stats import refresh_student_stats
+
+MAX_BULK_IDS = 500
+MEETING_FIELDS = ('place', 'time', 'day', 'date')
+
+# Each action runs as one transaction: a lookup of the targets, a single set-based
+# UPDATE/DELETE, then the summary tables, version stamps and event jobs for every
+# affected student at once. Callers get one outcome per requested id.
+
+
+def parse_ids(value):
+    """Validates a request's id list; returns (ids, error) with duplicates dropped in order."""
+    if not isinstance(value, list) or not value:
+        return None, "Must be a non-empty list of evaluation ids."
+    if len(value) > MAX_BULK_IDS:
+        return None, f"At most {MAX_BULK_IDS} ids per request."
+    if not all(isinstance(i, int) and not isinstance(i, bool) for i in value):
+        return None, "Every id must be an integer."
+    return list(dict.fromkeys(value)), None
+
+
+def _targets(ids):
+    rows = db.session.execute(
+        select(Evaluation.id, Evaluation.user_id, Evaluation.handled_by_admin_id)
+        .where(Evaluation.id.in_(ids))
+    ).all()
+    return {row.id: row for row in rows}
+
+
+def _result(ids, outcomes):
+    results = [{"id": i, "status": outcomes.get(i, "not_found")} for i in ids]
+    summary = {}
+    for result in results:
+        summary[result["status"]] = summary.get(result["status"], 0) + 1
+    return {"results": results, "summary": summary}
+
+
+def bulk_handle(ids, admin_id):
+    """Marks every unhandled evaluation in `ids` as handled by `admin_id`."""
+    targets = _targets(ids)
+    pending = [i for i, row in targets.items() if row.handled_by_admin_id is None]
+    outcomes = {i: "already_handled" for i in targets}
+
+    if pending:
+        now = datetime.utcnow()
+        result = db.session.execute(
+            update(Evaluation)
+            .where(Evaluation.id.in_(pending), Evaluation.handled_by_admin_id.is_(None))
+            .values(handled_by_admin_id=admin_id, handled_at=now),
+            execution_options={"synchronize_session": False}
+        )
+        handled = pending
+        if result.rowcount != len(pending):
+            # Someone else handled a few in between: keep only the rows carrying our stamp
+            handled = db.session.execute(
+                select(Evaluation.id).where(
+                    Evaluation.id.in_(pending),
+                    Evaluation.handled_by_admin_id == admin_id,
+                    Evaluation.handled_at == now
+                )
+            ).scalars().all()
+        if handled:
+            user_ids = {targets[i].user_id for i in handled}
+            refresh_student_stats(user_ids)
+            increment_counter(UNHANDLED_EVALUATIONS, -len(handled))
+            touch_evaluations(user_ids)
+            enqueue('notify.evaluation_handled', {"evaluation_ids": sorted(handled)})
+        outcomes.update((i, "handled") for i in handled)
+
+    db.session.commit()
+    return _result(ids, outcomes)
+
+
+def bulk_set_meeting(ids, meeting):
+    """Assigns the same meeting details to every evaluation in `ids`."""
+    targets = _targets(ids)
+    if targets:
+        db.session.execute(
+            update(Evaluation)
+            .where(Evaluation.id.in_(list(targets)))
+            .values(
+                meeting_place=meeting['place'],
+                meeting_time=meeting['time'],
+                meeting_day=meeting['day'],
+                meeting_date=meeting['date']
+            ),
+            execution_options={"synchronize_session": False}
+        )
+        touch_evaluations(row.user_id for row in targets.values())
+        enqueue('notify.meeting_set', {"evaluation_ids": sorted(targets)})
+    db.session.commit()
+    return _result(ids, {i: "scheduled" for i in targets})
+
+
+def bulk_delete(ids):
+    """Deletes every evaluation in `ids` and re-derives the affected students' summaries."""
+    targets = _targets(ids)
+    if targets:
+        db.session.execute(
+            delete(Evaluation).where(Evaluation.id.in_(list(targets))),
+            execution_options={"synchronize_session": False}
+        )
+        user_ids = {row.user_id for row in targets.values()}
+        unhandled = sum(1 for row in targets.values() if row.handled_by_admin_id is None)
+        refresh_student_stats(user_ids)
+        rebuild_student_risk(user_ids)
+        increment_counter(UNHANDLED_EVALUATIONS, -unhandled)
+        touch_evaluations(user_ids)
+    db.session.commit()
+    return _result(ids, {i: "deleted" for i in targets})
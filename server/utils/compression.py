@@ -0,0 +1,57 @@
+# utils/compression.py
+import gzip
+from flask import request
+
+try:
+    import brotli
+except ImportError:  # Optional: only gzip is offered without it
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = {'application/json', 'application/x-ndjson', 'text/csv', 'text/plain', 'text/html'}
+
+
+def choose_encoding(accept_encoding):
+    """Picks br over gzip when the client accepts it and brotli is installed."""
+    if brotli is not None and accept_encoding['br']:
+        return 'br'
+    if accept_encoding['gzip']:
+        return 'gzip'
+    return None
+
+
+def compress(data, encoding, level):
+    if encoding == 'br':
+        # brotli quality runs 0-11; map the gzip-style 1-9 level onto it
+        return brotli.compress(data, quality=min(11, level + 2))
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def init_compression(app):
+    """Compresses buffered responses above COMPRESS_MIN_SIZE bytes for clients that accept it."""
+
+    @app.after_request
+    def compress_response(response):
+        if not app.config.get('COMPRESS_ENABLED', True):
+            return response
+        if (
+            response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES
+        ):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = choose_encoding(request.accept_encodings)
+        data = response.get_data()
+        if encoding is None or len(data) < app.config.get('COMPRESS_MIN_SIZE', 1024):
+            return response
+
+        response.set_data(compress(data, encoding, app.config.get('COMPRESS_LEVEL', 6)))
+        response.headers['Content-Encoding'] = encoding
+        # The bytes differ from the identity encoding, so any strong ETag becomes weak
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
@@ -0,0 +1,70 @@
+# utils/conditional.py
+import hashlib
+from functools import wraps
+from flask import make_response, request
+from flask_jwt_extended import get_jwt_identity
+from sqlalchemy import update
+from db.Burnout_Tracker import db
+from models.Counter import Counter
+
+# Version stamps live in the counters table so every worker process sees the same
+# value; a write bumps them in its own transaction, a conditional GET reads them
+# with one primary-key lookup.
+USERS_VERSION = 'version:users'
+EVALUATIONS_VERSION = 'version:evaluations'
+
+
+def user_evaluations_version(user_id):
+    return f"version:user:{user_id}"
+
+
+def bump_versions(*names):
+    """Increments version stamps inside the caller's transaction (no commit)."""
+    for name in names:
+        result = db.session.execute(
+            update(Counter).where(Counter.name == name).values(value=Counter.value + 1)
+        )
+        if result.rowcount == 0:
+            db.session.add(Counter(name=name, value=1))
+
+
+def touch_users():
+    bump_versions(USERS_VERSION)
+
+
+def touch_evaluations(user_ids):
+    bump_versions(EVALUATIONS_VERSION, *[user_evaluations_version(u) for u in sorted(set(user_ids))])
+
+
+def read_versions(names):
+    rows = db.session.query(Counter.name, Counter.value).filter(Counter.name.in_(names)).all()
+    values = dict(rows)
+    return tuple(values.get(name, 0) for name in names)
+
+
+def conditional(version_names):
+    """Answers GETs with 304 Not Modified when the client's If-None-Match is current.
+
+    `version_names` is called with the view kwargs (inside the request, after auth)
+    and returns the names of the version stamps the response depends on. The ETag covers those stamps, the full URL (so filters and cursors count)
+    and the caller's identity, and is checked before the view runs at all.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            names = version_names(**kwargs)
+            identity = get_jwt_identity() or {}
+            seed = repr((request.full_path, identity.get("id"), names, read_versions(names)))
+            etag = hashlib.sha1(seed.encode()).hexdigest()[:20]
+
+            if request.if_none_match.contains_weak(etag):
+                response = make_response('', 304)
+            else:
+                response = make_response(fn(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
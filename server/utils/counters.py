@@ -0,0 +1,58 @@
+# utils/counters.py
+from sqlalchemy import func, update
+from db.Burnout_Tracker import db
+from models.Counter import Counter
+from models.Evaluation import Evaluation
+
+UNHANDLED_EVALUATIONS = 'unhandled_evaluations'
+
+# How each counter's true value is computed from the source tables (used to seed and repair)
+COUNTER_SOURCES = {
+    UNHANDLED_EVALUATIONS: lambda: (
+        db.session.query(func.count(Evaluation.id))
+        .filter(Evaluation.handled_by_admin_id.is_(None))
+        .scalar()
+    ),
+}
+
+
+def increment_counter(name, delta=1):
+    """Adjusts a counter inside the caller's transaction (no commit)."""
+    if not delta:
+        return
+    result = db.session.execute(
+        update(Counter).where(Counter.name == name).values(value=Counter.value + delta)
+    )
+    if result.rowcount == 0:
+        # Never seeded: start from the real value, which already includes this change once flushed
+        db.session.flush()
+        db.session.add(Counter(name=name, value=COUNTER_SOURCES[name]()))
+
+
+def get_counter(name):
+    """Primary-key read of a counter, seeding it from the source tables the first time."""
+    counter = db.session.get(Counter, name)
+    if counter is None:
+        counter = Counter(name=name, value=COUNTER_SOURCES[name]())
+        db.session.add(counter)
+        db.session.commit()
+    return counter.value
+
+
+def check_counters(repair=False):
+    """Compares every counter with its source of truth; returns {name: (stored, actual)} for drifted ones."""
+    drift = {}
+    for name, source in COUNTER_SOURCES.items():
+        actual = source()
+        counter = db.session.get(Counter, name)
+        stored = counter.value if counter else None
+        if stored != actual:
+            drift[name] = (stored, actual)
+            if repair:
+                if counter is None:
+                    db.session.add(Counter(name=name, value=actual))
+                else:
+                    counter.value = actual
+    if repair:
+        db.session.commit()
+    return drift
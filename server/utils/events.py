@@ -0,0 +1,222 @@
+# utils/events.py
+import itertools
+import json
+import queue
+import threading
+import time
+import uuid
+from datetime import datetime
+from flask import current_app
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from utils.jobs import EVENTS_QUEUE, job_handler
+
+SUBSCRIBER_QUEUE_SIZE = 100
+HEARTBEAT_SECONDS = 15
+STREAM_TICKET_SALT = 'notification-stream'
+
+
+def role_channel(role):
+    return f"role:{role}"
+
+
+def user_channel(user_id):
+    return f"user:{user_id}"
+
+
+class Subscription:
+    def __init__(self, hub, channels):
+        self.hub = hub
+        self.channels = channels
+        self.queue = queue.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def get(self, timeout):
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.hub.unsubscribe(self)
+
+
+class EventHub:
+    """In-process pub/sub: each connected stream gets its own bounded queue.
+
+    Publishing is a dict lookup plus a put per subscriber on that channel, so
+    nothing is spent on clients while nothing happens. Only subscribers in this
+    process are reached; run a single worker process (with threads) for streaming.
+    """
+
+    def __init__(self):
+        self._subscribers = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def subscribe(self, channels):
+        subscription = Subscription(self, channels)
+        with self._lock:
+            for channel in channels:
+                self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self._subscribers[channel]
+
+    def publish(self, channel, event_type, data):
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        if not subscribers:
+            return 0
+        event = (next(self._ids), event_type, data)
+        for subscription in subscribers:
+            try:
+                subscription.queue.put_nowait(event)
+            except queue.Full:
+                # A client that stopped reading loses events rather than holding memory
+                pass
+        return len(subscribers)
+
+    def subscriber_count(self):
+        with self._lock:
+            return len({s for subs in self._subscribers.values() for s in subs})
+
+
+event_hub = EventHub()
+
+
+def format_sse(event_id, event_type, data):
+    return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n"
+
+
+def iter_sse(subscription, heartbeat=HEARTBEAT_SECONDS):
+    """Yields SSE frames for a subscription until the client disconnects."""
+    try:
+        yield f"retry: 5000\nevent: ready\ndata: {json.dumps({'channels': subscription.channels})}\n\n"
+        while True:
+            event = subscription.get(timeout=heartbeat)
+            if event is None:
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(*event)
+    finally:
+        subscription.close()
+
+
+# ==================== Stream tickets ====================
+# EventSource cannot send an Authorization header, and an access token in the URL
+# ends up in access logs, proxies and browser history. Instead the client POSTs for
+# a ticket that only opens the stream, expires within seconds and is used once.
+
+class StreamTickets:
+    def __init__(self):
+        self._used = {}
+        self._lock = threading.Lock()
+
+    def _serializer(self):
+        return URLSafeTimedSerializer(current_app.config['JWT_SECRET_KEY'], salt=STREAM_TICKET_SALT)
+
+    def issue(self, identity, token_jti):
+        """Signs a ticket for `identity`, tied to the access token it was issued under."""
+        return self._serializer().dumps({
+            "id": identity.get("id"),
+            "role": identity.get("role"),
+            "jti": token_jti,
+            "nonce": uuid.uuid4().hex
+        })
+
+    def redeem(self, ticket):
+        """Returns the ticket's claims, or None when it is forged, expired or already used."""
+        ttl = current_app.config['STREAM_TICKET_TTL']
+        try:
+            claims = self._serializer().loads(ticket, max_age=ttl)
+        except BadSignature:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            # Tickets older than the TTL are rejected by the signature check, so forget them
+            for nonce in [n for n, expires in self._used.items() if expires <= now]:
+                del self._used[nonce]
+            if claims["nonce"] in self._used:
+                return None
+            self._used[claims["nonce"]] = now + ttl
+        return claims
+
+
+stream_tickets = StreamTickets()
+
+
+# ==================== Domain events ====================
+
+def publish_meeting_set(evaluation):
+    event_hub.publish(user_channel(evaluation.user_id), 'meeting', {
+        "evaluation_id": evaluation.id,
+        "meeting": {
+            "place": evaluation.meeting_place,
+            "time": evaluation.meeting_time,
+            "day": evaluation.meeting_day,
+            "date": evaluation.meeting_date,
+        }
+    })
+
+
+def publish_evaluation_handled(evaluation):
+    data = {"evaluation_id": evaluation.id, "user_id": evaluation.user_id}
+    event_hub.publish(user_channel(evaluation.user_id), 'handled', data)
+    event_hub.publish(role_channel('admin'), 'handled', data)
+
+
+def publish_new_alert(evaluation):
+    event_hub.publish(role_channel('admin'), 'alert', {
+        "evaluation_id": evaluation.id,
+        "user_id": evaluation.user_id,
+        "total_score": evaluation.total_score
+    })
+
+
+# ==================== Fan-out jobs ====================
+# Routes enqueue these inside their write transaction; the runner in the web
+# process publishes once the write has committed. Events are best-effort, so a
+# few quick retries are enough.
+
+def _load_evaluations(payload):
+    # Single-row routes send one id; the bulk actions send the whole batch in one job
+    ids = payload.get("evaluation_ids") or [payload["evaluation_id"]]
+    return Evaluation.query.filter(Evaluation.id.in_(ids)).order_by(Evaluation.id).all()
+
+
+@job_handler('notify.new_alert', queue=EVENTS_QUEUE, max_attempts=3)
+def notify_new_alert(payload):
+    for evaluation in _load_evaluations(payload):
+        publish_new_alert(evaluation)
+
+
+@job_handler('notify.meeting_set', queue=EVENTS_QUEUE, max_attempts=3)
+def notify_meeting_set(payload):
+    for evaluation in _load_evaluations(payload):
+        publish_meeting_set(evaluation)
+
+
+@job_handler('notify.evaluation_handled', queue=EVENTS_QUEUE, max_attempts=3)
+def notify_evaluation_handled(payload):
+    for evaluation in _load_evaluations(payload):
+        publish_evaluation_handled(evaluation)
+
+
+@job_handler('notify.message', queue=EVENTS_QUEUE, max_attempts=3)
+def notify_message(payload):
+    evaluation = db.session.get(Evaluation, payload["evaluation_id"])
+    if evaluation is None:
+        return
+    event_hub.publish(user_channel(evaluation.user_id), 'message', {
+        "evaluation_id": evaluation.id,
+        "message": payload["message"],
+        "created_at": payload.get("created_at") or datetime.utcnow().isoformat()
+    })
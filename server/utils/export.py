@@ -0,0 +1,83 @@
+# utils/export.py
+import csv
+import io
+import json
+from datetime import datetime
+from sqlalchemy import select
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.User import User
+from utils.pagination import filter_evaluations
+
+EXPORT_FORMATS = ('ndjson', 'csv')
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_COLUMNS = [
+    Evaluation.id,
+    Evaluation.user_id,
+    User.username,
+    User.email,
+    Evaluation.submitted_at,
+    Evaluation.q1, Evaluation.q2, Evaluation.q3, Evaluation.q4, Evaluation.q5,
+    Evaluation.q6, Evaluation.q7, Evaluation.q8, Evaluation.q9, Evaluation.q10,
+    Evaluation.total_score,
+    Evaluation.needs_support,
+    Evaluation.handled_by_admin_id,
+    Evaluation.handled_at,
+    Evaluation.meeting_place,
+    Evaluation.meeting_time,
+    Evaluation.meeting_day,
+    Evaluation.meeting_date,
+]
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+def export_statement(filters):
+    """Flat Core SELECT of evaluations + student, with the list-endpoint filters applied."""
+    statement = (
+        select(*EXPORT_COLUMNS)
+        .join(User, User.id == Evaluation.user_id)
+        .order_by(Evaluation.id)
+    )
+    return filter_evaluations(statement, filters)
+
+
+def iter_export_rows(statement):
+    """Yields rows from a server-side cursor, EXPORT_BATCH_SIZE at a time, never the whole table."""
+    statement = statement.execution_options(stream_results=True, yield_per=EXPORT_BATCH_SIZE)
+    for row in db.session.execute(statement):
+        yield row
+
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def iter_ndjson(rows):
+    buffer = []
+    for row in rows:
+        buffer.append(json.dumps(dict(zip(EXPORT_FIELDS, map(_plain, row)))))
+        if len(buffer) >= EXPORT_BATCH_SIZE:
+            yield '\n'.join(buffer) + '\n'
+            buffer = []
+    if buffer:
+        yield '\n'.join(buffer) + '\n'
+
+
+def iter_csv(rows):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_FIELDS)
+    for count, row in enumerate(rows, start=1):
+        writer.writerow([_plain(value) for value in row])
+        if count % EXPORT_BATCH_SIZE == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def iter_export(filters, export_format):
+    """Validates the filters up front, then returns a lazy generator of text chunks."""
+    rows = iter_export_rows(export_statement(filters))
+    return iter_csv(rows) if export_format == 'csv' else iter_ndjson(rows)
@@ -0,0 +1,193 @@
+# utils/importer.py
+import csv
+import io
+import json
+from datetime import datetime
+from itertools import islice
+import numpy as np
+from sqlalchemy import insert, or_
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.User import User
+from utils.conditional import touch_evaluations
+from utils.counters import UNHANDLED_EVALUATIONS, increment_counter
+from utils.risk import rebuild_student_risk
+from utils.scoring import get_active_rule, rule_version, score_answers
+from utils.student_stats import refresh_student_stats
+
+IMPORT_FORMATS = ('csv', 'ndjson')
+IMPORT_BATCH_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+
+def read_records(stream, import_format):
+    """Yields one dict per CSV row / NDJSON line from a text stream, without reading it all."""
+    if import_format == 'csv':
+        yield from csv.DictReader(stream)
+        return
+
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            record = None
+        # Malformed lines still count as a row so numbering matches the input
+        yield record if isinstance(record, dict) else {"_error": "Invalid JSON object."}
+
+
+def _resolve_students(records):
+    """Maps the user_id / username references in a batch to student ids with one query."""
+    ids = set()
+    usernames = set()
+    for record in records:
+        if record.get('user_id') not in (None, ''):
+            try:
+                ids.add(int(record['user_id']))
+            except (TypeError, ValueError):
+                pass
+        elif record.get('username'):
+            usernames.add(record['username'])
+
+    if not ids and not usernames:
+        return set(), {}
+
+    students = (
+        db.session.query(User.id, User.username)
+        .filter(User.role == 'student')
+        .filter(or_(User.id.in_(ids), User.username.in_(usernames)))
+        .all()
+    )
+    return {s.id for s in students}, {s.username: s.id for s in students}
+
+
+def _parse_record(record, student_ids, student_names):
+    """Returns (user_id, answers, submitted_at) or raises ValueError with a row-level message."""
+    if "_error" in record:
+        raise ValueError(record["_error"])
+
+    if record.get('user_id') not in (None, ''):
+        try:
+            user_id = int(record['user_id'])
+        except (TypeError, ValueError):
+            raise ValueError("'user_id' must be an integer.")
+        if user_id not in student_ids:
+            raise ValueError(f"Student with id {user_id} not found.")
+    elif record.get('username'):
+        user_id = student_names.get(record['username'])
+        if user_id is None:
+            raise ValueError(f"Student '{record['username']}' not found.")
+    else:
+        raise ValueError("Each row needs a 'user_id' or 'username'.")
+
+    answers = []
+    for field in Evaluation.QUESTION_FIELDS:
+        value = record.get(field)
+        if value in (None, ''):
+            raise ValueError(f"'{field}' is required.")
+        try:
+            answers.append(int(value))
+        except (TypeError, ValueError):
+            raise ValueError(f"'{field}' must be an integer.")
+
+    submitted_at = record.get('submitted_at')
+    if submitted_at:
+        try:
+            submitted_at = datetime.fromisoformat(submitted_at)
+        except (TypeError, ValueError):
+            raise ValueError("'submitted_at' must be an ISO datetime.")
+    else:
+        submitted_at = datetime.utcnow()
+
+    return user_id, answers, submitted_at
+
+
+def import_batch(records, first_row):
+    """Validates, scores and inserts one batch in its own transaction.
+
+    Returns (imported_count, errors) where errors is a list of {"row", "error"}.
+    """
+    errors = []
+    student_ids, student_names = _resolve_students(records)
+
+    rows = []
+    parsed = []
+    for row_number, record in enumerate(records, start=first_row):
+        try:
+            parsed.append(_parse_record(record, student_ids, student_names))
+            rows.append(row_number)
+        except ValueError as e:
+            errors.append({"row": row_number, "error": str(e)})
+
+    if not parsed:
+        return 0, errors
+
+    answers = np.array([p[1] for p in parsed], dtype=np.int64)
+    out_of_range = ((answers < Evaluation.ANSWER_MIN) | (answers > Evaluation.ANSWER_MAX)).any(axis=1)
+    rule = get_active_rule()
+    totals, needs_support = score_answers(answers, rule)
+
+    values = []
+    for i, (user_id, row_answers, submitted_at) in enumerate(parsed):
+        if out_of_range[i]:
+            errors.append({
+                "row": rows[i],
+                "error": f"Answers must be between {Evaluation.ANSWER_MIN} and {Evaluation.ANSWER_MAX}."
+            })
+            continue
+        value = dict(zip(Evaluation.QUESTION_FIELDS, row_answers))
+        value.update(
+            user_id=user_id,
+            submitted_at=submitted_at,
+            total_score=int(totals[i]),
+            needs_support=bool(needs_support[i]),
+            scoring_version=rule_version(rule),
+        )
+        values.append(value)
+
+    if not values:
+        return 0, errors
+
+    try:
+        # A list of parameter sets makes this a single executemany
+        db.session.execute(insert(Evaluation.__table__), values)
+        refresh_student_stats(value["user_id"] for value in values)
+        # Imported rows can predate a student's latest one, so replay rather than advance
+        rebuild_student_risk(value["user_id"] for value in values)
+        increment_counter(UNHANDLED_EVALUATIONS, len(values))
+        touch_evaluations(value["user_id"] for value in values)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        valid_rows = [r for i, r in enumerate(rows) if not out_of_range[i]]
+        errors.extend({"row": r, "error": f"Batch insert failed: {e}"} for r in valid_rows)
+        return 0, errors
+
+    return len(values), errors
+
+
+def import_records(records, batch_size=IMPORT_BATCH_SIZE):
+    """Imports an iterable of records in chunked transactions; bad rows never abort the rest."""
+    records = iter(records)
+    summary = {"imported": 0, "failed": 0, "errors": []}
+    first_row = 1
+
+    while True:
+        batch = list(islice(records, batch_size))
+        if not batch:
+            break
+        imported, errors = import_batch(batch, first_row)
+        summary["imported"] += imported
+        summary["failed"] += len(errors)
+        room = MAX_REPORTED_ERRORS - len(summary["errors"])
+        summary["errors"].extend(sorted(errors, key=lambda e: e["row"])[:max(room, 0)])
+        first_row += len(batch)
+
+    summary["errors_truncated"] = summary["failed"] > len(summary["errors"])
+    return summary
+
+
+def records_from_text(text, import_format):
+    return read_records(io.StringIO(text), import_format)
@@ -0,0 +1,307 @@
+# utils/jobs.py
+import os
+import socket
+import threading
+import time
+import traceback
+import uuid
+import weakref
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from sqlalchemy import delete, event, func, select, update
+from sqlalchemy.orm import Session
+from db.Burnout_Tracker import db
+from models.Job import Job
+
+DEFAULT_QUEUE = 'default'
+# Jobs that must run in the web process, next to the SSE subscribers they publish to
+EVENTS_QUEUE = 'events'
+MAX_BACKOFF_SECONDS = 300
+STALE_AFTER_SECONDS = 300
+RETENTION_SECONDS = 24 * 3600
+MAINTENANCE_EVERY_SECONDS = 60
+
+JobHandler = namedtuple('JobHandler', ['fn', 'queue', 'max_attempts'])
+_handlers = {}
+_local_runners = weakref.WeakSet()
+
+
+def job_handler(kind, queue=DEFAULT_QUEUE, max_attempts=5):
+    """Registers `fn(payload)` as the handler for jobs of `kind`."""
+    def decorator(fn):
+        _handlers[kind] = JobHandler(fn, queue, max_attempts)
+        return fn
+    return decorator
+
+
+def enqueue(kind, payload=None, delay=0, max_attempts=None):
+    """Adds a job inside the caller's transaction (no commit).
+
+    The job becomes visible to workers only when the write that caused it
+    commits, and disappears with it on rollback.
+    """
+    handler = _handlers.get(kind)
+    if handler is None:
+        raise ValueError(f"No job handler registered for '{kind}'.")
+    now = datetime.utcnow()
+    job = Job(
+        queue=handler.queue,
+        kind=kind,
+        payload=payload or {},
+        max_attempts=max_attempts or handler.max_attempts,
+        run_at=now + timedelta(seconds=delay),
+        created_at=now
+    )
+    db.session.add(job)
+    db.session.info['jobs_enqueued'] = True
+    return job
+
+
+@event.listens_for(Session, 'after_commit')
+def wake_local_runners(session):
+    # Lets an in-process runner pick new jobs up immediately instead of at its next poll
+    if session.info.pop('jobs_enqueued', False):
+        for runner in list(_local_runners):
+            runner.wake()
+
+
+def backoff_seconds(attempts):
+    return min(2 ** attempts, MAX_BACKOFF_SECONDS)
+
+
+def claim_jobs(queues, limit, worker_id):
+    """Atomically marks up to `limit` due jobs as running for this worker and returns them."""
+    now = datetime.utcnow()
+    token = f"{worker_id}:{uuid.uuid4().hex[:8]}"
+    due = (
+        select(Job.id)
+        .where(Job.status == Job.QUEUED, Job.queue.in_(queues), Job.run_at <= now)
+        .order_by(Job.run_at, Job.id)
+        .limit(limit)
+        .scalar_subquery()
+    )
+    db.session.execute(
+        update(Job)
+        .where(Job.id.in_(due), Job.status == Job.QUEUED)
+        .values(status=Job.RUNNING, locked_by=token, started_at=now, attempts=Job.attempts + 1),
+        execution_options={"synchronize_session": False}
+    )
+    db.session.commit()
+    return db.session.execute(
+        select(Job.id, Job.kind, Job.payload, Job.attempts, Job.max_attempts)
+        .where(Job.locked_by == token, Job.status == Job.RUNNING)
+        .order_by(Job.id)
+    ).all()
+
+
+def finish_job(job_id, error=None, attempts=0, max_attempts=0):
+    now = datetime.utcnow()
+    if error is None:
+        values = dict(status=Job.DONE, finished_at=now, last_error=None)
+    elif attempts < max_attempts:
+        values = dict(status=Job.QUEUED, run_at=now + timedelta(seconds=backoff_seconds(attempts)), last_error=error)
+    else:
+        values = dict(status=Job.FAILED, finished_at=now, last_error=error)
+    db.session.execute(update(Job).where(Job.id == job_id).values(locked_by=None, **values))
+    db.session.commit()
+    return values['status']
+
+
+def requeue_stale_jobs(stale_after=STALE_AFTER_SECONDS):
+    """Puts back jobs whose worker died mid-run; they count the lost attempt."""
+    now = datetime.utcnow()
+    stale = (Job.status == Job.RUNNING) & (Job.started_at < now - timedelta(seconds=stale_after))
+    message = 'Worker stopped before finishing.'
+    # A job that keeps taking its worker down must not be retried forever
+    db.session.execute(
+        update(Job)
+        .where(stale, Job.attempts >= Job.max_attempts)
+        .values(status=Job.FAILED, locked_by=None, finished_at=now, last_error=message)
+    )
+    result = db.session.execute(
+        update(Job).where(stale).values(status=Job.QUEUED, locked_by=None, run_at=now, last_error=message)
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+def prune_finished_jobs(retention=RETENTION_SECONDS):
+    cutoff = datetime.utcnow() - timedelta(seconds=retention)
+    result = db.session.execute(delete(Job).where(Job.status == Job.DONE, Job.finished_at < cutoff))
+    db.session.commit()
+    return result.rowcount
+
+
+def job_stats(sample_size=1000):
+    """Queue depth per queue/status plus wait and run latency of recently finished jobs."""
+    now = datetime.utcnow()
+    depth = {}
+    for queue, status, count, oldest in db.session.query(
+        Job.queue, Job.status, func.count(Job.id), func.min(Job.run_at)
+    ).group_by(Job.queue, Job.status):
+        entry = depth.setdefault(queue, {})
+        entry[status] = count
+        if status == Job.QUEUED and oldest is not None:
+            entry["oldest_due_seconds"] = round(max((now - oldest).total_seconds(), 0), 3)
+
+    recent = db.session.query(Job.created_at, Job.started_at, Job.finished_at).filter(
+        Job.status == Job.DONE
+    ).order_by(Job.finished_at.desc()).limit(sample_size).all()
+    waits = sorted((r.started_at - r.created_at).total_seconds() for r in recent)
+    runs = sorted((r.finished_at - r.started_at).total_seconds() for r in recent)
+
+    def summary(values):
+        if not values:
+            return None
+        return {
+            "mean": round(sum(values) / len(values), 4),
+            "p50": round(values[len(values) // 2], 4),
+            "p95": round(values[min(int(len(values) * 0.95), len(values) - 1)], 4),
+            "max": round(values[-1], 4)
+        }
+
+    return {"queues": depth, "recent_jobs": len(recent), "wait_seconds": summary(waits), "run_seconds": summary(runs)}
+
+
+class JobRunner:
+    """Claims jobs from the given queues and runs them on a thread pool.
+
+    Used both embedded in the web process (see init_jobs) and by `flask worker`.
+    Every job runs in its own app context, so it gets its own session.
+    """
+
+    def __init__(self, app, queues=(DEFAULT_QUEUE,), concurrency=2, poll_interval=1.0, worker_id=None):
+        self.app = app
+        self.queues = list(queues)
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+        self._running = 0
+        self._thread = None
+        self.processed = 0
+        self.retried = 0
+        self.failed = 0
+        _local_runners.add(self)
+
+    def wake(self):
+        self._wake.set()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+    def start(self):
+        """Runs the loop on a daemon thread (for the embedded runner)."""
+        self._thread = threading.Thread(target=self.run, name=f"job-runner-{'-'.join(self.queues)}", daemon=True)
+        self._thread.start()
+        return self
+
+    def stats(self):
+        with self._lock:
+            return {
+                "worker_id": self.worker_id,
+                "queues": self.queues,
+                "concurrency": self.concurrency,
+                "running": self._running,
+                "processed": self.processed,
+                "retried": self.retried,
+                "failed": self.failed
+            }
+
+    def _execute(self, job):
+        status = None
+        try:
+            with self.app.app_context():
+                error = None
+                try:
+                    handler = _handlers.get(job.kind)
+                    if handler is None:
+                        raise LookupError(f"No job handler registered for '{job.kind}'.")
+                    handler.fn(job.payload or {})
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
+                    error = traceback.format_exc(limit=5)
+                    self.app.logger.warning("Job %s (%s) attempt %s failed", job.id, job.kind, job.attempts)
+                status = finish_job(job.id, error, job.attempts, job.max_attempts)
+        except Exception:
+            # Could not record the outcome; requeue_stale_jobs will pick the job up again
+            self.app.logger.exception("Job %s (%s) could not be finished", job.id, job.kind)
+        finally:
+            with self._lock:
+                self._running -= 1
+                if status == Job.DONE:
+                    self.processed += 1
+                elif status == Job.QUEUED:
+                    self.retried += 1
+                elif status == Job.FAILED:
+                    self.failed += 1
+            self._wake.set()
+
+    def _maintenance(self):
+        with self.app.app_context():
+            requeue_stale_jobs()
+            prune_finished_jobs()
+
+    def run(self, burst=False):
+        """Claims and runs jobs until stopped; with `burst`, returns once no job is due or running."""
+        next_maintenance = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='job') as pool:
+            while not self._stopping.is_set():
+                # Cleared before claiming, so a wake-up that arrives mid-claim is not lost
+                self._wake.clear()
+                jobs = []
+                # Sampled before claiming: a job finishing mid-claim may have been requeued for a retry
+                with self._lock:
+                    free = self.concurrency - self._running
+                    idle = self._running == 0
+                try:
+                    if time.monotonic() >= next_maintenance:
+                        self._maintenance()
+                        next_maintenance = time.monotonic() + MAINTENANCE_EVERY_SECONDS
+
+                    if free > 0:
+                        with self.app.app_context():
+                            jobs = claim_jobs(self.queues, free, self.worker_id)
+                except Exception:
+                    # e.g. the database is locked or not migrated yet: back off and try again
+                    self.app.logger.exception("Job runner %s could not claim jobs", self.worker_id)
+
+                with self._lock:
+                    self._running += len(jobs)
+                for job in jobs:
+                    pool.submit(self._execute, job)
+
+                if not jobs:
+                    if burst and idle:
+                        break
+                    self._wake.wait(self.poll_interval)
+
+
+def init_jobs(app):
+    """Starts the embedded runner on the first request when JOBS_EMBEDDED_WORKER is set.
+
+    Starting lazily keeps CLI commands such as `flask db upgrade` from polling a
+    jobs table that may not exist yet.
+    """
+    if not app.config.get('JOBS_EMBEDDED_WORKER'):
+        return
+    runner = JobRunner(
+        app,
+        queues=app.config.get('JOBS_EMBEDDED_QUEUES') or [EVENTS_QUEUE, DEFAULT_QUEUE],
+        concurrency=app.config.get('JOBS_EMBEDDED_CONCURRENCY', 2),
+        poll_interval=app.config.get('JOBS_POLL_INTERVAL', 1.0)
+    )
+    app.extensions['job_runner'] = runner
+    started = threading.Lock()
+
+    @app.before_request
+    def start_embedded_job_runner():
+        if runner._thread is None:
+            with started:
+                if runner._thread is None:
+                    runner.start()
@@ -0,0 +1,74 @@
+# utils/json_provider.py
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+try:
+    import orjson
+except ImportError:  # Optional: fall back to the stdlib encoder
+    orjson = None
+
+
+def _default(o):
+    # Same fallbacks as Flask's stock provider, so values outside to_dict keep their wire format
+    if isinstance(o, date):
+        return http_date(o)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    if isinstance(o, tuple):
+        # orjson only encodes exact tuples; the stdlib also takes namedtuples
+        return list(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class FastJSONProvider(JSONProvider):
+    """App JSON provider backed by orjson when it is installed, the stdlib otherwise.
+
+    Both modes emit the same bytes: UTF-8 (not ASCII-escaped), keys in insertion
+    order, and datetimes through the stock RFC 822 fallback. Models format their
+    own timestamps as ISO 8601 strings in to_dict.
+    """
+
+    mimetype = 'application/json'
+    # None: indent responses in debug mode only, like the stock provider
+    compact = None
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or set(kwargs) - {'indent'}:
+            kwargs.setdefault('default', _default)
+            kwargs.setdefault('ensure_ascii', False)
+            return json.dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=self._options(bool(kwargs.get('indent')))).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    @staticmethod
+    def _options(indent):
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return options | orjson.OPT_INDENT_2 if indent else options
+
+    def response(self, *args, **kwargs):
+        """Serializes `jsonify`'s arguments: one positional value, several as a list, or keywords as a dict."""
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        if orjson is None:
+            body = json.dumps(
+                obj, default=_default, ensure_ascii=False,
+                indent=2 if indent else None, separators=None if indent else (',', ':')
+            ).encode()
+        else:
+            body = orjson.dumps(obj, default=_default, option=self._options(indent))
+        return self._app.response_class(body + b"\n", mimetype=self.mimetype)
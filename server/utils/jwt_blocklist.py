@@ -1,3 +1,114 @@
 # utils/jwt_blocklist.py
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from db.Burnout_Tracker import db
+from models.TokenBlocklist import TokenBlocklist
 
-jwt_blocklist = set()
+
+# Each refresh re-reads rows this far behind the newest created_at it has seen. created_at
+# is stamped before commit, so a logout whose transaction commits late (or that ran on a
+# host with a slightly slower clock) still lands inside the window.
+RESYNC_OVERLAP_SECONDS = 300
+
+
+class RevokedTokenStore:
+    """In-process mirror of token_blocklist so checking a token never touches the DB.
+
+    The set is warmed from the table on first use and then resynced by created_at,
+    with an overlap window, every `refresh_interval` seconds, which picks up logouts
+    handled by other worker processes. Ids are not used as a watermark: they can
+    commit out of order and SQLite reuses them once the top rows are pruned.
+    Entries whose token has expired are dropped: an expired JWT is rejected before
+    the blocklist is consulted. Rows without expires_at expire `default_ttl`
+    seconds after they were created.
+    """
+
+    def __init__(self, refresh_interval=30, default_ttl=3600, overlap=RESYNC_OVERLAP_SECONDS):
+        self.refresh_interval = refresh_interval
+        self.default_ttl = default_ttl
+        self.overlap = overlap
+        self._expiry_by_jti = {}
+        self._synced_through = None
+        self._next_refresh = 0
+        self._lock = threading.Lock()
+
+    def _expiry(self, created_at, expires_at):
+        return expires_at or created_at + timedelta(seconds=self.default_ttl)
+
+    def is_revoked(self, jti):
+        if time.monotonic() >= self._next_refresh:
+            self.refresh()
+        return jti in self._expiry_by_jti
+
+    def revoke(self, jti, expires_at):
+        now = datetime.utcnow()
+        expires_at = self._expiry(now, expires_at)
+        db.session.add(TokenBlocklist(jti=jti, created_at=now, expires_at=expires_at))
+        db.session.commit()
+        with self._lock:
+            self._expiry_by_jti[jti] = expires_at
+
+    def refresh(self):
+        with self._lock:
+            if time.monotonic() < self._next_refresh:
+                return
+            now = datetime.utcnow()
+            query = db.session.query(TokenBlocklist.jti, TokenBlocklist.created_at, TokenBlocklist.expires_at)
+            if self._synced_through is not None:
+                query = query.filter(
+                    TokenBlocklist.created_at >= self._synced_through - timedelta(seconds=self.overlap)
+                )
+            for row in query:
+                expires_at = self._expiry(row.created_at, row.expires_at)
+                if expires_at > now:
+                    self._expiry_by_jti[row.jti] = expires_at
+                if self._synced_through is None or row.created_at > self._synced_through:
+                    self._synced_through = row.created_at
+            if self._synced_through is None:
+                # Empty table: later rows can only be newer than this
+                self._synced_through = now
+
+            expired = [jti for jti, expires_at in list(self._expiry_by_jti.items()) if expires_at <= now]
+            for jti in expired:
+                del self._expiry_by_jti[jti]
+
+            self._next_refresh = time.monotonic() + self.refresh_interval
+
+    def reset(self):
+        with self._lock:
+            self._expiry_by_jti.clear()
+            self._synced_through = None
+            self._next_refresh = 0
+
+    def __len__(self):
+        return len(self._expiry_by_jti)
+
+
+revoked_tokens = RevokedTokenStore()
+
+
+def prune_expired_tokens(chunk_size=500):
+    """Deletes blocklist rows whose token can no longer be used, `chunk_size` rows per transaction.
+
+    Rows without expires_at fall back to created_at + JWT_ACCESS_TOKEN_EXPIRES, the same
+    default TTL the in-memory store uses.
+    Returns the number of rows deleted.
+    """
+    now = datetime.utcnow()
+    legacy_cutoff = now - timedelta(seconds=current_app.config['JWT_ACCESS_TOKEN_EXPIRES'])
+    expired = db.or_(
+        TokenBlocklist.expires_at <= now,
+        db.and_(TokenBlocklist.expires_at.is_(None), TokenBlocklist.created_at <= legacy_cutoff)
+    )
+
+    deleted = 0
+    while True:
+        ids = [row.id for row in db.session.query(TokenBlocklist.id).filter(expired).limit(chunk_size)]
+        if not ids:
+            break
+        db.session.query(TokenBlocklist).filter(TokenBlocklist.id.in_(ids)).delete(synchronize_session=False)
+        db.session.commit()
+        deleted += len(ids)
+    return deleted
@@ -0,0 +1,162 @@
+# utils/metrics.py
+import hmac
+import threading
+import time
+from bisect import bisect_left
+from flask import Response, abort, g, request
+from utils.query_counter import get_query_count, get_query_time
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SQL_TIME_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class Histogram:
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # the last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels):
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+class RequestMetrics:
+    """Per-process request and SQL metrics, rendered in the Prometheus text format.
+
+    Each worker process keeps its own numbers; Prometheus adds them up across
+    scrape targets, the same way it would for any multi-process server.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latency = {}      # (blueprint, endpoint, method) -> Histogram
+        self._sql_queries = {}  # (blueprint, endpoint, method) -> Histogram
+        self._sql_time = {}     # (blueprint, endpoint, method) -> Histogram
+        self._status = {}       # (blueprint, endpoint, method, status) -> count
+        self._in_flight = {}    # (blueprint, endpoint) -> gauge
+
+    def start(self, blueprint, endpoint):
+        with self._lock:
+            key = (blueprint, endpoint)
+            self._in_flight[key] = self._in_flight.get(key, 0) + 1
+
+    def finish(self, blueprint, endpoint, method, status, elapsed, queries, sql_time):
+        key = (blueprint, endpoint, method)
+        with self._lock:
+            self._in_flight[(blueprint, endpoint)] = self._in_flight.get((blueprint, endpoint), 1) - 1
+            status_key = key + (status,)
+            self._status[status_key] = self._status.get(status_key, 0) + 1
+            for histograms, buckets, value in (
+                (self._latency, LATENCY_BUCKETS, elapsed),
+                (self._sql_queries, QUERY_COUNT_BUCKETS, queries),
+                (self._sql_time, SQL_TIME_BUCKETS, sql_time),
+            ):
+                histogram = histograms.get(key)
+                if histogram is None:
+                    histogram = histograms[key] = Histogram(buckets)
+                histogram.observe(value)
+
+    def reset(self):
+        with self._lock:
+            for store in (self._latency, self._sql_queries, self._sql_time, self._status, self._in_flight):
+                store.clear()
+
+    def _render_histogram(self, lines, name, help_text, histograms):
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for (blueprint, endpoint, method), histogram in sorted(histograms.items()):
+            base = dict(blueprint=blueprint, endpoint=endpoint, method=method)
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(**base, le=bound)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(**base)} {histogram.sum}")
+            lines.append(f"{name}_count{_labels(**base)} {histogram.count}")
+
+    def render(self):
+        lines = []
+        with self._lock:
+            self._render_histogram(
+                lines, 'http_request_duration_seconds', 'Request latency by endpoint.', self._latency
+            )
+            lines.append("# HELP http_requests_total Requests by endpoint and status code.")
+            lines.append("# TYPE http_requests_total counter")
+            for (blueprint, endpoint, method, status), count in sorted(self._status.items()):
+                labels = _labels(blueprint=blueprint, endpoint=endpoint, method=method, status=status)
+                lines.append(f"http_requests_total{labels} {count}")
+            lines.append("# HELP http_requests_in_flight Requests currently being handled.")
+            lines.append("# TYPE http_requests_in_flight gauge")
+            for (blueprint, endpoint), value in sorted(self._in_flight.items()):
+                lines.append(f"http_requests_in_flight{_labels(blueprint=blueprint, endpoint=endpoint)} {value}")
+            self._render_histogram(
+                lines, 'http_request_sql_queries', 'SQL statements executed per request.', self._sql_queries
+            )
+            self._render_histogram(
+                lines, 'http_request_sql_duration_seconds', 'Time spent in SQL per request.', self._sql_time
+            )
+        return '\n'.join(lines) + '\n'
+
+
+request_metrics = RequestMetrics()
+
+
+def _request_labels():
+    # Unmatched URLs share one label so scanners cannot blow up the series count
+    return request.blueprint or '', request.endpoint or 'unmatched'
+
+
+def init_metrics(app, metrics=request_metrics):
+    """Instruments every request and serves GET /metrics when METRICS_ENABLED is set.
+
+    When disabled nothing is registered, so requests pay no cost at all.
+    """
+    if not app.config.get('METRICS_ENABLED'):
+        return
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_started = time.perf_counter()
+        g.sql_timing = True
+        metrics.start(*_request_labels())
+
+    def finish(status):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return
+        metrics.finish(
+            *_request_labels(), request.method, status,
+            time.perf_counter() - started, get_query_count(), get_query_time()
+        )
+
+    @app.after_request
+    def record_request_metrics(response):
+        finish(response.status_code)
+        return response
+
+    @app.teardown_request
+    def record_failed_request_metrics(error=None):
+        # Only reached with metrics_started still set when after_request never ran
+        finish(500)
+
+    token = app.config.get('METRICS_TOKEN')
+
+    @app.route('/metrics', methods=['GET'])
+    def metrics_endpoint():
+        if token:
+            supplied = request.headers.get('Authorization', '')
+            if not hmac.compare_digest(supplied, f"Bearer {token}"):
+                abort(401)
+        return Response(metrics.render(), content_type=CONTENT_TYPE)
@@ -0,0 +1,158 @@
+# utils/pagination.py
+import base64
+import binascii
+import json
+from collections import namedtuple
+from datetime import datetime, timedelta
+from flask import jsonify
+from sqlalchemy import and_, or_
+from sqlalchemy.types import DateTime
+from models.Evaluation import Evaluation
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 200
+
+# items: rows on this page, next_cursor: opaque token or None, offset: rows before this page
+Page = namedtuple('Page', ['items', 'next_cursor', 'offset'])
+
+
+class PaginationError(ValueError):
+    """Raised for malformed cursors, limits or filters (maps to a 400 response)."""
+
+
+def encode_cursor(values, offset):
+    payload = json.dumps({
+        "k": [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        "n": offset
+    }, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor, columns):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload["k"]
+        offset = int(payload.get("n", 0))
+        if len(values) != len(columns):
+            raise PaginationError("Invalid cursor.")
+        return [
+            datetime.fromisoformat(v) if isinstance(col.type, DateTime) and v is not None else v
+            for col, v in zip(columns, values)
+        ], offset
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise PaginationError("Invalid cursor.")
+
+
+def parse_limit(args):
+    try:
+        limit = int(args.get('limit', DEFAULT_LIMIT))
+    except ValueError:
+        raise PaginationError("'limit' must be an integer.")
+    if limit < 1:
+        raise PaginationError("'limit' must be positive.")
+    return min(limit, MAX_LIMIT)
+
+
+def _parse_bool(args, name):
+    value = args.get(name)
+    if value is None:
+        return None
+    if value.lower() in ('1', 'true', 'yes'):
+        return True
+    if value.lower() in ('0', 'false', 'no'):
+        return False
+    raise PaginationError(f"'{name}' must be true or false.")
+
+
+def _parse_int(args, name):
+    value = args.get(name)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        raise PaginationError(f"'{name}' must be an integer.")
+
+
+def _parse_date(args, name, end_of_range=False):
+    value = args.get(name)
+    if value is None:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise PaginationError(f"'{name}' must be an ISO date or datetime.")
+    # A bare date as the upper bound covers that whole day
+    if end_of_range and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+
+def filter_evaluations(query, args):
+    """Applies the shared evaluation filters (date range, score range, handled state)."""
+    date_from = _parse_date(args, 'from')
+    date_to = _parse_date(args, 'to', end_of_range=True)
+    min_score = _parse_int(args, 'min_score')
+    max_score = _parse_int(args, 'max_score')
+    handled = _parse_bool(args, 'handled')
+    needs_support = _parse_bool(args, 'needs_support')
+
+    if date_from is not None:
+        query = query.filter(Evaluation.submitted_at >= date_from)
+    if date_to is not None:
+        query = query.filter(Evaluation.submitted_at < date_to)
+    if min_score is not None:
+        query = query.filter(Evaluation.total_score >= min_score)
+    if max_score is not None:
+        query = query.filter(Evaluation.total_score <= max_score)
+    if handled is True:
+        query = query.filter(Evaluation.handled_by_admin_id.isnot(None))
+    elif handled is False:
+        query = query.filter(Evaluation.handled_by_admin_id.is_(None))
+    if needs_support is not None:
+        query = query.filter(Evaluation.needs_support.is_(needs_support))
+    return query
+
+
+def _keyset_condition(columns, values, descending):
+    """(c1, c2, ...) < (v1, v2, ...) expanded so every backend can use the index."""
+    clauses = []
+    for i, (col, value) in enumerate(zip(columns, values)):
+        comparison = col < value if descending else col > value
+        clauses.append(and_(*[c == v for c, v in zip(columns[:i], values[:i])], comparison))
+    return or_(*clauses)
+
+
+def keyset_paginate(query, columns, args, descending=True):
+    """Returns one Page of `query` ordered by `columns`, which must be unique together.
+
+    The cursor carries the sort key of the last row served, so every page is an
+    index range scan of `limit` rows no matter how deep the client has paged.
+    """
+    limit = parse_limit(args)
+    offset = 0
+
+    cursor = args.get('cursor')
+    if cursor:
+        values, offset = decode_cursor(cursor, columns)
+        query = query.filter(_keyset_condition(columns, values, descending))
+
+    query = query.order_by(*[c.desc() if descending else c.asc() for c in columns])
+    items = query.limit(limit + 1).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor([getattr(last, c.key) for c in columns], offset + limit)
+
+    return Page(items, next_cursor, offset)
+
+
+def page_response(data, page):
+    """jsonify a page body, advertising the next page in the X-Next-Cursor header."""
+    response = jsonify(data)
+    if page.next_cursor:
+        response.headers['X-Next-Cursor'] = page.next_cursor
+    return response
@@ -0,0 +1,133 @@
+# utils/password_hashing.py
+import atexit
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from werkzeug.security import DEFAULT_PBKDF2_ITERATIONS, check_password_hash, generate_password_hash
+
+DEFAULT_METHOD = 'scrypt:32768:8:1'
+
+
+class HashingBusy(Exception):
+    """Raised when the KDF queue is full or a hash times out; surfaced to clients as 503 so they retry."""
+
+
+def normalize_method(method):
+    """Canonical (name, *params) for a werkzeug method string or a stored hash's prefix.
+
+    Fills in werkzeug's defaults, so 'pbkdf2:sha256' and 'pbkdf2:sha256:<default
+    iterations>' compare equal. Raises ValueError for malformed parameters.
+    """
+    name, *args = method.split('$', 1)[0].split(':')
+    if name == 'scrypt':
+        n, r, p = map(int, args) if args else (2 ** 15, 8, 1)
+        return name, n, r, p
+    if name == 'pbkdf2':
+        if len(args) > 2:
+            raise ValueError("'pbkdf2' takes 2 arguments.")
+        hash_name = args[0].lower() if args else 'sha256'
+        iterations = int(args[1]) if len(args) == 2 else DEFAULT_PBKDF2_ITERATIONS
+        return name, hash_name, iterations
+    return (name, *args)
+
+
+class PasswordHasher:
+    """Runs password KDF work in a bounded process pool.
+
+    Request threads only wait on a future, so a burst of logins cannot pin every
+    thread (or the GIL) on hashing. At most `max_pending` hashes may be queued or
+    running; beyond that callers get HashingBusy instead of an unbounded backlog.
+    With workers=0 hashing runs inline, which keeps the CLI and tests simple.
+    """
+
+    def __init__(self, method=DEFAULT_METHOD, workers=0, max_pending=64, timeout=30):
+        self.method = method
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def configure(self, method=None, workers=None, max_pending=None, timeout=None):
+        self.shutdown()
+        if method is not None:
+            normalize_method(method)  # fail at startup, not on the first login
+            self.method = method
+        if workers is not None:
+            self.workers = workers
+        if max_pending is not None:
+            self.max_pending = max_pending
+        if timeout is not None:
+            self.timeout = timeout
+
+    def _run(self, fn, *args):
+        if not self.workers:
+            return fn(*args)
+
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise HashingBusy("Too many password operations in progress. Please retry shortly.")
+            self.pending += 1
+            if self._executor is None:
+                # Not fork: copying a process that holds SQLAlchemy pools and running
+                # threads can deadlock the child on a lock some other thread held
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context('spawn')
+                )
+            executor = self._executor
+        try:
+            future = executor.submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+        # A timed-out hash keeps its worker busy until it finishes, so the slot is
+        # released when the future completes rather than when the caller gives up
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise HashingBusy("Password hashing timed out. Please retry shortly.") from None
+
+    def _release(self, future=None):
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def hash(self, password):
+        return self._run(generate_password_hash, password, self.method)
+
+    def verify(self, password_hash, password):
+        return self._run(check_password_hash, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True when a stored hash was made with different KDF parameters than configured."""
+        try:
+            return normalize_method(password_hash) != normalize_method(self.method)
+        except ValueError:
+            return True
+
+    def stats(self):
+        with self._lock:
+            return {
+                "method": self.method.split(':', 1)[0],
+                "workers": self.workers,
+                "queue_depth": self.pending,
+                "max_pending": self.max_pending,
+                "completed": self.completed,
+                "rejected": self.rejected
+            }
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+password_hasher = PasswordHasher()
+atexit.register(password_hasher.shutdown)
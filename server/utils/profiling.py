@@ -0,0 +1,194 @@
+# utils/profiling.py
+import cProfile
+import json
+import logging
+import os
+import random
+import threading
+import time
+from datetime import datetime
+from flask import g, has_request_context, request
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from sqlalchemy import event
+from utils.user_cache import get_user_role
+
+PROFILE_HEADER = 'X-Profile'
+PROFILE_FILE_HEADER = 'X-Profile-File'
+MAX_PARAMETER_LENGTH = 200
+MAX_LOGGED_PARAMETER_SETS = 5
+EXPLAINABLE_SQLITE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE')
+EXPLAINABLE = ('SELECT', 'WITH')
+# Stored password hashes must never reach the slow-query log
+_REDACTED_PREFIXES = ('scrypt:', 'pbkdf2:')
+
+slow_query_logger = logging.getLogger('burnout.slow_queries')
+
+
+# ==================== Request Profiling ====================
+def _profile_reason(app):
+    """Why this request should be profiled, or None. Checked before the view runs."""
+    rate = app.config.get('PROFILE_SAMPLE_RATE') or 0
+    if rate and random.random() < rate:
+        return 'sample'
+
+    allowlist = app.config.get('PROFILE_USERS') or ()
+    wants_header = request.headers.get(PROFILE_HEADER, '').lower() in ('1', 'true', 'yes')
+    if not wants_header and not allowlist:
+        return None
+
+    # Only decode the token when a trigger could apply; bad or missing tokens just skip profiling
+    try:
+        verify_jwt_in_request(optional=True)
+    except Exception:
+        return None
+    identity = get_jwt_identity() or {}
+    if identity.get('username') in allowlist:
+        return 'allowlist'
+    if wants_header:
+        role = get_user_role(identity.get('id')) if identity.get('id') else None
+        if role is not None and role.role == 'admin' and role.is_active:
+            return 'header'
+    return None
+
+
+def _profile_path(directory):
+    endpoint = (request.endpoint or 'unmatched').replace('.', '-')
+    stamp = datetime.utcnow().strftime('%Y%m%dT%H%M%S%f')
+    return os.path.join(directory, f"{stamp}-{request.method}-{endpoint}.prof")
+
+
+def init_request_profiling(app):
+    """Wraps selected requests in cProfile and dumps the stats to PROFILE_DIR.
+
+    A request is profiled when it is sampled (PROFILE_SAMPLE_RATE), when its user
+    is in PROFILE_USERS, or when an active admin sends `X-Profile: 1`; the latter
+    gets the file name back in X-Profile-File. Open the files with
+    `python -m pstats <file>` or snakeviz.
+    """
+    if not app.config.get('PROFILE_ENABLED'):
+        return
+    directory = app.config.get('PROFILE_DIR') or os.path.join(app.instance_path, 'profiles')
+    os.makedirs(directory, exist_ok=True)
+
+    @app.before_request
+    def start_profiling():
+        reason = _profile_reason(app)
+        if reason is None:
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:  # Another profiler is already active on this thread
+            return
+        g.profiler = profiler
+        g.profile_reason = reason
+
+    def finish_profile():
+        profiler = g.pop('profiler', None)
+        if profiler is None:
+            return None
+        profiler.disable()
+        path = _profile_path(directory)
+        profiler.dump_stats(path)
+        app.logger.info("Profiled %s %s (%s) -> %s", request.method, request.path, g.profile_reason, path)
+        return path
+
+    @app.after_request
+    def stop_profiling(response):
+        path = finish_profile()
+        if path is not None and g.profile_reason == 'header':
+            response.headers[PROFILE_FILE_HEADER] = os.path.basename(path)
+        return response
+
+    @app.teardown_request
+    def stop_profiling_on_error(error=None):
+        # after_request is skipped when the view raises; a profiler left enabled would
+        # keep every later request on this thread from being profiled
+        finish_profile()
+
+
+# ==================== Slow Query Log ====================
+def _loggable(value):
+    if isinstance(value, str):
+        if value.startswith(_REDACTED_PREFIXES):
+            return '<redacted>'
+        return value if len(value) <= MAX_PARAMETER_LENGTH else value[:MAX_PARAMETER_LENGTH] + '...'
+    if isinstance(value, (int, float, bool)) or value is None:
+        return value
+    return _loggable(str(value))
+
+
+def _loggable_parameters(parameters, executemany):
+    if executemany:
+        return [_loggable_parameters(p, False) for p in list(parameters)[:MAX_LOGGED_PARAMETER_SETS]]
+    if isinstance(parameters, dict):
+        return {key: _loggable(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_loggable(value) for value in parameters]
+    return _loggable(parameters)
+
+
+def _explainable(statement, dialect_name):
+    # Elsewhere a failed EXPLAIN would abort the surrounding transaction, so stick to reads there
+    verbs = EXPLAINABLE_SQLITE if dialect_name == 'sqlite' else EXPLAINABLE
+    words = statement.lstrip().split(None, 1)
+    return bool(words) and words[0].upper() in verbs
+
+
+def explain(cursor, dialect_name, statement, parameters):
+    """Runs EXPLAIN (QUERY PLAN on SQLite) on a fresh DB-API cursor, bypassing engine events."""
+    prefix = 'EXPLAIN QUERY PLAN ' if dialect_name == 'sqlite' else 'EXPLAIN '
+    plan_cursor = cursor.connection.cursor()
+    try:
+        plan_cursor.execute(prefix + statement, parameters)
+        return [' '.join(str(column) for column in row) for row in plan_cursor.fetchall()]
+    finally:
+        plan_cursor.close()
+
+
+def init_slow_query_log(app, engine):
+    """Logs every statement slower than SLOW_QUERY_MS, with parameters and query plan, as JSON lines."""
+    threshold_ms = app.config.get('SLOW_QUERY_MS') or 0
+    if threshold_ms <= 0:
+        return
+    path = app.config.get('SLOW_QUERY_LOG') or os.path.join(app.instance_path, 'slow_queries.log')
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    slow_query_logger.addHandler(handler)
+    slow_query_logger.setLevel(logging.INFO)
+    slow_query_logger.propagate = False
+    local = threading.local()
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        local.started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(local, 'started', None)
+        if started is None:
+            return
+        local.started = None
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms < threshold_ms:
+            return
+
+        plan = None
+        if _explainable(statement, conn.dialect.name):
+            plan_parameters = list(parameters)[0] if executemany and parameters else parameters
+            try:
+                plan = explain(cursor, conn.dialect.name, statement, plan_parameters)
+            except Exception as e:
+                plan = [f"EXPLAIN failed: {e}"]
+
+        slow_query_logger.info(json.dumps({
+            "at": datetime.utcnow().isoformat(),
+            "duration_ms": round(elapsed_ms, 3),
+            "endpoint": request.endpoint if has_request_context() else None,
+            "method": request.method if has_request_context() else None,
+            "statement": statement,
+            "parameters": _loggable_parameters(parameters, executemany),
+            "executemany": executemany,
+            "plan": plan,
+        }))
@@ -0,0 +1,68 @@
+# utils/query_counter.py
+import time
+from functools import wraps
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def count_request_queries(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        g.sql_query_count = g.get('sql_query_count', 0) + 1
+        # Timing is opt-in per request (see utils/metrics.py) to keep the default path cheap
+        if g.get('sql_timing'):
+            conn.info['query_started'] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def time_request_queries(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop('query_started', None)
+    if started is not None and has_request_context():
+        g.sql_query_time = g.get('sql_query_time', 0.0) + time.perf_counter() - started
+
+
+def get_query_count():
+    """Number of SQL statements executed so far in the current request."""
+    return g.get('sql_query_count', 0)
+
+
+def get_query_time():
+    """Seconds spent executing SQL so far in the current request (when g.sql_timing is set)."""
+    return g.get('sql_query_time', 0.0)
+
+
+def query_budget(max_queries):
+    """Declares the most SQL statements a view may execute.
+
+    Going over the budget (usually an N+1 lazy load) is logged, and raises when
+    the app is in TESTING or SQL_QUERY_BUDGET_STRICT mode so regressions fail loudly.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            response = fn(*args, **kwargs)
+            used = get_query_count()
+            if used > max_queries:
+                message = f"{request.endpoint} executed {used} queries (budget {max_queries})"
+                if current_app.config.get('TESTING') or current_app.config.get('SQL_QUERY_BUDGET_STRICT'):
+                    raise AssertionError(message)
+                current_app.logger.warning(message)
+            return response
+        return wrapper
+    return decorator
+
+
+def init_query_counter(app):
+    # `g` lives on the app context, which several requests can share (e.g. a test
+    # client used inside `with app.app_context()`), so each request starts from zero
+    @app.before_request
+    def reset_query_count():
+        g.sql_query_count = 0
+        g.sql_query_time = 0.0
+
+    @app.after_request
+    def add_query_count_header(response):
+        if app.config.get('SQL_QUERY_COUNT_HEADER'):
+            response.headers['X-Query-Count'] = str(get_query_count())
+        return response
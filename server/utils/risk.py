@@ -0,0 +1,164 @@
+# utils/risk.py
+import time
+from collections import namedtuple
+from datetime import datetime
+from sqlalchemy import case, delete, func, insert, select, update
+from sqlalchemy.orm import contains_eager
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.StudentRisk import StudentRisk
+from models.User import User
+from utils.jobs import enqueue, job_handler
+
+# Holt-style smoothing of each student's total_score sequence:
+#   ewma  <- ALPHA * score + (1 - ALPHA) * ewma
+#   slope <- BETA * (new ewma - old ewma) + (1 - BETA) * slope
+# and the ranking key extrapolates the smoothed level HORIZON submissions ahead.
+RISK_ALPHA = 0.3
+RISK_BETA = 0.3
+RISK_HORIZON = 3
+MIN_RISK_OBSERVATIONS = 3
+RISK_CHUNK_SIZE = 1000
+
+RiskState = namedtuple('RiskState', [
+    'observations', 'ewma', 'slope', 'rise_streak', 'projected_score',
+    'last_score', 'last_evaluation_id', 'last_submitted_at'
+])
+
+
+def advance(state, score, evaluation_id=None, submitted_at=None):
+    """One streaming step; `state` is None for a student's first evaluation."""
+    if state is None:
+        return RiskState(1, float(score), 0.0, 0, float(score), score, evaluation_id, submitted_at)
+    ewma = RISK_ALPHA * score + (1 - RISK_ALPHA) * state.ewma
+    # Same algebra as the SQL in record_risk_submission, so replays and live updates agree
+    slope = RISK_BETA * RISK_ALPHA * (score - state.ewma) + (1 - RISK_BETA) * state.slope
+    return RiskState(
+        state.observations + 1,
+        ewma,
+        slope,
+        state.rise_streak + 1 if score > state.last_score else 0,
+        ewma + RISK_HORIZON * slope,
+        score,
+        evaluation_id,
+        submitted_at
+    )
+
+
+def record_risk_submission(evaluation):
+    """Advances the student's risk state by one flushed evaluation, in one UPDATE (no commit).
+
+    Reads no history: the new values are computed from the stored state alone.
+    """
+    score = evaluation.total_score
+    ewma = RISK_ALPHA * score + (1 - RISK_ALPHA) * StudentRisk.ewma
+    slope = RISK_BETA * RISK_ALPHA * (score - StudentRisk.ewma) + (1 - RISK_BETA) * StudentRisk.slope
+    result = db.session.execute(
+        update(StudentRisk)
+        .where(
+            StudentRisk.user_id == evaluation.user_id,
+            # Only in submission order; anything older is folded in by a replay instead
+            StudentRisk.last_submitted_at.is_(None) | (StudentRisk.last_submitted_at <= evaluation.submitted_at)
+        )
+        # Every expression reads pre-update values. SQLite and Postgres evaluate SET that
+        # way; MySQL goes left to right and sees earlier assignments, so each column is
+        # assigned only after every expression that reads it
+        .ordered_values(
+            (StudentRisk.projected_score, ewma + RISK_HORIZON * slope),
+            (StudentRisk.slope, slope),
+            (StudentRisk.ewma, ewma),
+            (StudentRisk.rise_streak, case((StudentRisk.last_score < score, StudentRisk.rise_streak + 1), else_=0)),
+            (StudentRisk.last_score, score),
+            (StudentRisk.observations, StudentRisk.observations + 1),
+            (StudentRisk.last_evaluation_id, evaluation.id),
+            (StudentRisk.last_submitted_at, evaluation.submitted_at),
+            (StudentRisk.updated_at, datetime.utcnow())
+        )
+    )
+    if result.rowcount == 0:
+        # First evaluation, a missing row or an out-of-order one: replay this student's history
+        rebuild_student_risk([evaluation.user_id])
+
+
+def rebuild_student_risk(user_ids):
+    """Replays the given students' evaluations in submission order and rewrites their rows (no commit)."""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return 0
+    states = {}
+    rows = db.session.execute(
+        select(Evaluation.user_id, Evaluation.id, Evaluation.total_score, Evaluation.submitted_at)
+        .where(Evaluation.user_id.in_(user_ids))
+        .order_by(Evaluation.user_id, Evaluation.submitted_at, Evaluation.id)
+    )
+    for user_id, evaluation_id, score, submitted_at in rows:
+        states[user_id] = advance(states.get(user_id), score, evaluation_id, submitted_at)
+
+    db.session.execute(delete(StudentRisk).where(StudentRisk.user_id.in_(user_ids)))
+    if states:
+        now = datetime.utcnow()
+        db.session.execute(insert(StudentRisk), [
+            dict(state._asdict(), user_id=user_id, updated_at=now) for user_id, state in states.items()
+        ])
+    # Rows loaded earlier in this session are now stale
+    db.session.expire_all()
+    return len(states)
+
+
+def schedule_risk_rebuild(user_ids):
+    """Replays the students in the background once the caller's transaction commits."""
+    user_ids = sorted(set(user_ids))
+    if user_ids:
+        enqueue('risk.rebuild', {"user_ids": user_ids})
+
+
+@job_handler('risk.rebuild')
+def rebuild_student_risk_job(payload):
+    rebuild_student_risk(payload["user_ids"])
+
+
+def backfill_student_risk(chunk_size=RISK_CHUNK_SIZE, start_after=0):
+    """Replays every student's history, committing per chunk of students; yields progress.
+
+    Resumable: pass the last reported `last_user_id` as `start_after`.
+    """
+    total = db.session.query(func.count(User.id)).filter(User.id > start_after).scalar()
+    processed = students = 0
+    last_id = start_after
+    started = time.perf_counter()
+    while True:
+        user_ids = db.session.execute(
+            select(User.id).where(User.id > last_id).order_by(User.id).limit(chunk_size)
+        ).scalars().all()
+        if not user_ids:
+            break
+        students += rebuild_student_risk(user_ids)
+        db.session.commit()
+        processed += len(user_ids)
+        last_id = user_ids[-1]
+        elapsed = time.perf_counter() - started
+        yield {
+            "processed": processed,
+            "total": total,
+            "with_history": students,
+            "last_user_id": last_id,
+            "elapsed": elapsed,
+            "users_per_second": processed / elapsed if elapsed else None
+        }
+
+
+def rising_risk_query(min_observations=MIN_RISK_OBSERVATIONS, min_streak=0):
+    """Students whose smoothed score is climbing, for ranking by projected score."""
+    query = (
+        StudentRisk.query
+        .join(User, User.id == StudentRisk.user_id)
+        .filter(
+            User.role == 'student',
+            StudentRisk.slope > 0,
+            StudentRisk.observations >= min_observations
+        )
+        .options(contains_eager(StudentRisk.user))
+    )
+    if min_streak:
+        query = query.filter(StudentRisk.rise_streak >= min_streak)
+    return query
@@ -0,0 +1,142 @@
+# utils/scoring.py
+import time
+import numpy as np
+from sqlalchemy import bindparam, func, select, update
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.ScoringRule import ScoringRule
+from utils.analytics import clear_analytics_cache
+from utils.conditional import touch_evaluations
+from utils.risk import rebuild_student_risk
+from utils.student_stats import refresh_student_stats
+
+RESCORE_CHUNK_SIZE = 2000
+MAX_WEIGHT = 10
+
+_QUESTION_COLUMNS = [getattr(Evaluation, field) for field in Evaluation.QUESTION_FIELDS]
+
+
+def get_active_rule():
+    """The highest-versioned rule, or None when only the built-in rule exists."""
+    return db.session.query(ScoringRule).order_by(ScoringRule.version.desc()).first()
+
+
+def rule_version(rule):
+    return rule.version if rule is not None else Evaluation.DEFAULT_SCORING_VERSION
+
+
+def score_answers(answers, rule=None):
+    """Vectorized calculate_total_score over an (n, 10) answer matrix."""
+    if rule is None:
+        totals = answers.sum(axis=1)
+        return totals, totals >= Evaluation.SUPPORT_THRESHOLD
+    weights = np.asarray(rule.weights, dtype=np.float64)
+    totals = np.rint(answers @ weights).astype(np.int64)
+    return totals, totals >= rule.threshold
+
+
+def validate_rule(data):
+    """Checks a new rule's fields; returns {field: message} like validate_user_data."""
+    errors = {}
+    weights = data.get('weights')
+    if not isinstance(weights, list) or len(weights) != len(Evaluation.QUESTION_FIELDS):
+        errors['weights'] = f"Provide a list of {len(Evaluation.QUESTION_FIELDS)} weights, one per question."
+    elif not all(isinstance(w, (int, float)) and not isinstance(w, bool) and 0 <= w <= MAX_WEIGHT for w in weights):
+        errors['weights'] = f"Each weight must be a number between 0 and {MAX_WEIGHT}."
+
+    threshold = data.get('threshold')
+    if not isinstance(threshold, int) or isinstance(threshold, bool) or threshold < 0:
+        errors['threshold'] = "Threshold must be a non-negative integer."
+    return errors
+
+
+def create_rule(weights, threshold, note=None, created_by_id=None):
+    """Adds the next rule version (the caller commits). Existing rows keep their old scores until rescored."""
+    latest = db.session.query(func.max(ScoringRule.version)).scalar()
+    version = max(latest or 0, Evaluation.DEFAULT_SCORING_VERSION) + 1
+    rule = ScoringRule(
+        version=version,
+        weights=[float(w) if isinstance(w, float) and not w.is_integer() else int(w) for w in weights],
+        threshold=threshold,
+        note=note,
+        created_by_id=created_by_id
+    )
+    db.session.add(rule)
+    return rule
+
+
+def count_stale(version):
+    return (
+        db.session.query(func.count(Evaluation.id))
+        .filter(Evaluation.scoring_version != version)
+        .scalar()
+    )
+
+
+def rescore_evaluations(rule, chunk_size=RESCORE_CHUNK_SIZE, start_after=0):
+    """Rescores every evaluation not yet scored by `rule`, one committed chunk at a time.
+
+    Yields a progress dict after each chunk. Rows are picked by their scoring_version,
+    so an interrupted run simply resumes with the rows it has not reached. Each chunk
+    is read, scored with NumPy, written with one executemany and committed, so the
+    write lock is held only for that chunk's UPDATE.
+    """
+    version = rule_version(rule)
+    total = (
+        db.session.query(func.count(Evaluation.id))
+        .filter(Evaluation.scoring_version != version, Evaluation.id > start_after)
+        .scalar()
+    )
+    table = Evaluation.__table__
+    statement = (
+        update(table)
+        .where(table.c.id == bindparam('b_id'))
+        .values(total_score=bindparam('b_total'), needs_support=bindparam('b_flag'), scoring_version=version)
+    )
+
+    processed = changed = 0
+    last_id = start_after
+    started = time.perf_counter()
+    while True:
+        rows = db.session.execute(
+            select(Evaluation.id, Evaluation.user_id, Evaluation.total_score, Evaluation.needs_support, *_QUESTION_COLUMNS)
+            .where(Evaluation.scoring_version != version, Evaluation.id > last_id)
+            .order_by(Evaluation.id)
+            .limit(chunk_size)
+        ).all()
+        if not rows:
+            break
+
+        answers = np.array([row[4:] for row in rows], dtype=np.int64)
+        totals, needs_support = score_answers(answers, rule)
+        old_totals = np.array([row.total_score for row in rows], dtype=np.int64)
+        old_flags = np.fromiter((bool(row.needs_support) for row in rows), dtype=bool, count=len(rows))
+        moved = (totals != old_totals) | (needs_support != old_flags)
+
+        db.session.execute(statement, [
+            {"b_id": row.id, "b_total": int(totals[i]), "b_flag": bool(needs_support[i])}
+            for i, row in enumerate(rows)
+        ])
+        # Only students whose scores actually moved need their summaries and ETags refreshed
+        affected = {rows[i].user_id for i in np.flatnonzero(moved)}
+        if affected:
+            refresh_student_stats(affected)
+            rebuild_student_risk(affected)
+            touch_evaluations(affected)
+        db.session.commit()
+
+        processed += len(rows)
+        changed += int(moved.sum())
+        last_id = rows[-1].id
+        elapsed = time.perf_counter() - started
+        yield {
+            "processed": processed,
+            "total": total,
+            "changed": changed,
+            "last_id": last_id,
+            "elapsed": elapsed,
+            "rows_per_second": processed / elapsed if elapsed else None
+        }
+
+    if changed:
+        clear_analytics_cache()
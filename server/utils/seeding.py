@@ -0,0 +1,148 @@
+# utils/seeding.py
+from datetime import datetime, timedelta
+import numpy as np
+from sqlalchemy import insert, select
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.User import User
+from utils.conditional import EVALUATIONS_VERSION, USERS_VERSION, bump_versions
+from utils.counters import UNHANDLED_EVALUATIONS, increment_counter
+from utils.risk import rebuild_student_risk
+from utils.scoring import get_active_rule, rule_version, score_answers
+from utils.student_stats import refresh_student_stats
+
+SEED_BATCH_SIZE = 1000
+MEETING_PLACES = ['Wellbeing Centre', 'Student Services', 'Library Room 2', 'Online']
+
+
+def seed_username(prefix, role, number):
+    return f"{prefix}_{role}{number}"
+
+
+def _insert_users(prefix, role, numbers, password_hash, created_at):
+    """Inserts one batch of users and returns their ids in `numbers` order.
+
+    Ids come from the database (never computed here), so Postgres sequences stay
+    in step with the table and later ordinary inserts do not collide.
+    """
+    if not numbers:
+        return []
+    names = [seed_username(prefix, role, number) for number in numbers]
+    rows = [
+        {
+            "username": name,
+            "email": f"{name}@campus.example",
+            "password_hash": password_hash,
+            "role": role,
+            "is_active": True,
+            "created_at": created_at,
+            "updated_at": created_at,
+        }
+        for name in names
+    ]
+    statement = insert(User.__table__)
+    if db.session.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        return db.session.execute(
+            statement.returning(User.id, sort_by_parameter_order=True), rows
+        ).scalars().all()
+
+    # No ordered RETURNING for batches (e.g. MySQL): read the ids back through the unique usernames
+    db.session.execute(statement, rows)
+    ids = dict(db.session.execute(select(User.username, User.id).where(User.username.in_(names))).all())
+    return [ids[name] for name in names]
+
+
+def _generate_evaluations(rng, student_ids, admin_ids, per_student, days, now, rule):
+    """Builds one chunk's evaluation rows with NumPy: per-student baselines and drift, noisy answers."""
+    n_students = len(student_ids)
+    counts = rng.poisson(per_student, n_students)
+    total = int(counts.sum())
+    if total == 0:
+        return [], 0
+
+    owner = np.repeat(np.arange(n_students), counts)
+    # Each student has a typical stress level and a slow drift over the period
+    baseline = rng.normal(2.8, 0.6, n_students)
+    drift = rng.normal(0.0, 0.5, n_students)
+    age_days = rng.uniform(0, days, total)
+    progress = 1 - age_days / days
+    level = baseline[owner] + drift[owner] * progress
+    answers = np.clip(
+        np.rint(level[:, None] + rng.normal(0, 0.7, (total, len(Evaluation.QUESTION_FIELDS)))),
+        Evaluation.ANSWER_MIN, Evaluation.ANSWER_MAX
+    ).astype(np.int64)
+    totals, needs_support = score_answers(answers, rule)
+
+    # Older alerts have mostly been followed up by a counsellor
+    handled = needs_support & (age_days > 7) & (rng.random(total) < 0.7) & bool(admin_ids)
+    handled_delay = rng.uniform(0.5, 5, total)
+    handler = rng.integers(0, max(len(admin_ids), 1), total)
+    version = rule_version(rule)
+
+    rows = []
+    for i in range(total):
+        submitted_at = now - timedelta(days=float(age_days[i]))
+        row = dict(zip(Evaluation.QUESTION_FIELDS, answers[i].tolist()))
+        row.update(
+            user_id=student_ids[owner[i]],
+            submitted_at=submitted_at,
+            total_score=int(totals[i]),
+            needs_support=bool(needs_support[i]),
+            scoring_version=version,
+            handled_by_admin_id=None,
+            handled_at=None,
+            meeting_place=None,
+            meeting_time=None,
+            meeting_day=None,
+            meeting_date=None,
+        )
+        if handled[i]:
+            handled_at = submitted_at + timedelta(days=float(handled_delay[i]))
+            row.update(
+                handled_by_admin_id=admin_ids[handler[i]],
+                handled_at=handled_at,
+                meeting_place=MEETING_PLACES[i % len(MEETING_PLACES)],
+                meeting_time=f"{9 + i % 8}:00",
+                meeting_day=handled_at.strftime('%A'),
+                meeting_date=handled_at.date().isoformat(),
+            )
+        rows.append(row)
+    return rows, int(total - handled.sum())
+
+
+def seed_database(students, admins, evaluations_per_student, days=180, seed=1, password_hash=None,
+                  prefix='seed', batch_size=SEED_BATCH_SIZE):
+    """Bulk-creates synthetic users and evaluations, `batch_size` students per transaction.
+
+    Yields a progress dict after each committed batch. Every seeded user shares
+    `password_hash`, so hashing happens once no matter how many users are created.
+    Summaries, counters and version stamps are kept in step batch by batch.
+    """
+    if db.session.query(User.id).filter(User.username == seed_username(prefix, 'student', 1)).first():
+        raise ValueError(f"Users with prefix '{prefix}' already exist; pick another --prefix.")
+
+    rng = np.random.default_rng(seed)
+    rule = get_active_rule()
+    now = datetime.utcnow()
+
+    admin_ids = _insert_users(prefix, 'admin', range(1, admins + 1), password_hash, now - timedelta(days=days))
+    bump_versions(USERS_VERSION)
+    db.session.commit()
+
+    created_students = created_evaluations = 0
+    for start in range(0, students, batch_size):
+        numbers = range(start + 1, min(start + batch_size, students) + 1)
+        student_ids = _insert_users(prefix, 'student', numbers, password_hash, now - timedelta(days=days))
+
+        rows, unhandled = _generate_evaluations(rng, student_ids, admin_ids, evaluations_per_student, days, now, rule)
+        if rows:
+            db.session.execute(insert(Evaluation.__table__), rows)
+        refresh_student_stats(student_ids)
+        rebuild_student_risk(student_ids)
+        increment_counter(UNHANDLED_EVALUATIONS, unhandled)
+        bump_versions(USERS_VERSION, EVALUATIONS_VERSION)
+        db.session.commit()
+
+        created_students += len(student_ids)
+        created_evaluations += len(rows)
+        yield {"admins": admins, "students": created_students, "evaluations": created_evaluations}
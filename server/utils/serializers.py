@@ -0,0 +1,33 @@
+# utils/serializers.py
+from sqlalchemy.orm import joinedload, selectinload
+from models.Evaluation import Evaluation
+from models.User import User
+
+# Evaluation.to_dict emits id/username/email of the student and of the handling admin.
+# The student is joined into the page query (every row has one); admins are few and
+# shared across many rows, so they come from a single IN (...) query instead.
+EVALUATION_LOAD_OPTIONS = (
+    joinedload(Evaluation.user, innerjoin=True).load_only(User.id, User.username, User.email),
+    selectinload(Evaluation.handled_by_admin).load_only(User.id, User.username, User.email),
+)
+
+
+def with_evaluation_relations(query):
+    """Adds the eager loads Evaluation.to_dict needs, so serializing N rows costs no extra SELECTs."""
+    return query.options(*EVALUATION_LOAD_OPTIONS)
+
+
+def serialize_evaluations(evaluations):
+    return [e.to_dict() for e in evaluations]
+
+
+def with_user_stats(query):
+    """Joins each user's student_stats row so list pages carry the summary with no extra queries."""
+    return query.options(joinedload(User.stats))
+
+
+def serialize_users(users):
+    return [
+        dict(user.to_dict(), stats=user.stats.to_dict() if user.stats else None)
+        for user in users
+    ]
@@ -0,0 +1,174 @@
+# utils/student_stats.py
+from datetime import datetime
+from sqlalchemy import DateTime, case, delete, func, insert, literal, select, update
+from db.Burnout_Tracker import db
+from models.Evaluation import Evaluation
+from models.StudentStats import StudentStats
+from models.User import User
+from utils.jobs import job_handler
+
+# All of these run inside the caller's transaction and never commit, so the summary
+# row changes atomically with the evaluation write that caused it.
+
+
+def record_submission(evaluation):
+    """Folds a newly added (flushed) evaluation into its student's summary row."""
+    is_open_alert = 1 if evaluation.needs_support and not evaluation.handled_by_admin_id else 0
+    is_latest = (
+        StudentStats.latest_submitted_at.is_(None)
+        | (StudentStats.latest_submitted_at <= evaluation.submitted_at)
+    )
+    result = db.session.execute(
+        update(StudentStats)
+        .where(StudentStats.user_id == evaluation.user_id)
+        .values(
+            evaluation_count=StudentStats.evaluation_count + 1,
+            score_sum=StudentStats.score_sum + evaluation.total_score,
+            open_alerts=StudentStats.open_alerts + is_open_alert,
+            latest_evaluation_id=case((is_latest, evaluation.id), else_=StudentStats.latest_evaluation_id),
+            latest_score=case((is_latest, evaluation.total_score), else_=StudentStats.latest_score),
+            latest_submitted_at=case((is_latest, evaluation.submitted_at), else_=StudentStats.latest_submitted_at),
+            updated_at=datetime.utcnow()
+        )
+    )
+    if result.rowcount == 0:
+        # First evaluation for this student (or a missing row): build it from their history
+        refresh_student_stats([evaluation.user_id])
+
+
+def record_handled(evaluation):
+    """Updates the summary after an evaluation is marked handled."""
+    is_open_alert = 1 if evaluation.needs_support else 0
+    db.session.execute(
+        update(StudentStats)
+        .where(StudentStats.user_id == evaluation.user_id)
+        .values(
+            open_alerts=case(
+                (StudentStats.open_alerts > is_open_alert, StudentStats.open_alerts - is_open_alert),
+                else_=0
+            ),
+            last_handled_at=case(
+                (
+                    StudentStats.last_handled_at.is_(None)
+                    | (StudentStats.last_handled_at < evaluation.handled_at),
+                    evaluation.handled_at
+                ),
+                else_=StudentStats.last_handled_at
+            ),
+            updated_at=datetime.utcnow()
+        )
+    )
+
+
+def record_deletion(evaluation):
+    """Updates the summary after an evaluation is deleted (call after the delete is flushed)."""
+    stats = db.session.get(StudentStats, evaluation.user_id)
+    if stats is None:
+        return
+    if stats.evaluation_count <= 1 or stats.latest_evaluation_id == evaluation.id \
+            or (evaluation.handled_at and stats.last_handled_at == evaluation.handled_at):
+        # The removed row defined the latest/handled fields: re-derive from the remaining
+        # history, in this transaction (one indexed aggregate over a single student)
+        refresh_student_stats([evaluation.user_id])
+        return
+
+    stats.evaluation_count -= 1
+    stats.score_sum -= evaluation.total_score
+    if evaluation.needs_support and not evaluation.handled_by_admin_id:
+        stats.open_alerts = max(stats.open_alerts - 1, 0)
+
+
+def _aggregate_statement(user_ids=None):
+    """One row per student with every summary column, computed from evaluations."""
+    latest = (
+        select(
+            Evaluation.user_id,
+            Evaluation.id,
+            Evaluation.total_score,
+            Evaluation.submitted_at,
+            func.row_number().over(
+                partition_by=Evaluation.user_id,
+                order_by=(Evaluation.submitted_at.desc(), Evaluation.id.desc())
+            ).label('recency')
+        )
+    )
+    totals = select(
+        Evaluation.user_id,
+        func.count(Evaluation.id).label('evaluation_count'),
+        func.sum(Evaluation.total_score).label('score_sum'),
+        func.sum(case(
+            (Evaluation.needs_support.is_(True) & Evaluation.handled_by_admin_id.is_(None), 1),
+            else_=0
+        )).label('open_alerts'),
+        func.max(Evaluation.handled_at).label('last_handled_at')
+    ).group_by(Evaluation.user_id)
+
+    if user_ids is not None:
+        latest = latest.where(Evaluation.user_id.in_(user_ids))
+        totals = totals.where(Evaluation.user_id.in_(user_ids))
+
+    latest = latest.subquery()
+    totals = totals.subquery()
+    return (
+        select(
+            totals.c.user_id,
+            totals.c.evaluation_count,
+            totals.c.score_sum,
+            latest.c.id.label('latest_evaluation_id'),
+            latest.c.total_score.label('latest_score'),
+            latest.c.submitted_at.label('latest_submitted_at'),
+            totals.c.open_alerts,
+            totals.c.last_handled_at,
+            literal(datetime.utcnow(), DateTime).label('updated_at')
+        )
+        .join(latest, (latest.c.user_id == totals.c.user_id) & (latest.c.recency == 1))
+    )
+
+
+STATS_COLUMNS = [
+    'user_id', 'evaluation_count', 'score_sum', 'latest_evaluation_id', 'latest_score',
+    'latest_submitted_at', 'open_alerts', 'last_handled_at', 'updated_at'
+]
+
+
+def refresh_student_stats(user_ids):
+    """Recomputes the summary rows of the given students from their evaluations."""
+    user_ids = list(set(user_ids))
+    if not user_ids:
+        return
+    db.session.execute(delete(StudentStats).where(StudentStats.user_id.in_(user_ids)))
+    db.session.execute(
+        insert(StudentStats).from_select(STATS_COLUMNS, _aggregate_statement(user_ids))
+    )
+    # Rows loaded earlier in this session are now stale
+    db.session.expire_all()
+
+
+# Drains 'stats.refresh' jobs that are already queued; new deletions refresh inline
+@job_handler('stats.refresh')
+def refresh_student_stats_job(payload):
+    refresh_student_stats(payload["user_ids"])
+
+
+def rebuild_all_student_stats(chunk_size=1000):
+    """Backfills or repairs every summary row, one transaction per `chunk_size` students.
+
+    Each chunk is deleted and re-inserted in the same transaction, so readers never
+    see the table empty and a concurrent submission cannot collide with the insert.
+    """
+    last_id = 0
+    while True:
+        user_ids = [
+            row.id for row in
+            db.session.query(User.id).filter(User.id > last_id).order_by(User.id).limit(chunk_size)
+        ]
+        if not user_ids:
+            break
+        refresh_student_stats(user_ids)
+        db.session.commit()
+        last_id = user_ids[-1]
+
+    # Rows left behind by users removed without the ON DELETE CASCADE (e.g. SQLite without foreign keys)
+    db.session.execute(delete(StudentStats).where(StudentStats.user_id.not_in(select(User.id))))
+    db.session.commit()
+    return db.session.query(func.count(StudentStats.user_id)).scalar()
@@ -0,0 +1,88 @@
+# utils/user_cache.py
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from db.Burnout_Tracker import db
+from models.User import User
+
+UserRole = namedtuple('UserRole', ['role', 'is_active'])
+
+
+class UserRoleCache:
+    """Bounded LRU of user_id -> (role, is_active) whose entries expire after `ttl` seconds.
+
+    Writes in this process invalidate explicitly; the TTL bounds how long another
+    worker process can serve a stale role or status.
+    """
+
+    def __init__(self, maxsize=4096, ttl=60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def configure(self, maxsize=None, ttl=None):
+        with self._lock:
+            if maxsize is not None:
+                self.maxsize = maxsize
+            if ttl is not None:
+                self.ttl = ttl
+            self._entries.clear()
+
+    def get(self, user_id):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(user_id)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+    def put(self, user_id, value):
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl
+            }
+
+
+user_role_cache = UserRoleCache()
+
+
+def get_user_role(user_id):
+    """Returns (role, is_active) for a user, or None if the user does not exist."""
+    cached = user_role_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    row = db.session.query(User.role, User.is_active).filter_by(id=user_id).first()
+    if row is None:
+        return None
+
+    value = UserRole(row.role.lower(), row.is_active is not False)
+    user_role_cache.put(user_id, value)
+    return value
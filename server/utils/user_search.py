@@ -0,0 +1,163 @@
+# utils/user_search.py
+from sqlalchemy import select, text
+from db.Burnout_Tracker import db
+from models.User import User
+
+DEFAULT_SEARCH_LIMIT = 20
+MAX_SEARCH_LIMIT = 50
+MIN_FUZZY_LENGTH = 3
+MAX_FUZZY_TRIGRAMS = 16
+FUZZY_TABLE = 'users_fts'
+
+# Ranks, best first: exact username/email, username prefix, email prefix, trigram match
+MATCH_NAMES = {0: 'exact', 1: 'username', 2: 'email', 3: 'fuzzy'}
+
+_RESULT_COLUMNS = (User.id, User.username, User.email, User.role, User.is_active)
+
+
+def prefix_bounds(prefix):
+    """[low, high) range holding every string that starts with `prefix`.
+
+    A range on the indexed column is an index seek on every backend, unlike
+    LIKE 'x%', which SQLite only optimizes under case_sensitive_like.
+
+    Only exact under a binary collation. Case- or accent-insensitive collations
+    (MySQL's defaults) and locale collations that skip punctuation (Postgres
+    en_US) order other strings into the range and can leave matches out of it.
+    User.username_lower and User.email_lower are therefore declared with a
+    binary collation on every backend (see models/User.py).
+    """
+    last = ord(prefix[-1])
+    if last >= 0x10FFFF:
+        return prefix, None
+    return prefix, prefix[:-1] + chr(last + 1)
+
+
+def _prefix_matches(column, term, limit, role):
+    low, high = prefix_bounds(term)
+    query = select(*_RESULT_COLUMNS, column.label('key')).where(column >= low)
+    if high is not None:
+        query = query.where(column < high)
+    if role:
+        query = query.where(User.role == role)
+    rows = db.session.execute(query.order_by(column).limit(limit)).all()
+    # Guards against a column whose collation is not binary after all (see prefix_bounds)
+    return [row for row in rows if row.key.startswith(term)]
+
+
+# ==================== Fuzzy (SQLite FTS5 trigram) index ====================
+# External-content table: the index stores only trigrams and points at users.id.
+# Triggers keep it current for ORM and Core writes alike.
+_FUZZY_DDL = [
+    f"CREATE VIRTUAL TABLE {FUZZY_TABLE} USING fts5("
+    f"username_lower, email_lower, content='users', content_rowid='id', tokenize='trigram')",
+    f"CREATE TRIGGER {FUZZY_TABLE}_ai AFTER INSERT ON users BEGIN "
+    f"INSERT INTO {FUZZY_TABLE}(rowid, username_lower, email_lower) "
+    f"VALUES (new.id, new.username_lower, new.email_lower); END",
+    f"CREATE TRIGGER {FUZZY_TABLE}_ad AFTER DELETE ON users BEGIN "
+    f"INSERT INTO {FUZZY_TABLE}({FUZZY_TABLE}, rowid, username_lower, email_lower) "
+    f"VALUES ('delete', old.id, old.username_lower, old.email_lower); END",
+    f"CREATE TRIGGER {FUZZY_TABLE}_au AFTER UPDATE OF username_lower, email_lower ON users BEGIN "
+    f"INSERT INTO {FUZZY_TABLE}({FUZZY_TABLE}, rowid, username_lower, email_lower) "
+    f"VALUES ('delete', old.id, old.username_lower, old.email_lower); "
+    f"INSERT INTO {FUZZY_TABLE}(rowid, username_lower, email_lower) "
+    f"VALUES (new.id, new.username_lower, new.email_lower); END",
+    f"INSERT INTO {FUZZY_TABLE}({FUZZY_TABLE}) VALUES ('rebuild')",
+]
+
+
+def fuzzy_index_supported():
+    return db.engine.dialect.name == 'sqlite'
+
+
+def fuzzy_index_available():
+    if not fuzzy_index_supported():
+        return False
+    return db.session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": FUZZY_TABLE}
+    ).first() is not None
+
+
+def drop_fuzzy_index():
+    for suffix in ('_ai', '_ad', '_au'):
+        db.session.execute(text(f"DROP TRIGGER IF EXISTS {FUZZY_TABLE}{suffix}"))
+    db.session.execute(text(f"DROP TABLE IF EXISTS {FUZZY_TABLE}"))
+    db.session.commit()
+
+
+def build_fuzzy_index():
+    """(Re)creates the trigram index and its triggers from the current users table.
+
+    Needs SQLite 3.34+ for the trigram tokenizer. Raises ValueError elsewhere.
+    """
+    if not fuzzy_index_supported():
+        raise ValueError("The fuzzy user index needs SQLite (FTS5 with the trigram tokenizer).")
+    drop_fuzzy_index()
+    try:
+        for statement in _FUZZY_DDL:
+            db.session.execute(text(statement))
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        raise
+    return db.session.execute(text(f"SELECT count(*) FROM {FUZZY_TABLE}")).scalar()
+
+
+def _substring_query(term):
+    # One phrase: the trigram tokenizer matches it anywhere inside the indexed text
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _trigram_query(term):
+    trigrams = list(dict.fromkeys(term[i:i + 3] for i in range(len(term) - 2)))[:MAX_FUZZY_TRIGRAMS]
+    # Any shared trigram matches; bm25 ranks rows sharing more of them first
+    return ' OR '.join('"' + t.replace('"', '""') + '"' for t in trigrams)
+
+
+def _fuzzy_matches(term, limit, role, seen):
+    """Infix matches first (cheap: every trigram must be present), then typo-tolerant ones."""
+    role_filter = "AND u.role = :role" if role else ""
+    statement = text(
+        f"SELECT u.id, u.username, u.email, u.role, u.is_active "
+        f"FROM {FUZZY_TABLE} JOIN users u ON u.id = {FUZZY_TABLE}.rowid "
+        f"WHERE {FUZZY_TABLE} MATCH :query {role_filter} "
+        f"ORDER BY bm25({FUZZY_TABLE}) LIMIT :limit"
+    )
+    rows = []
+    for query in (_substring_query(term), _trigram_query(term)):
+        for row in db.session.execute(statement, {"query": query, "role": role, "limit": limit + len(seen)}):
+            if row.id not in seen:
+                seen.add(row.id)
+                rows.append(row)
+        if len(rows) >= limit:
+            break
+    return rows[:limit]
+
+
+# ==================== Search ====================
+def search_users(term, limit=DEFAULT_SEARCH_LIMIT, role=None, fuzzy=True):
+    """Case-insensitive prefix search on username and email, ranked and limited.
+
+    When prefix matches do not fill `limit` and the trigram index exists, the
+    rest is filled with fuzzy matches (typos, infixes).
+    """
+    term = term.strip().lower()
+    ranked = {}
+    for rank, column in ((1, User.username_lower), (2, User.email_lower)):
+        for row in _prefix_matches(column, term, limit, role):
+            if row.id not in ranked:
+                ranked[row.id] = (0 if row.key == term else rank, row.key, row)
+
+    results = [
+        dict(id=row.id, username=row.username, email=row.email, role=row.role,
+             is_active=row.is_active, match=MATCH_NAMES[rank])
+        for rank, _, row in sorted(ranked.values(), key=lambda r: (r[0], r[1]))[:limit]
+    ]
+
+    if fuzzy and len(results) < limit and len(term) >= MIN_FUZZY_LENGTH and fuzzy_index_available():
+        results.extend(
+            dict(id=row.id, username=row.username, email=row.email, role=row.role,
+                 is_active=bool(row.is_active), match=MATCH_NAMES[3])
+            for row in _fuzzy_matches(term, limit - len(results), role, set(ranked))
+        )
+    return results